@@ -1,26 +1,33 @@
-import speech_recognition as sr
+from recognizers import create_recognizer
 
-def listen_and_convert():
-    recognizer = sr.Recognizer()
+
+def listen_for_alternatives(recognizer=None, max_alternatives=5):
+    """Record one phrase from the microphone and return its ranked Alternatives."""
+    # Imported on first use so importing this module stays cheap
+    import speech_recognition as sr
+
+    recognizer = recognizer or create_recognizer()
     with sr.Microphone() as source:
         print("🎤 Speak a word...")
-        audio = recognizer.listen(source)
+        audio = sr.Recognizer().listen(source)
+
+    try:
+        alternatives = recognizer.recognize(audio, max_alternatives=max_alternatives)
+        print(f"🗣 You said: {alternatives[0].text}")
+        return alternatives
+    except sr.UnknownValueError:
+        print("❌ Could not understand the audio.")
+    except sr.RequestError:
+        print("❌ Error connecting to the recognition service.")
+    return []
+
 
-        try:
-            word = recognizer.recognize_google(audio)
-            print(f"🗣 You said: {word}")
-            return word.lower()
-        except sr.UnknownValueError:
-            print("❌ Could not understand the audio.")
-        except sr.RequestError:
-            print("❌ Error connecting to the recognition service.")
-        return None
+def listen_and_convert(recognizer=None):
+    alternatives = listen_for_alternatives(recognizer, max_alternatives=1)
+    return alternatives[0].text if alternatives else None
 
 # Test
 if __name__ == "__main__":
     spoken_word = listen_and_convert()
     if spoken_word:
         print("📝 Searching thesaurus for:", spoken_word)
-
-
-
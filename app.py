@@ -1,13 +1,22 @@
 import streamlit as st
-from nltk.corpus import wordnet as wn
-from fuzzywuzzy import process
-import nltk
-import json
-import speech_recognition as sr
-import threading
-import queue
-import time
+import os
 import ssl
+from html import escape
+
+from fuzzy_index import FuzzyIndex
+from instrumentation import count, finish_trace, prometheus_text, span, start_trace, tracing_enabled
+from phonetics import PhoneticIndex
+from reverse_index import open_reverse_index
+from vocabulary_snapper import VocabularySnapper
+from word_card import card_word_lists, render_word_card, word_card_cache, word_list
+from word_graph import ANTONYM, build_word_graph, open_graph_snapshot
+from voice_input import VoiceInput
+from word_index import (build_letter_buckets, build_prefix_index, build_word_index, database_version, headwords,
+                        normalize_key)
+from word_search import (companion_path, find_exact_word, find_similar_words, find_sound_alikes,
+                         get_closest_word_suggestion, get_letter_page, read_word_database, resolve_database_path,
+                         reverse_lookup, search_words_starting_with, suggestion_cache)
+from wordnet_snapshot import SNAPSHOT_PATH
 
 try:
     _create_unverified_https_context = ssl._create_unverified_context
@@ -24,63 +33,11 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Opt-in per-rerun timing: THESAURUS_TRACE=1 for every session, ?debug=1 for one
+if st.query_params.get("debug") == "1":
+    st.session_state.debug = True
+start_trace(tracing_enabled() or st.session_state.get("debug", False))
 
-# Download required NLTK data with better error handling
-@st.cache_resource
-def download_nltk_data():
-    """Download NLTK data with proper error handling for deployment"""
-    try:
-        # Check if wordnet is already available
-        nltk.data.find('corpora/wordnet')
-        print("WordNet already available")
-    except LookupError:
-        try:
-            print("Downloading WordNet...")
-            nltk.download('wordnet', quiet=True)
-            print("WordNet downloaded successfully")
-        except Exception as e:
-            print(f"Failed to download WordNet: {e}")
-            st.error("Failed to download WordNet data. Some features may not work.")
-
-    try:
-        # Check if omw-1.4 is already available
-        nltk.data.find('corpora/omw-1.4')
-        print("OMW-1.4 already available")
-    except LookupError:
-        try:
-            print("Downloading OMW-1.4...")
-            nltk.download('omw-1.4', quiet=True)
-            print("OMW-1.4 downloaded successfully")
-        except Exception as e:
-            print(f"Failed to download OMW-1.4: {e}")
-            st.warning("Failed to download multilingual wordnet data.")
-
-
-# Initialize NLTK data
-download_nltk_data()
-
-# Now try to import wordnet
-try:
-    from nltk.corpus import wordnet as wn
-
-    NLTK_AVAILABLE = True
-except ImportError as e:
-    st.error(f"Failed to import NLTK wordnet: {e}")
-    NLTK_AVAILABLE = False
-    wn = None
-
-# Page configuration - MUST be first Streamlet command
-
-# Download required NLTK data
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
-
-try:
-    nltk.data.find('corpora/omw-1.4')
-except LookupError:
-    nltk.download('omw-1.4')
 
 # Custom CSS for Merriam-Webster style with background image
 # Updated CSS with attractive black, white, blue color scheme
@@ -392,18 +349,6 @@ st.markdown("""
         box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
     }
 
-    .antonym-tag {
-        background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
-        color: #991b1b;
-        border-color: #ef4444;
-    }
-
-    .antonym-tag:hover {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-        color: #ffffff;
-        box-shadow: 0 4px 12px rgba(239, 68, 68, 0.4);
-    }
-
     /* Error and info styling */
     .error-message {
         background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
@@ -582,15 +527,14 @@ st.markdown("""
 
 
 # Load word database with error handling
-@st.cache_data
-def load_word_database():
-    """Load the generated word database from JSON file"""
+# Every cached loader takes the database version so a regenerated file is picked up
+@st.cache_resource
+def load_word_database(database_path, db_version):
+    """Load the generated word database from a JSON file or binary word store"""
     try:
-        with open("meaningful_words_3k.json", "r", encoding='utf-8') as f:
-            word_data = json.load(f)
-            return word_data
+        return read_word_database(database_path)
     except FileNotFoundError:
-        st.error("⚠️ Word database 'meaningful_words_3k.json' not found. Please run 'generate_word.py' first.")
+        st.error(f"⚠️ Word database '{database_path}' not found. Please run 'generate_word.py' first.")
         # Fallback to sample data
         return [
             {
@@ -602,168 +546,204 @@ def load_word_database():
                 "examples": ["The results were an aberration."]
             }
         ]
-    except json.JSONDecodeError:
+    except ValueError:
+        # Malformed JSON array or NDJSON record
         st.error("❌ Invalid JSON in word database file.")
         return []
 
 
-def find_exact_word(input_word, word_database):
-    """Find exact matching word from the word database."""
-    if not input_word or not word_database:
-        return None
-
-    input_word_clean = input_word.lower().strip()
-
-    for word_data in word_database:
-        if word_data['word'].lower() == input_word_clean:
-            return word_data
-    return None
-
-
-def get_closest_word_suggestion(input_word, word_database, threshold=70):
-    """Find the closest matching word for suggestion purposes only."""
-    if not input_word or not word_database:
-        return None
-
-    word_list = [item['word'] for item in word_database]
-    match, score = process.extractOne(input_word.lower().strip(), word_list)
-
-    if score >= threshold:
-        # Return the full word data
-        for word_data in word_database:
-            if word_data['word'] == match:
-                return word_data, score
-    return None, 0
-
+@st.cache_resource
+def load_word_index(database_path, db_version):
+    """Build the case-folded headword index once per database version."""
+    return build_word_index(load_word_database(database_path, db_version))
 
-def search_words_starting_with(prefix, word_database):
-    """Search for words that START with the given prefix"""
-    if not prefix or not word_database:
-        return []
 
-    prefix_lower = prefix.lower().strip()
-    matching_words = []
+@st.cache_resource
+def load_prefix_index(database_path, db_version):
+    """Build the sorted headword array used for prefix search once per database version."""
+    return build_prefix_index(load_word_database(database_path, db_version))
 
-    for word_data in word_database:
-        if word_data['word'].lower().startswith(prefix_lower):
-            matching_words.append(word_data)
 
-    return sorted(matching_words, key=lambda x: x['word'])
+@st.cache_resource
+def load_letter_buckets(database_path, db_version):
+    """Build the read-only letter -> sorted range mapping once per database version."""
+    return build_letter_buckets(load_prefix_index(database_path, db_version))
 
 
-def group_words_by_letter(word_database):
-    """Group words by their starting letter"""
-    groups = {}
-    for word_data in word_database:
-        first_letter = word_data['word'][0].upper()
-        if first_letter not in groups:
-            groups[first_letter] = []
-        groups[first_letter].append(word_data)
+@st.cache_resource
+def load_voice_input():
+    """The voice worker and its executor, created once and shared by every session.
 
-    # Sort each group
-    for letter in groups:
-        groups[letter].sort(key=lambda x: x['word'])
+    Each session keeps its own pending capture in st.session_state.voice_future.
+    """
+    return VoiceInput()
 
-    return groups
 
+@st.cache_resource
+def load_fuzzy_index(database_path, db_version):
+    """Build the deletion index behind "did you mean" suggestions once per database version."""
+    return FuzzyIndex(load_word_database(database_path, db_version))
 
-def get_phonetic(word):
-    """Get phonetic pronunciation (simplified)."""
-    return f"/{word}/"
 
+@st.cache_resource
+def load_vocabulary_snapper(database_path, db_version):
+    """Phonetic and edit-distance index that maps voice transcripts onto database words."""
+    return VocabularySnapper(load_word_database(database_path, db_version),
+                             load_fuzzy_index(database_path, db_version),
+                             load_phonetic_index(database_path, db_version))
 
-def display_word_info(word_data):
-    """Display comprehensive word information using the database."""
-    word = word_data['word']
 
-    # Display matched word
-    col1, col2, col3 = st.columns([1, 3, 1])
-    with col2:
-        phonetic = get_phonetic(word)
-        st.markdown(f"""
-        <div class="word-display">
-            <h2 class="matched-word">
-                {word}
-                <span class="phonetic">{phonetic}</span>
-                <span class="pos-tag">{word_data['part_of_speech']}</span>
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
+@st.cache_resource
+def load_reverse_index(database_path, db_version):
+    """Open the prebuilt definition index, or build one in memory if it is missing or stale."""
+    return open_reverse_index(companion_path(database_path, ".rdx"), database_path,
+                              load_word_database(database_path, db_version))
 
-        # Definition section
-        if word_data.get('definition'):
-            st.markdown("""
-            <div class="definition-section">
-                <h3 class="section-title">📚 Definition</h3>
-            """, unsafe_allow_html=True)
 
-            st.markdown(f"""
-            <div class="definition-item">
-                <span class="definition-number">1</span>
-                {word_data['definition']}
-            </div>
-            """, unsafe_allow_html=True)
+@st.cache_resource
+def load_word_graph(database_path, db_version, snapshot_version):
+    """Synonym/antonym graph over the database, widened with the WordNet snapshot when exported.
 
-            st.markdown("</div>", unsafe_allow_html=True)
+    Keyed on the snapshot's version too, so a re-export rebuilds the graph.
+    """
+    return build_word_graph(load_word_database(database_path, db_version), open_graph_snapshot())
 
-        # Examples section
-        if word_data.get('examples'):
-            st.markdown("""
-            <div class="definition-section">
-                <h3 class="section-title">💡 Examples</h3>
-            """, unsafe_allow_html=True)
 
-            for i, example in enumerate(word_data['examples'], 1):
-                st.markdown(f"""
-                <div class="definition-item">
-                    <span class="definition-number">{i}</span>
-                    <em>"{example}"</em>
-                </div>
-                """, unsafe_allow_html=True)
+@st.cache_resource
+def load_embedding_index(database_path, db_version, matrix_version):
+    """Memory-map the prebuilt embedding matrix; None until generate_word.py has written a current one.
+
+    Computing the matrix needs a large co-occurrence matrix and seconds of
+    CPU, too much for a page rerun, so similar words stay hidden until then.
+    Keyed on the matrix file's version too, so a rebuilt matrix is picked up.
+    """
+    matrix_path = companion_path(database_path, ".npy")
+    if not os.path.exists(matrix_path):
+        return None
 
-            st.markdown("</div>", unsafe_allow_html=True)
+    # numpy is only imported here, so starting the app does not pay for it
+    from embeddings import open_prebuilt_embedding_index
 
-        # Synonyms section
-        if word_data.get('synonyms'):
-            st.markdown("""
-            <div class="definition-section">
-                <h3 class="section-title">🔄 Synonyms</h3>
-                <div class="word-list">
-            """, unsafe_allow_html=True)
+    return open_prebuilt_embedding_index(matrix_path, database_path, load_word_database(database_path, db_version))
 
-            for synonym in word_data['synonyms']:
-                st.markdown(f"""
-                <span class="word-tag">{synonym}</span>
-                """, unsafe_allow_html=True)
 
-            st.markdown("</div></div>", unsafe_allow_html=True)
+@st.cache_resource
+def load_phonetic_index(database_path, db_version):
+    """Metaphone/Soundex buckets for "sounds like" lookups, built once per database version."""
+    return PhoneticIndex(load_word_database(database_path, db_version))
+
+
+def card_html(markup):
+    """Send one raw HTML element of the word card; counted for the debug panel."""
+    count("word_card.elements")
+    count("word_card.bytes", len(markup.encode('utf-8')))
+    st.markdown(markup, unsafe_allow_html=True)
+
+
+def render_debug_panel(trace):
+    """Sidebar breakdown of one traced rerun, with JSON and Prometheus exports."""
+    with st.sidebar.expander("🐞 Rerun Breakdown", expanded=True):
+        total = trace.duration or 0.0
+        st.markdown(f"**Rerun total: {total * 1000:.1f} ms**")
+
+        rows = ["| Stage | ms | Share |", "|---|---:|---:|"]
+        for recorded in trace.ordered_spans():
+            indent = "&nbsp;&nbsp;&nbsp;&nbsp;" * recorded.depth
+            share = recorded.duration / total if total else 0.0
+            rows.append(f"| {indent}{recorded.name} | {recorded.duration * 1000:.2f} | {share:.0%} |")
+        untraced = trace.untraced()
+        rows.append(f"| *untraced* | {untraced * 1000:.2f} | {untraced / total if total else 0.0:.0%} |")
+        st.markdown("\n".join(rows))
+
+        if trace.counters:
+            st.markdown("**Counters:**\n" + "\n".join(
+                f"- {name}: {value}" for name, value in sorted(trace.counters.items())
+            ))
+
+        st.download_button("⬇️ Trace (JSON)", trace.to_json(indent=2), file_name="trace.json",
+                           mime="application/json", key="trace_json")
+        st.download_button("⬇️ Metrics (Prometheus)", prometheus_text(trace), file_name="metrics.prom",
+                           mime="text/plain", key="trace_prometheus")
+
+
+def open_linked_word(key):
+    """Open the word picked in a card's word list in this session, and put it in the URL to share."""
+    word = st.session_state[key]
+    # Clear the pick so the same list can open the same word again later
+    st.session_state[key] = None
+    if word:
+        st.query_params["word"] = word
+        st.session_state.linked_word = word
+        st.session_state.user_input = word
+        st.session_state.selected_word = word
+        # The search box keeps what was typed into it; reset it so it starts from user_input again
+        st.session_state.pop("main_search", None)
+
+
+def word_pills(listed, key):
+    """Show one WordList as a single row of pills; picking one opens that word."""
+    st.pills(listed.title, listed.words, selection_mode="single", key=key,
+             format_func=lambda word: f"⚔️ {word}" if word in listed.antonyms else word,
+             on_change=open_linked_word, args=(key,))
+
+
+def build_word_card(word_data):
+    """Look up the card's related, similar and sound-alike words and render it as (html, word lists)."""
+    word = word_data['word']
 
-        # Antonyms section
-        if word_data.get('antonyms'):
-            st.markdown("""
-            <div class="definition-section">
-                <h3 class="section-title">⚔️ Antonyms</h3>
-                <div class="word-list">
-            """, unsafe_allow_html=True)
+    # Words two hops away in the synonym/antonym graph
+    shown = {normalize_key(shown_word)
+             for field in ('synonyms', 'antonyms') for shown_word in word_data.get(field, ())}
+    with span("related_words"):
+        word_graph = load_word_graph(database_path, db_version, snapshot_version)
+        related_words = [
+            (related.word, related.kind == ANTONYM)
+            for related in word_graph.related(word, max_depth=2, limit=40, headwords_only=True)
+            if normalize_key(related.word) not in shown
+        ][:12]
+
+    # Nearest neighbours in the embedding space
+    with span("similar_words"):
+        embedding_index = load_embedding_index(database_path, db_version, matrix_version)
+        similar_words = []
+        if embedding_index is not None:
+            similar_words = [similar_data['word'] for similar_data, score in find_similar_words(
+                word, word_database, word_index, embedding_index)]
+
+    # Sound-alike words from the phonetic index
+    with span("sound_alikes"):
+        sound_alikes = [sound_alike['word'] for sound_alike in
+                        find_sound_alikes(word, word_database, load_phonetic_index(database_path, db_version))]
+
+    with span("render_card"):
+        return render_word_card(word_data), card_word_lists(word_data, related_words, similar_words, sound_alikes)
 
-            for antonym in word_data['antonyms']:
-                st.markdown(f"""
-                <span class="word-tag antonym-tag">{antonym}</span>
-                """, unsafe_allow_html=True)
 
-            st.markdown("</div></div>", unsafe_allow_html=True)
+def display_word_info(word_data):
+    """Display comprehensive word information: one cached HTML element plus a row of pills per word list."""
+    # The card also shows graph and embedding neighbours, so it changes with their files as well
+    card, word_lists = word_card_cache.get_or_compute(normalize_key(word_data['word']), card_version,
+                                                      lambda: build_word_card(word_data))
 
-        # If no synonyms or antonyms found
-        if not word_data.get('synonyms') and not word_data.get('antonyms'):
-            st.markdown("""
-            <div class="info-message">
-                🔍 No synonyms or antonyms found for this word.
-            </div>
-            """, unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col2:
+        card_html(card)
+        for position, listed in enumerate(word_lists):
+            word_pills(listed, key=f"card_words_{position}")
 
 
 # Load the word database
-word_database = load_word_database()
+with span("load_database"):
+    database_path = resolve_database_path()
+    db_version = database_version(database_path)
+    word_database = load_word_database(database_path, db_version)
+    word_index = load_word_index(database_path, db_version)
+    prefix_index = load_prefix_index(database_path, db_version)
+    # Files the word card also draws on; "missing" until they are generated
+    snapshot_version = database_version(SNAPSHOT_PATH)
+    matrix_version = database_version(companion_path(database_path, ".npy"))
+    card_version = (db_version, snapshot_version, matrix_version)
+    letter_buckets = load_letter_buckets(database_path, db_version)
 
 # Initialize session state
 if "user_input" not in st.session_state:
@@ -772,6 +752,17 @@ if "listening" not in st.session_state:
     st.session_state.listening = False
 if "selected_word" not in st.session_state:
     st.session_state.selected_word = ""
+if "voice_future" not in st.session_state:
+    st.session_state.voice_future = None
+if "voice_message" not in st.session_state:
+    st.session_state.voice_message = None
+
+# Shared links open the app with ?word=...; apply each link once
+linked_word = st.query_params.get("word")
+if linked_word and linked_word != st.session_state.get("linked_word"):
+    st.session_state.linked_word = linked_word
+    st.session_state.user_input = linked_word
+    st.session_state.selected_word = linked_word
 
 # Header
 st.markdown("""
@@ -782,43 +773,50 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Sidebar for speech input and word dropdown
-with st.sidebar:
+with st.sidebar, span("sidebar"):
     st.markdown("### 🎙️ Voice Input")
 
 
-    def speech_to_text_simple():
-        """Simplified speech recognition."""
-        try:
-            r = sr.Recognizer()
-            with sr.Microphone() as source:
-                st.info("🎤 Listening... Please speak clearly.")
-                r.adjust_for_ambient_noise(source, duration=0.5)
-                audio = r.listen(source, timeout=5, phrase_time_limit=5)
-
-            text = r.recognize_google(audio)
-            return text.lower().strip()
-        except sr.WaitTimeoutError:
-            st.error("⏰ Listening timeout. Please try again.")
-            return None
-        except sr.UnknownValueError:
-            st.error("❌ Could not understand the audio. Please try again.")
-            return None
-        except sr.RequestError as e:
-            st.error(f"❌ Speech recognition error: {str(e)}")
-            return None
-        except Exception as e:
-            st.error(f"❌ Microphone error: {str(e)}")
-            return None
-
-
-    if st.button("🎤 Start Voice Input", key="voice_btn"):
-        with st.spinner("🎧 Initializing microphone..."):
-            recognized_text = speech_to_text_simple()
-            if recognized_text:
-                st.session_state.user_input = recognized_text
-                st.session_state.selected_word = recognized_text
-                st.success(f"✅ Recognized: **{recognized_text}**")
-                st.rerun()
+    @st.fragment(run_every=0.5)
+    def voice_input_status():
+        """Poll the background capture without blocking the rest of the page."""
+        future = st.session_state.voice_future
+        if not future.done():
+            st.info("🎤 Listening... Please speak clearly.")
+            return
+
+        result = future.result()
+        st.session_state.voice_future = None
+        if result.text:
+            # Prefer the database word that best matches any of the n-best transcripts
+            snaps = load_vocabulary_snapper(database_path, db_version).snap(
+                result.alternatives, limit=1, threshold=70
+            )
+            word = word_database[snaps[0].position]['word'] if snaps else result.text
+            st.session_state.user_input = word
+            st.session_state.selected_word = word
+            st.session_state.voice_message = ("success", f"✅ Recognized: **{word}**")
+        else:
+            st.session_state.voice_message = ("error", result.error)
+        st.rerun()
+
+
+    # The worker is shared by every session; the future is this session's own capture
+    if st.button("🎤 Start Voice Input", key="voice_btn", disabled=st.session_state.voice_future is not None):
+        # The offline recognizer only listens for words of the current database
+        voice_input = load_voice_input()
+        voice_input.set_vocabulary(headwords(word_database), version=db_version)
+        st.session_state.voice_future = voice_input.submit()
+
+    if st.session_state.voice_future is not None:
+        voice_input_status()
+    elif st.session_state.voice_message:
+        kind, message = st.session_state.voice_message
+        st.session_state.voice_message = None
+        if kind == "success":
+            st.success(message)
+        else:
+            st.error(message)
 
     # Word search and dropdown
     st.markdown("### 🔍 Word Search")
@@ -827,59 +825,98 @@ with st.sidebar:
     search_prefix = st.text_input("Search words starting with:", placeholder="Type letters...", key="word_search")
 
     if search_prefix:
-        matching_words = search_words_starting_with(search_prefix, word_database)
+        # Display matching words (limit to 15 for performance)
+        with span("prefix_search"):
+            matching_words, total_matches = search_words_starting_with(
+                search_prefix, word_database, prefix_index, limit=15
+            )
 
         if matching_words:
-            st.markdown(f"**Found {len(matching_words)} words starting with '{search_prefix}':**")
+            st.markdown(f"**Found {total_matches} words starting with '{search_prefix}':**")
 
-            # Display matching words (limit to 15 for performance)
-            for word_data in matching_words[:15]:
+            for word_data in matching_words:
                 if st.button(word_data['word'], key=f"search_btn_{word_data['word']}",
                              help=f"Click to explore '{word_data['word']}'"):
                     st.session_state.selected_word = word_data['word']
                     st.session_state.user_input = word_data['word']
                     st.rerun()
 
-            if len(matching_words) > 15:
-                st.markdown(f"<small>... and {len(matching_words) - 15} more words</small>", unsafe_allow_html=True)
+            if total_matches > len(matching_words):
+                st.markdown(f"<small>... and {total_matches - len(matching_words)} more words</small>",
+                            unsafe_allow_html=True)
         else:
             st.markdown(f"❌ No words found starting with '{search_prefix}'")
 
+    # Reverse dictionary: find a word from its meaning
+    st.markdown("### 💭 Find by Meaning")
+
+    meaning_query = st.text_input("Describe the word:", placeholder="e.g. deviating from the norm",
+                                  key="meaning_search")
+
+    if meaning_query:
+        with span("reverse_lookup"):
+            meaning_matches = reverse_lookup(meaning_query, load_reverse_index(database_path, db_version),
+                                             word_database, word_index, limit=10)
+
+        if meaning_matches:
+            st.markdown(f"**Best matches for '{meaning_query}':**")
+
+            for word_data, score in meaning_matches:
+                if st.button(word_data['word'], key=f"meaning_btn_{word_data['word']}",
+                             help=word_data['definition']):
+                    st.session_state.selected_word = word_data['word']
+                    st.session_state.user_input = word_data['word']
+                    st.rerun()
+        else:
+            st.markdown(f"❌ No definitions match '{meaning_query}'")
+
     # Alphabetical word browser
     st.markdown("### 📖 Browse by Letter")
 
-    # Group words by starting letter
-    word_groups = group_words_by_letter(word_database)
-
-    # Create tabs or sections for each letter
-    available_letters = sorted(word_groups.keys())
+    # Letter ranges are precomputed once per database version
+    available_letters = sorted(letter_buckets.keys())
 
     # Let user select a letter
     selected_letter = st.selectbox("Choose a letter:", options=[""] + available_letters, key="letter_selector")
 
-    if selected_letter and selected_letter in word_groups:
+    if selected_letter and selected_letter in letter_buckets:
         st.markdown(f"""
         <div class="alphabet-header">
             {selected_letter}
         </div>
         """, unsafe_allow_html=True)
 
-        words_in_letter = word_groups[selected_letter]
+        start, end = letter_buckets[selected_letter]
+        letter_count = end - start
+        page_size = 20
+        page_count = (letter_count + page_size - 1) // page_size
 
         st.markdown('<div class="word-dropdown">', unsafe_allow_html=True)
-        st.markdown(f'<div class="dropdown-title">{len(words_in_letter)} words starting with {selected_letter}</div>',
+        st.markdown(f'<div class="dropdown-title">{letter_count} words starting with {selected_letter}</div>',
                     unsafe_allow_html=True)
 
-        # Display words for selected letter (limit to 20 for performance)
-        for word_data in words_in_letter[:20]:
+        # Display one page of words for the selected letter
+        page = 1
+        if page_count > 1:
+            page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1,
+                                   step=1, key=f"letter_page_{selected_letter}")
+
+        with span("letter_page"):
+            letter_words = get_letter_page(selected_letter, word_database, prefix_index, letter_buckets,
+                                           page, page_size)
+
+        for word_data in letter_words:
             if st.button(word_data['word'], key=f"letter_btn_{word_data['word']}",
                          help=f"Click to explore '{word_data['word']}'"):
                 st.session_state.selected_word = word_data['word']
                 st.session_state.user_input = word_data['word']
                 st.rerun()
 
-        if len(words_in_letter) > 20:
-            st.markdown(f"<small>... and {len(words_in_letter) - 20} more words</small>", unsafe_allow_html=True)
+        if page_count > 1:
+            first_shown = (page - 1) * page_size + 1
+            last_shown = min(letter_count, page * page_size)
+            st.markdown(f"<small>Showing {first_shown}-{last_shown} of {letter_count} words</small>",
+                        unsafe_allow_html=True)
 
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -906,29 +943,35 @@ current_word = user_input or st.session_state.selected_word
 
 if current_word:
     # First, try to find exact match
-    exact_word_data = find_exact_word(current_word, word_database)
+    with span("exact_lookup"):
+        exact_word_data = find_exact_word(current_word, word_database, word_index)
+    count("lookups.hits" if exact_word_data else "lookups.misses")
 
     if exact_word_data:
         # Word found in thesaurus - display it
-        display_word_info(exact_word_data)
+        with span("display_word_info"):
+            display_word_info(exact_word_data)
     else:
         # Word not found - show error and suggest closest match
         col1, col2, col3 = st.columns([1, 3, 1])
         with col2:
             st.markdown(f"""
             <div class="error-message">
-                ❌ "<strong>{current_word}</strong>" is not in our thesaurus.
+                ❌ "<strong>{escape(current_word)}</strong>" is not in our thesaurus.
                 <br><small>This word may not be in our database of {len(word_database)} words.</small>
             </div>
             """, unsafe_allow_html=True)
 
             # Get suggestion for closest word
-            suggested_word_data, similarity_score = get_closest_word_suggestion(current_word, word_database)
+            with span("fuzzy_suggestion"):
+                suggested_word_data, similarity_score = get_closest_word_suggestion(
+                    current_word, word_database, load_fuzzy_index(database_path, db_version), db_version=db_version
+                )
 
             if suggested_word_data and similarity_score >= 70:
                 st.markdown(f"""
                 <div class="suggestion-message">
-                    💡 Did you mean "<strong>{suggested_word_data['word']}</strong>"?
+                    💡 Did you mean "<strong>{escape(suggested_word_data['word'])}</strong>"?
                     <br><small>Similarity: {similarity_score}%</small>
                 </div>
                 """, unsafe_allow_html=True)
@@ -939,6 +982,14 @@ if current_word:
                     st.session_state.user_input = suggested_word_data['word']
                     st.rerun()
 
+            # Synonyms that are not headwords still lead to related headwords through the graph
+            with span("related_words"):
+                graph_matches = load_word_graph(database_path, db_version, snapshot_version).nearest_headwords(
+                    current_word, limit=8)
+            if graph_matches:
+                word_pills(word_list("🕸️ Related Words in Our Thesaurus", [related.word for related in graph_matches]),
+                           key="graph_words")
+
 # Footer with instructions
 if not current_word:
     st.markdown("---")
@@ -984,11 +1035,24 @@ if st.sidebar.button("📊 Database Stats"):
     st.sidebar.markdown(f"""
     **📈 Database Statistics:**
     - Total words: {total_words}
-    - Letters covered: {len(word_groups)}
+    - Letters covered: {len(letter_buckets)}
 
     **Parts of Speech:**
     """)
 
-    for pos, count in sorted(pos_counts.items()):
-        percentage = (count / total_words) * 100
-        st.sidebar.markdown(f"- {pos.title()}: {count} ({percentage:.1f}%)")
\ No newline at end of file
+    for pos, pos_count in sorted(pos_counts.items()):
+        percentage = (pos_count / total_words) * 100
+        st.sidebar.markdown(f"- {pos.title()}: {pos_count} ({percentage:.1f}%)")
+
+    cache_stats = suggestion_cache.stats()
+    st.sidebar.markdown(f"""
+    **Suggestion Cache:**
+    - Entries: {cache_stats['size']} / {cache_stats['maxsize']}
+    - Hits: {cache_stats['hits']} ({cache_stats['hit_rate']:.0%}) · Misses: {cache_stats['misses']}
+    - Evictions: {cache_stats['evictions']}
+    """)
+
+# Where this rerun's time went, when tracing is on
+trace = finish_trace()
+if trace is not None:
+    render_debug_panel(trace)
@@ -0,0 +1,54 @@
+import json
+import random
+
+from dataset_io import iter_records, resolve_records_path
+from word_index import normalize_key
+
+SEED_DATABASE_PATH = "meaningful_words_3k.json"
+
+
+def iter_synthetic_corpus(size, seed=0, source_path=SEED_DATABASE_PATH):
+    """Yield `size` database entries in the meaningful_words_3k.json schema, sorted by headword.
+
+    Entries are copies of the real database with unique, shuffled-letter
+    headwords, so strings and list lengths look like the real data. Only the
+    headwords are held in memory, so corpora of millions of words can be
+    streamed straight to a file.
+    """
+    templates = list(iter_records(resolve_records_path(source_path)))
+
+    rng = random.Random(seed)
+    seen = set()
+    words = []
+    while len(words) < size:
+        template_id = len(words) % len(templates)
+        word = templates[template_id]['word']
+        if normalize_key(word) in seen:
+            letters = list(word)
+            rng.shuffle(letters)
+            word = ''.join(letters) + ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(3))
+            if normalize_key(word) in seen:
+                continue
+        seen.add(normalize_key(word))
+        words.append((word, template_id))
+    del seen
+
+    words.sort()
+    for word, template_id in words:
+        entry = dict(templates[template_id])
+        entry['word'] = word
+        yield entry
+
+
+def synthetic_corpus(size, seed=0, source_path=SEED_DATABASE_PATH):
+    """Build `size` database entries in the meaningful_words_3k.json schema.
+
+    Returns a list of plain dicts sorted by headword, like the generated JSON;
+    see iter_synthetic_corpus.
+    """
+    return list(iter_synthetic_corpus(size, seed, source_path))
+
+
+def corpus_json(size, seed=0):
+    """Serialized synthetic corpus, for measuring parse and load paths."""
+    return json.dumps(synthetic_corpus(size, seed), ensure_ascii=False)
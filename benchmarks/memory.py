@@ -0,0 +1,51 @@
+"""Compare the memory held by dict entries and WordEntry objects.
+
+Usage, from the repository root:
+
+    python -m benchmarks.memory [--sizes 3000 30000 300000]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.corpus import corpus_json
+from word_entry import WordEntry
+
+
+def measure(build, text):
+    """Bytes still allocated by the object `build(text)` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(text)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def as_dicts(text):
+    return json.loads(text)
+
+
+def as_word_entries(text):
+    return [WordEntry.from_dict(word_data) for word_data in json.loads(text)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3000, 30000, 300000])
+    args = parser.parse_args(argv)
+
+    print(f"{'words':>8} {'dict MB':>10} {'WordEntry MB':>13} {'saved':>7}")
+    for size in args.sizes:
+        text = corpus_json(size)
+        dict_bytes = measure(as_dicts, text)
+        entry_bytes = measure(as_word_entries, text)
+        saved = 1 - entry_bytes / dict_bytes
+        print(f"{size:>8} {dict_bytes / 2**20:>10.1f} {entry_bytes / 2**20:>13.1f} {saved:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
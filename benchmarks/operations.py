@@ -0,0 +1,341 @@
+"""Measure the operations users wait on across corpus sizes.
+
+For every size a synthetic corpus is streamed to an NDJSON file (and
+converted to a binary word store), then every operation runs in a fresh
+interpreter, so peak RSS is that operation's own: loading the database,
+building the indexes it needs and answering a fixed, seeded set of queries.
+
+Reported per operation and size: latency percentiles, throughput and peak
+RSS, plus how much the measured calls themselves raised the peak. --output
+writes the results as JSON; --baseline compares a fresh run against saved
+results, and --compare compares two saved files without running anything.
+
+Usage, from the repository root:
+
+    python -m benchmarks.operations [--sizes 3000 30000 300000 1000000] [--queries 500]
+                                    [--operations ...] [--output results.json] [--baseline old.json]
+    python -m benchmarks.operations --compare old.json new.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import iter_synthetic_corpus
+from dataset_io import write_ndjson
+from word_store import convert_json_to_store
+
+DEFAULT_SIZES = [3000, 30000, 300000, 1000000]
+# Full database loads are slow at the larger sizes, so they get fewer runs
+LOAD_RUNS = 5
+# Relative change in p50 latency reported as a regression or improvement
+CHANGE_THRESHOLD = 0.10
+
+
+def rss_mb():
+    """Peak resident set size of this process so far, in MB."""
+    # ru_maxrss survives exec on Linux, so a worker would inherit the parent's
+    # peak; the kernel's high-water mark for this address space does not
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def misspell(word, rng):
+    """Replace, drop or insert one letter, the kind of typo "did you mean" exists for."""
+    position = rng.randrange(len(word))
+    edit = rng.randrange(3)
+    if edit == 0:
+        return word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1:]
+    if edit == 1 and len(word) > 2:
+        return word[:position] + word[position + 1:]
+    return word[:position] + rng.choice(string.ascii_lowercase) + word[position:]
+
+
+def sample_words(word_database, count, rng):
+    return [word_database[rng.randrange(len(word_database))]['word'] for _ in range(count)]
+
+
+# Each operation: setup(database_path, queries, rng) -> (call, arguments). The
+# setup is not timed; call(argument) is timed once per argument.
+
+def setup_load_json(database_path, queries, rng):
+    from word_search import read_word_database
+    return read_word_database, [database_path] * LOAD_RUNS
+
+
+def setup_load_store(database_path, queries, rng):
+    from word_search import read_word_database
+    store_path = os.path.splitext(database_path)[0] + ".wdb"
+    return read_word_database, [store_path] * LOAD_RUNS
+
+
+def setup_exact(database_path, queries, rng):
+    from word_index import build_word_index
+    from word_search import find_exact_word, read_word_database
+    word_database = read_word_database(database_path)
+    word_index = build_word_index(word_database)
+    # One query in five misses
+    words = [misspell(word, rng) if rng.random() < 0.2 else word
+             for word in sample_words(word_database, queries, rng)]
+    return lambda word: find_exact_word(word, word_database, word_index), words
+
+
+def setup_prefix(database_path, queries, rng):
+    from word_index import build_prefix_index
+    from word_search import read_word_database, search_words_starting_with
+    word_database = read_word_database(database_path)
+    prefix_index = build_prefix_index(word_database)
+    prefixes = [word[:rng.randint(1, 3)].lower() for word in sample_words(word_database, queries, rng)]
+    # Same limit as the sidebar search
+    return lambda prefix: search_words_starting_with(prefix, word_database, prefix_index, limit=15), prefixes
+
+
+def setup_suggestion(database_path, queries, rng):
+    from fuzzy_index import FuzzyIndex
+    from word_search import get_closest_word_suggestion, read_word_database
+    word_database = read_word_database(database_path)
+    fuzzy_index = FuzzyIndex(word_database)
+    words = [misspell(word, rng) for word in sample_words(word_database, queries, rng)]
+    # No db_version, so the result cache never answers
+    return lambda word: get_closest_word_suggestion(word, word_database, fuzzy_index), words
+
+
+def setup_letter_page(database_path, queries, rng):
+    from word_index import build_letter_buckets, build_prefix_index
+    from word_search import get_letter_page, read_word_database
+    word_database = read_word_database(database_path)
+    prefix_index = build_prefix_index(word_database)
+    letter_buckets = build_letter_buckets(prefix_index)
+    letters = [rng.choice(string.ascii_uppercase) for _ in range(queries)]
+    return lambda letter: get_letter_page(letter, word_database, prefix_index, letter_buckets), letters
+
+
+def setup_thesaurus(database_path, queries, rng):
+    # Runs thesaurus.py's search over the synthetic corpus rather than words.json
+    from thesaurus import search_word
+    from word_index import build_word_index
+    from word_search import read_word_database
+    word_database = read_word_database(database_path)
+    word_index = build_word_index(word_database)
+    words = sample_words(word_database, queries, rng)
+    return lambda word: search_word(word, word_database, word_index), words
+
+
+def setup_lookup(database_path, queries, rng):
+    from fuzzy_index import FuzzyIndex
+    from lookup import get_closest_word
+    from word_index import build_word_index, headwords
+    from word_search import read_word_database
+    word_list = list(headwords(read_word_database(database_path)))
+    fuzzy_index = FuzzyIndex(word_list)
+    word_index = build_word_index(word_list)
+    words = [misspell(word, rng) for word in rng.sample(word_list, min(queries, len(word_list)))]
+    return lambda word: get_closest_word(word, word_list, word_index=word_index, fuzzy_index=fuzzy_index), words
+
+
+OPERATIONS = {
+    'load_word_database': setup_load_json,
+    'load_word_store': setup_load_store,
+    'find_exact_word': setup_exact,
+    'search_words_starting_with': setup_prefix,
+    'get_closest_word_suggestion': setup_suggestion,
+    'get_letter_page': setup_letter_page,
+    'thesaurus.search_word': setup_thesaurus,
+    'lookup.get_closest_word': setup_lookup,
+}
+
+
+def run_operation(name, database_path, queries, seed):
+    """Time one operation in this process and return its raw measurements."""
+    call, arguments = OPERATIONS[name](database_path, queries, random.Random(seed))
+    # One untimed call warms lazily built state such as the lemmatizer
+    call(arguments[0])
+    setup_rss = rss_mb()
+
+    timings = []
+    started = time.perf_counter()
+    for argument in arguments:
+        call_started = time.perf_counter()
+        call(argument)
+        timings.append(time.perf_counter() - call_started)
+    total = time.perf_counter() - started
+    return {'timings': timings, 'total': total, 'setup_rss_mb': setup_rss, 'peak_rss_mb': rss_mb()}
+
+
+def summarize(name, size, measurement):
+    timings = sorted(timing * 1000 for timing in measurement['timings'])
+    if len(timings) > 1:
+        cuts = statistics.quantiles(timings, n=100, method='inclusive')
+        p50, p95, p99 = statistics.median(timings), cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = timings[0]
+    return {
+        'operation': name,
+        'size': size,
+        'calls': len(timings),
+        'p50_ms': round(p50, 4),
+        'p95_ms': round(p95, 4),
+        'p99_ms': round(p99, 4),
+        'mean_ms': round(statistics.fmean(timings), 4),
+        'max_ms': round(timings[-1], 4),
+        'throughput_per_s': round(len(timings) / measurement['total'], 1) if measurement['total'] else None,
+        'peak_rss_mb': round(measurement['peak_rss_mb'], 1),
+        'calls_rss_mb': round(measurement['peak_rss_mb'] - measurement['setup_rss_mb'], 1),
+    }
+
+
+def measure_in_subprocess(name, size, database_path, queries, seed):
+    """Run one operation in a fresh interpreter; a summary dict, or one with an 'error'."""
+    command = [sys.executable, "-m", "benchmarks.operations", "--worker", name,
+               "--database", database_path, "--queries", str(queries), "--seed", str(seed)]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        # Killed or crashed before it could report, e.g. out of memory
+        output = completed.stderr.strip() or f"exit status {completed.returncode}"
+        return {'operation': name, 'size': size, 'error': output.splitlines()[-1]}
+    measurement = json.loads(completed.stdout.strip().splitlines()[-1])
+    if 'error' in measurement:
+        return {'operation': name, 'size': size, 'error': measurement['error']}
+    return summarize(name, size, measurement)
+
+
+def git_commit():
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+    except OSError:
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_suite(sizes, operations, queries, seed):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            database_path = os.path.join(directory, f"corpus-{size}.ndjson")
+            started = time.perf_counter()
+            write_ndjson(database_path, iter_synthetic_corpus(size, seed))
+            if 'load_word_store' in operations:
+                convert_json_to_store(database_path, os.path.splitext(database_path)[0] + ".wdb")
+            print(f"🧪 {size} words: corpus written in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+            for name in operations:
+                result = measure_in_subprocess(name, size, database_path, queries, seed)
+                print_result(result)
+                results.append(result)
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'queries': queries,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def print_header():
+    print(f"{'operation':<28} {'words':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'ops/s':>10} {'peak MB':>8} {'calls MB':>8}")
+
+
+def print_result(result):
+    if 'error' in result:
+        print(f"{result['operation']:<28} {result['size']:>8}  ⚠️ {result['error']}")
+        return
+    print(f"{result['operation']:<28} {result['size']:>8} {result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} "
+          f"{result['p99_ms']:>9.3f} {result['throughput_per_s']:>10.1f} {result['peak_rss_mb']:>8.1f} "
+          f"{result['calls_rss_mb']:>8.1f}")
+
+
+def compare(baseline, current, threshold=CHANGE_THRESHOLD):
+    """Print p50, throughput and peak RSS changes between two result sets; returns the regression count."""
+    before = {(result['operation'], result['size']): result
+              for result in baseline['results'] if 'error' not in result}
+    print(f"Comparing {baseline['meta'].get('commit') or 'baseline'} -> {current['meta'].get('commit') or 'current'}")
+    print(f"{'operation':<28} {'words':>8} {'p50 ms':>21} {'change':>8} {'ops/s change':>13} {'peak MB change':>15}")
+    regressions = 0
+    for result in current['results']:
+        old = before.get((result['operation'], result['size']))
+        if old is None or 'error' in result:
+            continue
+        change = result['p50_ms'] / old['p50_ms'] - 1 if old['p50_ms'] else 0.0
+        throughput_change = (result['throughput_per_s'] / old['throughput_per_s'] - 1
+                             if old['throughput_per_s'] and result['throughput_per_s'] else 0.0)
+        marker = ""
+        if change > threshold:
+            marker = " 🔺"
+            regressions += 1
+        elif change < -threshold:
+            marker = " 🔻"
+        print(f"{result['operation']:<28} {result['size']:>8} {old['p50_ms']:>9.3f} → {result['p50_ms']:<9.3f} "
+              f"{change:>+8.0%} {throughput_change:>+13.0%} "
+              f"{result['peak_rss_mb'] - old['peak_rss_mb']:>+15.1f}{marker}")
+    return regressions
+
+
+def load_results(path):
+    with open(path, "r", encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS))
+    parser.add_argument("--queries", type=int, default=500, help="timed calls per operation (default: 500)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare the run against results saved with --output")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two saved result files and exit")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        try:
+            measurement = run_operation(args.worker, args.database, args.queries, args.seed)
+        except Exception as e:
+            # NLTK errors come wrapped in a banner of asterisks
+            message = next((line.strip() for line in str(e).splitlines() if line.strip().strip('*')), "")
+            measurement = {'error': f"{type(e).__name__}: {message}"}
+        print(json.dumps(measurement))
+        return
+
+    if args.compare:
+        regressions = compare(load_results(args.compare[0]), load_results(args.compare[1]))
+        sys.exit(1 if regressions else 0)
+
+    print_header()
+    results = run_suite(args.sizes, args.operations, args.queries, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+    if args.baseline:
+        print()
+        regressions = compare(load_results(args.baseline), results)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Check offline (Vosk) recognition against recorded WAV fixtures.
+
+Every fixtures/<word>.wav must be recognized as <word> among the top
+alternatives, with decoding constrained to the database vocabulary as the
+app does; fixtures/silence.wav must produce no word at all. Latency is
+reported per file, and the exit status is non-zero on any miss, so the
+script doubles as a check that recognition works without a network.
+
+Record a new fixture (16 kHz mono, needs a microphone) with --record.
+
+Usage, from the repository root:
+
+    python -m benchmarks.recognition [--fixtures fixtures] [--model models/vosk]
+    python -m benchmarks.recognition --record aberrant
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+from recognizers import VOSK_MODEL_PATH, VOSK_SAMPLE_RATE, VoskRecognizer, transcribe_file
+from word_index import headwords
+from word_search import read_word_database, resolve_database_path
+
+FIXTURES_PATH = "fixtures"
+SILENCE = "silence"
+
+
+def record_fixture(word, fixtures_path):
+    """Capture one spoken word from the microphone into fixtures/<word>.wav."""
+    import speech_recognition as sr
+
+    recognizer = sr.Recognizer()
+    with sr.Microphone(sample_rate=VOSK_SAMPLE_RATE) as source:
+        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+        print(f"🎤 Say '{word}'...")
+        audio = recognizer.listen(source, timeout=5, phrase_time_limit=3)
+    path = os.path.join(fixtures_path, f"{word}.wav")
+    with open(path, "wb") as f:
+        f.write(audio.get_wav_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2))
+    print(f"💾 Saved {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=FIXTURES_PATH)
+    parser.add_argument("--model", default=VOSK_MODEL_PATH)
+    parser.add_argument("--alternatives", type=int, default=3)
+    parser.add_argument("--record", metavar="WORD", help="record fixtures/WORD.wav and exit")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_fixture(args.record, args.fixtures)
+        return
+
+    import speech_recognition as sr
+
+    try:
+        recognizer = VoskRecognizer(args.model, list(headwords(read_word_database(resolve_database_path()))))
+    except (ImportError, FileNotFoundError) as error:
+        sys.exit(f"❌ {error}")
+
+    misses = 0
+    for path in sorted(glob.glob(os.path.join(args.fixtures, "*.wav"))):
+        expected = os.path.splitext(os.path.basename(path))[0]
+        started = time.perf_counter()
+        try:
+            heard = [alternative.text for alternative in
+                     transcribe_file(path, recognizer, max_alternatives=args.alternatives)]
+        except sr.UnknownValueError:
+            heard = []
+        elapsed = time.perf_counter() - started
+
+        passed = not heard if expected == SILENCE else expected in heard
+        misses += not passed
+        print(f"{'✅' if passed else '❌'} {expected:<20} {elapsed * 1000:>8.1f} ms   heard: {', '.join(heard) or '-'}")
+
+    sys.exit(1 if misses else 0)
+
+
+if __name__ == "__main__":
+    main()
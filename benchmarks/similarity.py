@@ -0,0 +1,65 @@
+"""Measure embedding build time and top-k cosine search latency.
+
+Single queries go through EmbeddingIndex.similar; batches score many words
+with one matrix product per chunk. The matrix is saved and memory-mapped
+back, as the app loads it.
+
+Usage, from the repository root:
+
+    python -m benchmarks.similarity [--sizes 3000 30000 300000] [--queries 200] [--batch 64]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.corpus import synthetic_corpus
+from embeddings import EmbeddingIndex, compute_embeddings, write_embeddings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3000, 30000, 300000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f"{'words':>8} {'build s':>8} {'matrix MB':>10} {'p50 ms':>8} {'p95 ms':>8} {'batch ms/word':>14}")
+    for size in args.sizes:
+        corpus = synthetic_corpus(size)
+        started = time.perf_counter()
+        matrix = compute_embeddings(corpus)
+        build_seconds = time.perf_counter() - started
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "embeddings.npy")
+            write_embeddings(matrix, path)
+            index = EmbeddingIndex(np.load(path, mmap_mode='r'))
+
+            rng = random.Random(0)
+            rows = [rng.randrange(size) for _ in range(args.queries)]
+            index.similar(rows[0], args.limit)  # fault the mapped pages in once
+            timings = []
+            for row in rows:
+                started = time.perf_counter()
+                index.similar(row, args.limit)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            batch = rows[:args.batch]
+            started = time.perf_counter()
+            index.similar_batch(batch, args.limit)
+            batch_ms = (time.perf_counter() - started) * 1000 / len(batch)
+            del index
+
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{size:>8} {build_seconds:>8.1f} {matrix.nbytes / 2**20:>10.1f} "
+              f"{statistics.median(timings):>8.2f} {p95:>8.2f} {batch_ms:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
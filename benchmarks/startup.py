@@ -0,0 +1,63 @@
+"""Measure cold-start cost: module import time and the app's first render.
+
+Every sample runs in a fresh interpreter so nothing is cached between runs.
+
+Usage, from the repository root:
+
+    python -m benchmarks.startup [--runs 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules other entry points import; app.py itself is measured by rendering it
+IMPORT_TARGETS = ['word_search', 'lookup', 'thesaurus', 'wordnet_snapshot']
+
+IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+"""
+
+RENDER_SNIPPET = """
+import time
+from streamlit.testing.v1 import AppTest
+started = time.perf_counter()
+app = AppTest.from_file("app.py", default_timeout=300).run()
+elapsed = time.perf_counter() - started
+if app.exception:
+    raise SystemExit(app.exception[0].message)
+print(elapsed)
+"""
+
+
+def sample(snippet, runs):
+    """Run `snippet` in `runs` fresh interpreters and return the timings it prints."""
+    timings = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or completed.stdout.strip())
+        timings.append(float(completed.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<28} median {statistics.median(timings) * 1000:>8.1f} ms   "
+          f"min {min(timings) * 1000:>8.1f} ms   max {max(timings) * 1000:>8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for module in IMPORT_TARGETS:
+        report(f"import {module}", sample(IMPORT_SNIPPET.format(module=module), args.runs))
+    report("app.py first render", sample(RENDER_SNIPPET, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure what a word page sends: card elements, wire bytes and rerun time.
+
+Each sample word is opened in a headless app session (Streamlit's AppTest).
+The word card is the last column block of the main area; every element in
+it is encoded as the ForwardMsg delta the server would send over the
+websocket. Rerun time and the display_word_info span (with tracing on) are
+measured for the first view of a word and again for a repeated view.
+
+Usage, from the repository root:
+
+    python -m benchmarks.word_card [--words 20]
+"""
+import argparse
+import os
+import statistics
+import time
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+from instrumentation import TRACE_ENV_VAR, metrics
+from word_search import read_word_database, resolve_database_path
+
+
+def elements(node):
+    """Every leaf element below an AppTest tree node."""
+    if not isinstance(node, Block):
+        yield node
+        return
+    for child in node.children.values():
+        yield from elements(child)
+
+
+def wire_bytes(element):
+    """Size of the ForwardMsg that delivers one element."""
+    message = ForwardMsg()
+    proto = element.proto
+    getattr(message.delta.new_element, element.type).CopyFrom(proto)
+    return message.ByteSize()
+
+
+def card_seconds():
+    """Total time spent in display_word_info so far; the app runs in this process."""
+    return metrics.to_dict()['span_seconds'].get('display_word_info', 0.0)
+
+
+def timed_run(app, run):
+    """Run the app; returns (rerun seconds, display_word_info seconds)."""
+    card_before = card_seconds()
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise SystemExit(app.exception[0].message)
+    return elapsed, card_seconds() - card_before
+
+
+def measure_card(app):
+    card = list(app.main.children.values())[-1]
+    sent = list(elements(card))
+    return len(sent), sum(wire_bytes(element) for element in sent)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    word_database = read_word_database(resolve_database_path())
+    step = max(1, len(word_database) // args.words)
+    words = [word_database[position]['word'] for position in range(0, len(word_database), step)][:args.words]
+
+    os.environ[TRACE_ENV_VAR] = "1"
+    # AppTest resolves relative paths against this file, not the working directory
+    app = AppTest.from_file(os.path.abspath("app.py"), default_timeout=300).run()
+    counts, sizes, first_views, repeat_views = [], [], [], []
+    for word in words:
+        first_views.append(timed_run(app, app.text_input(key="main_search").input(word).run))
+        repeat_views.append(timed_run(app, app.run))
+        element_count, size = measure_card(app)
+        counts.append(element_count)
+        sizes.append(size)
+
+    print(f"{len(words)} words")
+    print(f"card elements      mean {statistics.fmean(counts):>8.1f}   max {max(counts):>6}")
+    print(f"card wire bytes    mean {statistics.fmean(sizes):>8.0f}   max {max(sizes):>6}")
+    for label, views in (("first view", first_views), ("repeat view", repeat_views)):
+        rerun = statistics.median(elapsed for elapsed, _ in views)
+        card = statistics.median(card for _, card in views)
+        print(f"{label:<18} rerun {rerun * 1000:>6.1f} ms   display_word_info {card * 1000:>6.2f} ms (medians)")
+
+
+if __name__ == "__main__":
+    main()
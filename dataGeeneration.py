@@ -1,10 +1,12 @@
-import json
 from nltk.corpus import wordnet
-from nltk import download
 
-# Download WordNet if not already
-download('wordnet')
-download('omw-1.4')
+from dataset_io import CheckpointLog, atomic_write_json, source_fingerprint, write_ndjson
+from nltk_setup import ensure_nltk_data
+
+# Bump whenever get_word_data changes so checkpointed words are re-extracted
+EXTRACTOR_VERSION = 1
+
+CHECKPOINT_PATH = "words.checkpoint.jsonl"
 
 
 def get_word_data(word):
@@ -33,12 +35,32 @@ def get_word_data(word):
 # Example word list (replace with your 3k list)
 word_list = ["aaronite", "abashment", "abeam", "aberration", "aberrometer", "ablastemic", "ableptically", "absolutistic", "absorber", "acacatechol", "acalyculate", "acanthology", "accelerable", "accommodableness", "accoy", "aceanthrenequinone", "acer", "acescent", "acetoxyl", "acetylcyanide", "acoelomata", "acoemeti", "acquisible", "acreman", "acridian", "acrodont", "acrolithic", "actinobacillosis", "actinometrical", "actinon", "actinoneuritis", "activism", "actuaryship", "acylamidobenzene", "adenocystomatous", "adipocellulose", "adjiger", "adonis", "adorable", "adsbud", "adulticidal", "aduncous", "advocateship", "aerobiologist", "aerostatic", "affectible", "affection", "affirmingly", "affreight", "afront", "aftercare", "afterfruits", "aftertrial", "afterwork", "agamogenetic", "aggregate", "agitatrix", "aglethead", "aglyphodonta", "agnomination", "agoing", "agynary", "ahmed", "ailurus", "airan", "aischrolatreia", "alamanni", "alberto", "albinotic", "albutannin", "alcoholytic", "aleurites", "aleurone", "alexius", "algebar", "algorithm", "alienigenate", "alisp", "alister", "allocryptic", "alloerotic", "allopatrically", "allurer", "alquier", "aluminiferous", "aluminographic", "amazilia", "ambidexterity", "ambrosine", "amenably", "amerimnon", "amerindic", "aminothiophen", "ammonoidea", "amoebae", "amoristic", "amphipneusta", "amphithecium", "amusingly", "amygdalectomy", "anacalypsis", "anaglyphoscope", "anahita", "anakes", "anandrarious", "anaplasty", "anapsidan", "anastatic", "anatomization", "anconeus", "andrew", "andromeda", "andromede", "androsterone", "anerethisia", "angiogeny", "angular", "angus", "animastic", "anisoin", "anodically", "anomocarpous", "antennariid", "antephialtic", "anthomedusae", "anthracemia", "anthropopathite", "anthropopathy", "antiantidote", "antibiosis", "anticline", "anticritic", "antifelony", "antihelminthic", "antimoniuret", "antinode", "antiparabema", "antiphase", "antipriestcraft", "antistadholder", "antitartaric", "antitwilight", "aoul", "apii", "apneumona", "apogenous", "apogeotropic", "apoplexy", "apotropaion", "appeaser", "appellation", "appetibleness", "applicatorily", "aquacade", "aquotization", "araliaceae", "araminta", "arbalest", "arboret", "archiblastoma", "archie", "architectural", "archturncoat", "arefaction", "areocentric", "argentose", "argillitic", "arguable", "arhar", "arilloid", "aristotype", "arsacid", "arsenism", "arses", "arterial", "arterioplasty", "arthrobranch", "arthrodira", "ascigerous", "ascogonium", "ashman", "asparagine", "asparaginic", "asphyctic", "assembler", "assister", "astrictiveness", "astromancy", "asyllabia", "asymmetrical", "athanasianism", "athecae", "atheromatous", "atokous", "atomistic", "atone", "atresic", "attachedly", "attemperate", "attribution", "aueto", "auricyanhydric", "autobiographal", "autoconduction", "autocratorical", "autoecious", "autophoby", "autopsy", "autosoteric", "autosporic", "autostarter", "avernus", "aweband", "axometric", "aye", "azulmic", "azymous", "bacchanal", "backhandedness", "backwardly", "baddock", "baga", "baglike", "bainie", "bairnwort", "bajada", "balafo", "balancewise", "balanoglossida", "ballup", "ballweed", "bamoth", "bandstring", "bankera", "bantay", "barylite", "basaltic", "basichromatic", "basilic", "batfowling", "battak", "batter", "becost", "becousined", "bedlamic", "bedpan", "beeswing", "befrogged", "beget", "bejumble", "beknived", "belial", "bella", "belter", "beltir", "benefactress", "benzidino", "benzonaphthol", "beperiwigged", "bepuzzlement", "berberidaceous", "berg", "beringed", "besanctify", "besmile", "besplit", "bespoke", "besputter", "bestiarianism", "bestraught", "beteela", "bethwack", "betrail", "beuniformed", "bhang", "biarcuated", "bibliognost", "bibliophilism", "bibliothetic", "bicyclist", "bidactylous", "bifold", "bigaroon", "bilabial", "bimmeler", "bioclimatology", "biogenetically", "biomagnetism", "biopsy", "biotope", "bipod", "birdling", "birdstone", "biscuitlike", "biscuitmaking", "bishareen", "bithynian", "blanque", "blocky", "blodite", "blowfly", "bluebook", "bluestocking", "bluet", "bluffly", "bluing", "bobbing", "bogey", "bogo", "bohemium", "bolar", "boletaceae", "bolshevistically", "bombsight", "bood", "bookishness", "borasca", "bordage", "bordarius", "bottleflower", "botulin", "bourbonian", "bourtree", "bowwow", "boyishness", "brach", "brack", "braggardism", "brat", "brazilian", "breasthook", "breme", "brigadiership", "brit", "britishness", "brittle", "bromacetate", "bromiodide", "bronchiolitis", "bronteon", "bronzing", "bube", "bucerotidae", "buckshot", "bugleweed", "bullyhuff", "bulter", "bummed", "bumper", "bunolophodont", "burgle", "bursera", "burtonize", "bury", "butterback", "buzz", "byblidaceae", "byzantinesque", "cabureiba", "cacodoxical", "cacomelia", "cacomorphosis", "cacophonic", "cadew", "caftaned", "cageful", "caiquejee", "calamagrostis", "calciphilia", "calices", "calking", "caller", "callirrhoe", "callorhynchidae", "camelman", "cameral", "campanulous", "camponotus", "canaliculated", "canceleer", "candescence", "canna", "cannoneering", "canon", "canonically", "capitatim", "capitoline", "caramelize", "carangoid", "carbo", "carbolxylol", "carcharioid", "cardiopneumograph", "cardioschisis", "cardlike", "caress", "caricography", "carinate", "carpophagous", "cartomancy", "casavi", "caseful", "caseum", "cassino", "cassonade", "catacumbal", "cataleptiform", "catharism", "cathartidae", "catwise", "caudate", "cearin", "celiopyosis", "celtophil", "censureship", "centaurian", "centennial", "centricality", "centripetence", "centrist", "centry", "cephalochordal", "ceramal", "ceraunograph", "cercidiphyllaceae", "cerule", "cervicohumeral", "ceti", "chaenactis", "chaetognath", "chaetognathous", "chait", "chamaelirium", "chantlate", "chapelward", "charlatanish", "chastacosta", "chebule", "checkers", "chekist", "chemicovital", "chenica", "chenopodiaceous", "cherem", "chestily", "chiefess", "chiffonade", "chihfu", "chillo", "chloanthite", "chlorenchyma", "chloridize", "chlorophyllite", "cholecystolithotripsy", "choleraic", "cholerine", "choller", "chondrenchyma", "chondriocont", "chondrodynia", "chondrogen", "chopin", "choragion", "chorepiscopus", "chorioidoiritis", "chouse", "chris", "christlessness", "chrobat", "chromaphil", "chromatize", "chromoptometrical", "chunga", "churnstaff", "chylifaction", "cibolan", "cichorium", "ciconiiformes", "cinchonate", "cinchotine", "cinematographically", "cinnamonroot", "circumambience", "circumcentral", "circumconic", "circumferentially", "circummure", "circumnavigator", "circumspangle", "cirripedia", "cirsotome", "cisalpinism", "cispadane", "civilizatory", "clacker", "clamer", "clavaria", "climatotherapy", "clodder", "clodpate", "clogmaker", "closter", "clumsy", "clutter", "clypeastridea", "coamiable", "coapprehend", "cockateel", "coctile", "codelinquency", "coderive", "coeloblastic", "coelomata", "coffeebush", "cointise", "colecannon", "colitic", "coll", "colleries", "collins", "collyridian", "colombin", "colove", "colubridae", "columbotantalate", "comatous", "comenic", "commiserative", "commodity", "compitalia", "complaintiveness", "complementary", "complimentable", "composite", "compressive", "compulsed", "conceit", "conciliar", "concordant", "condemn", "confessedly", "confirmation", "conflagrator", "congratulable", "connatal", "connotively", "conopid", "conqueress", "contextually", "contise", "contortion", "contradictious", "contradistinctively", "convectively", "convert", "coparceny", "copeman", "coprolith", "copsing", "cordleaf", "cormophyte", "cornmaster", "corradiate", "correctingly", "correlativity", "corruptness", "coruler", "coshering", "costodiaphragmatic", "cotarnine", "cotterway", "cottier", "coturnix", "couma", "counteragent", "counterapproach", "countercourant", "counterinterest", "counternaiant", "counterstatement", "countertype", "countrifiedness", "coviello", "cowherd", "coxcombicality", "crappo", "craticular", "creaseless", "creashaks", "creatinine", "credulous", "creneled", "cribrose", "crimeproof", "cringingness", "critickin", "criticship", "crom", "cromorne", "crotch", "crumpler", "crusher", "crutchlike", "cryptomonad", "cryptozonia", "cuculiformes", "culdee", "culturologist", "cumol", "cupflower", "curable", "curatolatry", "cursal", "cussed", "cusser", "cyanite", "cyanophyceae", "cyathophyllum", "cycloganoidei", "cyclostomatous", "cylindrocephalic", "cynthian", "cytherella", "cytogene", "cytoplast", "dacryocystosyringotomy", "dactylomegaly", "daedalian", "daftlike", "damine", "dancery", "danewort", "darac", "dari", "dashed", "daughterliness", "dazingly", "dealable", "dealcoholization", "debouch", "decemvir", "decillionth", "decipherment", "declinal", "decoctible", "decomposability", "decomposure", "decrepitness", "deem", "defensibleness", "deflection", "degasser", "deltafication", "demioctangular", "demodectic", "demureness", "dentalism", "denumeral", "depositor", "deprecate", "derride", "descender", "describable", "desmology", "despecification", "desperation", "despiteful", "deteriorism", "detorsion", "devastation", "deviant", "devorative", "devotionalism", "dhow", "dialystaminous", "diaphysis", "diarchic", "diarrheic", "diazide", "dichastic", "dichotomously", "dichroiscope", "diductor", "didynamy", "digitalein", "dilatability", "dilettantism", "dimethylamine", "dimethylaniline", "diminish", "dine", "dinheiro", "dipeptide", "diplomyelia", "diploplacula", "disauthorize", "discocarpium", "discoid", "discussible", "disecondary", "disentrammel", "disfigurement", "dishonorary", "dishwashing", "disodic", "disparage", "dispatriated", "dispenser", "displacer", "disquantity", "dissociability", "dissonancy", "dissuited", "dissyllabize", "disulphonate", "dithioglycol", "ditolyl", "divorcee", "documentary", "dodded", "dolent", "domitic", "doorcase", "dope", "dorlot", "dossil", "doubtlessness", "doubtmonger", "downfallen", "downpour", "downwardly", "dragonnade", "drassid", "dravidic", "drawbar", "dreamily", "drinker", "drippy", "dromedary", "dromomania", "dryth", "dulcet", "dulcian", "dullard", "duoliteral", "duskish", "dynamoneure", "dynamotor", "dysgeogenous", "dyskinesia", "dysphoric", "ecdysis", "ectropium", "ecuadorian", "edged", "edictally", "educationist", "effable", "efflux", "eheu", "elaphe", "elatcha", "elchee", "electroballistic", "electrocautery", "elementoid", "eleutheropetalous", "ellagic", "elocutionary", "elucidatory", "elytral", "elytrocele", "elytropolypus", "emajagua", "emboldener", "embrangle", "embryogeny", "emendandum", "emparadise", "employability", "emulation", "enantiotropic", "encrinic", "encrotchet", "endocarp", "endocritic", "endognath", "endostyle", "endothrix", "enfeebler", "enfoil", "engagingly", "engarrison", "engolden", "engore", "engyscope", "enteron", "enticer", "entoplastic", "entoplastral", "entosphenal", "eosphorite", "ephesian", "ephete", "ephorus", "epicyclic", "epigene", "epigoni", "episporangium", "epistroma", "epithelia", "epizeuxis", "epopoeist", "equisonant", "erechtheum", "erethizontidae", "ergatomorph", "ergotoxine", "erogenic", "erumpent", "erwin", "eryngo", "esparsette", "espouser", "essedones", "etcher", "eternalist", "etymologically", "eucharistize", "eucommiaceae", "eudaemonia", "eulogistically", "eupatoriaceous", "eupepsia", "eustachian", "evenlong", "evenly", "exaltedly", "exercitant", "exitus", "exoderm", "exothermal", "exotospore", "expectative", "expectorator", "expediteness", "expertship", "expository", "expounder", "expulse", "exsurge", "extortionary", "extramental", "extrametaphysical", "extraperiosteal", "extraprostatic", "eyalet", "fadridden", "faience", "familist", "famine", "famish", "faradization", "farset", "fasciate", "fasciculus", "favelloid", "faventine", "fawner", "feat", "felineness", "feminie", "ferae", "ferment", "ferroglass", "fictility", "fictioneer", "fide", "fiend", "fierily", "filiciform", "filiformed", "finishable", "firebreak", "fisheress", "fishplate", "fissiparous", "fittingness", "flabellation", "flajolotite", "flamb", "flaunting", "flavedo", "flaxboard", "fleece", "fleech", "fleecily", "flit", "floodwood", "floppers", "floriken", "fluidness", "fluoborite", "focal", "foible", "foistiness", "fondness", "forehatch", "foreknee", "foreleech", "foremark", "forestarling", "forethinker", "formular", "foulsome", "fourpence", "foxery", "frankable", "fretting", "friendlessness", "frosting", "frugivora", "fry", "fulminurate", "fungilliform", "furthersome", "galaxian", "gallflower", "galvanoplastics", "gam", "gamboge", "ganglioblast", "garavance", "garretmaster", "garten", "garth", "gastrocoloptosis", "gastroenterostomy", "gastronomist", "gaulish", "gaullist", "gaviae", "genteelize", "gentlemouthed", "genyophrynidae", "geochemistry", "geometrician", "geoparallelotropic", "germanical", "gestalter", "ghostmonger", "giantry", "gigartinaceae", "girly", "glagolic", "glassily", "gleewoman", "glisten", "gloriosity", "glycerin", "glycidic", "gode", "godpapa", "gongorism", "goniatite", "gonoblastidium", "gonorrheal", "gonzalo", "goop", "goosewing", "gorgonzola", "gosling", "grabbling", "gradient", "grallic", "granddaughter", "grandfilial", "grandiosely", "grandness", "granivorous", "gratiosolin", "graylag", "greenwood", "gringolee", "grivet", "grizzlyman", "groset", "guaneide", "guanyl", "gumly", "gunnery", "gunpaper", "gunrunner", "gut", "gymnospermal", "hackneyman", "haikal", "hairless", "halfheartedly", "halite", "hallopididae", "halvelings", "hamlah", "hamrongite", "handicraftsmanship", "hangnail", "hardim", "harn", "hastish", "hatchgate", "hatchminder", "hauntingly", "haustorium", "headachy", "headforemost", "headily", "healthcraft", "heatmaking", "hebraic", "hederiferous", "hedysarum", "helicogyrate", "heliodon", "helios", "heliotaxis", "heliotropy", "hellicat", "heloderm", "hematoid", "hematolymphangioma", "hematophobia", "hemerobaptism", "heminee", "hemodilution", "hemopneumothorax", "henchman", "hendecatoic", "heppen", "heptameter", "heptaphyllous", "heraclitism", "herbarize", "herbish", "herrnhuter", "hesperornithoid", "hesthogenous", "heterochromia", "heteromallous", "heterosporic", "heterostrophic", "heterotic", "heterotopy", "hexandria", "hiant", "hienz", "hierarchal", "hierograph", "highhandedness", "hightoby", "hirudiniculture", "hitchy", "hobbyism", "hokeypokey", "holdenite", "holidaymaker", "holochoanoidal", "holographical", "homespun", "homoeophony", "homostylous", "hoodshyness", "hoofer", "hooligan", "horizontalization", "horoscopic", "horsify", "horsyism", "hostless", "hotelward", "hotly", "hotmouthed", "hottentotism", "housewarmer", "hovedance", "howlingly", "huddling", "humane", "humanitymonger", "humblemouthed", "humidify", "hura", "hursinghar", "hydatogenous", "hydnaceous", "hydrargillite", "hydraulician", "hydrazoic", "hydrocystic", "hydrogenium", "hydrone", "hydropic", "hydrosome", "hyetographically", "hymnarium", "hymner", "hymnologic", "hyolithid", "hypergamy", "hyperhypocrisy", "hyperintelligence", "hyperotreta", "hypersphere", "hyperstrophic", "hypertensive", "hyperthyroid", "hypervascular", "hypocarpogean", "hypodermous", "hypodicrotic", "hypoendocrinism", "hypokinesia", "hypophyll", "hysterectomy", "ichthyodea", "ichthyopterygia", "iconic", "iconoclast", "ideoplasty", "ierne", "ikey", "illusionary", "ilongot", "imaginable", "immanity", "immortification", "imperfectious", "implacability", "implosion", "importantly", "improvisation", "impudent", "inapposite", "inarable", "inchoant", "incoagulable", "incompetency", "increate", "incretionary", "incubi", "incurably", "indelicacy", "indigenate", "indiscreetly", "ineducabilian", "inexportable", "infamously", "infertile", "infertileness", "infestivity", "infinitesimal", "inflammableness", "infrigidation", "ingenit", "inhabitativeness", "inhalation", "inhaust", "inleague", "innovate", "innutritious", "inocular", "inoepithelioma", "inolith", "inquaintance", "insatiately", "insinuativeness", "inspiring", "inspiritingly", "installation", "institutionalize", "instrumentist", "insusceptive", "intangibility", "intarissable", "intentional", "intentness", "interattrition", "interchangeably", "interdifferentiation", "interfactional", "interferometer", "interfusion", "interinsert", "interjunction", "interlamellar", "interleaf", "intermedial", "intermessenger", "interphase", "interpretableness", "interpunct", "interrex", "interstrial", "intertillage", "intertransmissible", "intertransmission", "intransitive", "invalidness", "inverminate", "inviolably", "iridorhexis", "ironlike", "ironsmith", "ironwort", "irradiated", "irreligiousness", "irreverently", "irrigant", "isodiametric", "isoseismic", "italianately", "itch", "ithacensian", "iwa", "ixodes", "jabberwockian", "jacare", "jacko", "janiculum", "jararaca", "jarbot", "jefferisite", "jehup", "jerkined", "jezebelian", "jigger", "jingoist", "joiner", "jokesome", "jovialistic", "jovicentrically", "jowery", "joyancy", "judaically", "juice", "juliane", "juramentado", "justiciaryship", "kari", "kedarite", "kefiric", "kerflummox", "khagiarite", "kilmarnock", "kinch", "kindergartening", "kinesimeter", "kingfisher", "kinotannic", "kisra", "kissar", "kitchenful", "kittenishly", "knobbler", "knot", "koae", "koldaji", "kubba", "kui", "labioglossal", "labioguttural", "labiopharyngeal", "lachnanthes", "lachrymosely", "laciniose", "lacker", "lackland", "lacquerer", "laemostenosis", "lahnda", "lairdship", "lairy", "lakeless", "lakism", "lamany", "lambsuccory", "lampatia", "landocrat", "landstorm", "landuman", "languish", "lanner", "lanseh", "lanthopine", "laparocolectomy", "lapper", "laryngological", "lasiocarpous", "lateritic", "latheman", "latibulize", "latitudinary", "lawcraft", "lawlessly", "lawned", "laywoman", "leadwood", "leamer", "leaper", "legenda", "leglen", "leiodermatous", "lemaireocereus", "leonhardite", "lepidotes", "leprologic", "leptocephalan", "lesion", "lete", "levelheaded", "levining", "leviticus", "lexicographic", "liberalia", "licitation", "lifeboat", "lignify", "limiting", "limuloidea", "linnaea", "lipotropic", "lippitude", "liquorer", "lithectasy", "lithification", "livingness", "lixiviate", "loka", "lolo", "lomastome", "longwort", "lordlily", "loup", "lowboy", "lowlander", "luiseno", "luminarious", "lurker", "luxate", "lymphadenitis", "lyonetiid", "macedonian", "machiavellistic", "mackinaw", "macrochaeta", "macrodactyl", "macrotherm", "macrotone", "maculiferous", "maga", "magdalenian", "magisterialness", "maidism", "mainstay", "makefast", "malacia", "malaxator", "malcultivation", "maltable", "malvaceous", "mammalian", "mammonism", "mammular", "manchesterdom", "manganostibiite", "mange", "manlikeness", "mantoidea", "marci", "marhala", "martialness", "martinetship", "martyrdom", "martyrologium", "masa", "mashie", "mashpee", "massacre", "massecuite", "masterfulness", "matacan", "matatua", "materialman", "matrilineally", "mattoir", "matzoon", "mayoral", "meaned", "meatal", "mechoacan", "meconium", "mecopteron", "medicament", "medievalism", "mediopectoral", "meeken", "megacosm", "megavolt", "meistersinger", "melam", "melanocarcinoma", "melanosis", "melicraton", "meliorate", "mellificate", "melologue", "melotragedy", "meningorrhea", "mephistophelistic", "mesartim", "mesically", "mesioversion", "mesocaecal", "mesologic", "mesophyll", "mesoplast", "mesorectal", "metacoracoid", "metaline", "metaphor", "metaplasmic", "metastyle", "metaxenia", "metoac", "metroscopy", "miauler", "microchromosome", "micropodal", "microsauria", "microscopic", "microvolumetric", "mimography", "minge", "mino", "miscellaneously", "miscommand", "misdevoted", "miseducation", "misgesture", "misgovern", "misguided", "misinform", "mislight", "mislikingly", "misosophy", "misquality", "misrehearse", "missible", "mistrustless", "mithraicism", "mitotic", "mitridae", "mniaceae", "modernistic", "modulo", "mohammedan", "molluscum", "mome", "momotus", "mondayish", "monkery", "monochlamydeous", "monody", "monogoneutic", "monolatrous", "monomethylic", "monopolarity", "monopolizer", "monothecal", "monotremata", "monotrochal", "moonlight", "moppy", "morbiferal", "mordella", "morned", "morningward", "morpheme", "motacilla", "motatorious", "moted", "mottlement", "mounter", "mru", "muciparous", "muffineer", "mugwumpian", "multiplet", "multituberculata", "munchausenism", "muraled", "muriatic", "mutism", "mutoscope", "myelemia", "myiarchus", "myopolar", "mythmaking", "mythopastoral", "myxoenchondroma", "myxomycetes", "myxopod", "naik", "namaycush", "namda", "nappy", "natrix", "naturopathic", "nayarit", "nebula", "nebulous", "nebulousness", "necklaceweed", "necrectomy", "necropolitan", "nectarine", "needleman", "neglectful", "neglectfully", "negrohood", "neohexane", "neurectopy", "neurility", "neuropsychologist", "newsboy", "nexal", "niche", "nickelize", "nidificational", "nieceship", "nintu", "noachian", "nocturia", "nodosaria", "nomenclatory", "nominalistic", "nonanalyzable", "nonascertaining", "nonassessment", "nonchronological", "noncolonial", "nonconformistically", "nonconsonant", "nondealer", "nondisarmament", "nondispersal", "nonefficacious", "noneviction", "nonexteriority", "nonfelonious", "nonimmunized", "noninjurious", "nonlicentiate", "nonlover", "nonnaturalness", "nonnutritious", "nonorchestral", "nonoscine", "nonproductively", "nonprofane", "nonrotatable", "nonscience", "nonspored", "nonsticky", "nonsymptomatic", "nontemporizing", "nontherapeutic", "nontrespass", "nonusage", "nonvindication", "normanism", "northumbrian", "noseburn", "nosogenesis", "nosopoietic", "nostril", "notecase", "notidanoid", "nourishment", "nowhence", "nuculanium", "nudity", "numerate", "nunciature", "nuptial", "nymphet", "oathful", "obduction", "obediential", "obituarian", "oblique", "obscurantist", "obsequiously", "obstructive", "occipitoatlantal", "occipitofrontalis", "occupancy", "oceanwards", "octaval", "octopartite", "oculiform", "oculofrontal", "odinitic", "odoriphore", "oesophagus", "ogcocephalus", "okupukupu", "oleomargarine", "oligochylia", "oliver", "olympicly", "omnifariously", "omnipresence", "omniscribent", "omnitolerant", "ona", "ondoscope", "onomatopoeic", "ooecial", "oofbird", "oogamous", "oosporange", "oostegitic", "opacousness", "ophthalmy", "opisthoglossate", "opisthogyrous", "oppose", "oppressible", "oracle", "orbicularness", "orbilius", "orchidorrhaphy", "orexis", "orientalogy", "orificial", "originator", "orison", "oromo", "ortalidae", "orthodox", "oryzorictinae", "osirify", "osmondite", "osoberry", "ossivorous", "osteology", "osteoplast", "otosalpinx", "outbabble", "outchatter", "outcorner", "outdance", "outdoorness", "outflunky", "outhowl", "outhurl", "outplease", "outpopulate", "outriding", "outsatisfy", "outtask", "outvillain", "ovationary", "overappraise", "overbearingness", "overblessedness", "overbooming", "overbreak", "overbrightly", "overbrow", "overcontribution", "overfacile", "overfaint", "overfeed", "overfloat", "overleaven", "overpositive", "overprune", "overpublic", "overresolutely", "overscrupulousness", "oversteadfastness", "overstream", "overtalk", "overthrifty", "overthrowable", "overtongued", "oviparity", "oviparousness", "ovispermary", "owlglass", "oxazine", "oxyanthracene", "oxygenicity", "oxymuriate", "pabulary", "pachymeninx", "pachystichous", "packmaker", "padre", "paedatrophy", "paedopsychologist", "paedotrophy", "paganical", "pageful", "palaeotypically", "palamitism", "palatomaxillary", "paleograph", "paleornithology", "palmar", "palmito", "panace", "pandoridae", "panichthyophagous", "panomphean", "panphenomenalism", "pansexualist", "pantheology", "pantomimical", "pantopterous", "pantostomatous", "papaverous", "papillous", "papyri", "paradidymal", "paradoxicalism", "paralyzer", "parametrium", "paranucleic", "paranucleus", "paraphrastically", "parasitology", "paraterminal", "paratherian", "paratragoedia", "parethmoid", "parochialist", "paroli", "parpal", "parvule", "pasha", "passivate", "patefy", "patera", "paternoster", "patesiate", "pauciloquy", "pauperizer", "pauropoda", "peacockishness", "pearlfruit", "pearliness", "pedant", "pedipalpal", "peelism", "peepeye", "peerie", "peneseismic", "penitentes", "pennatifid", "pentaphylacaceae", "pentaploidy", "pentateuch", "pentrough", "peplosed", "peract", "percipient", "perfumeless", "pericarditis", "perichaete", "perigyny", "periplasm", "periprostatic", "peristrumitis", "persona", "perspirate", "perstringe", "pervicacity", "petiolary", "petrolization", "phaenogam", "phalarope", "phallodynia", "pharmacopeian", "pharyngoscope", "phenolization", "phenomenism", "phenoxid", "phiallike", "philatelism", "philocaly", "philodinidae", "phoenicurous", "phonendoscope", "phoronid", "phosphomolybdic", "photoaesthetic", "photoemissive", "photogram", "photonephograph", "phototypist", "photoxylography", "photozincography", "phractamphibia", "phrenologist", "phycochromophyceous", "phylarchic", "phyllophaga", "physicist", "physicotherapeutic", "physopodan", "phytophagineae", "piacularness", "piarhemia", "pigflower", "pilatian", "piles", "pillwort", "pilon", "pimola", "pinchingly", "pindarist", "pipistrel", "pittoid", "planarida", "plantership", "plashet", "platinochloric", "platonian", "platonically", "playdown", "pleasantly", "plectrum", "plenarium", "plethysmographic", "pleximetry", "ploceus", "plowman", "plumbage", "plumbite", "plurinominal", "plussage", "pluviometry", "pneumatomachy", "pocky", "poil", "poised", "polacca", "politicist", "polydynamic", "polygynia", "polymastigate", "polymetallism", "polymyoid", "polyoecy", "polypary", "polyphylline", "polystome", "polytonal", "pomiculturist", "pompano", "pontify", "pontil", "poophyte", "popehood", "porcelain", "porencephalus", "porkwood", "pornerastic", "porosimeter", "porrectus", "portraitist", "porulose", "postdural", "postencephalitic", "poster", "postlabial", "postsaccular", "poucer", "poulard", "poundal", "pourpoint", "powerfully", "praising", "preadherence", "prebend", "preboyhood", "precoagulation", "preconference", "preconversation", "precoracoid", "predefault", "predefence", "predeliberate", "predictory", "prelabrum", "preloss", "premeditatedness", "prenotify", "prenumber", "preparatorily", "prepense", "prepubescent", "prepubic", "prepubis", "prereceiver", "presplenomegalic", "pressmark", "prestomial", "prestudiousness", "presuperfluous", "pretendant", "preternaturality", "pretrematic", "previsional", "preworldliness", "prezonal", "primigenous", "priodont", "prismoid", "proacceptance", "probusiness", "prochoos", "proctotrypid", "procurrent", "prodigiosity", "prodigiously", "profanchise", "profeminist", "professoress", "proflavine", "proke", "prolific", "prophesy", "prophetry", "prophylactic", "propylitic", "prosopography", "protectorship", "protocercal", "protocolization", "protozoacide", "providential", "providently", "provincially", "provitamin", "prunt", "pseudesthesia", "pseudoapologetic", "pseudobasidium", "pseudocotyledon", "pseudodipteral", "pseudohypertrophic", "pseudoleukemic", "pseudomorphous", "pseudoperculate", "pseudoprosperous", "pseudosymmetric", "pseudotuberculous", "psiloceras", "psychid", "psychometrist", "psychosophy", "pterostigma", "puberty", "puck", "puffball", "puler", "pulsate", "punaise", "punicial", "purloin", "pursuit", "putridity", "pyelography", "pyophthalmia", "pyrolignite", "pyroscopy", "pyrouric", "pyrrole", "quadrifocal", "quadrijugal", "quadristearate", "quadrumane", "quamoclit", "quantitatively", "quatern", "questionlessly", "quinamine", "quinquatrus", "quinquedentated", "quinquepunctal", "quiver", "rabbeting", "radiologist", "rageousness", "raiiform", "railroadish", "railroadship", "ramanan", "rambunctious", "ranstead", "rant", "raphia", "rasure", "rattail", "rattlebush", "rattlehead", "rattlenut", "rattleskull", "rayonnant", "razzia", "reacidification", "readoption", "rearrange", "rebaptizer", "rebear", "rebias", "rebrick", "recancel", "reccy", "reclaim", "reclassify", "recolor", "recoupment", "recrystallization", "recti", "recurse", "rede", "redeal", "redisperse", "redistrainer", "reduceableness", "reedling", "referent", "refit", "reflective", "reflectively", "reflexively", "reforge", "regardfully", "regenerant", "reglue", "reindependence", "reinflame", "rejuvenescence", "reletter", "reliant", "religionize", "reliquary", "remedy", "remock", "remonstrance", "reorganizationist", "repatronize", "replevisable", "replevy", "reposedly", "reposefully", "repugn", "reputedly", "rescission", "resentience", "reservery", "reservoir", "reship", "reshrine", "restamp", "restio", "resultless", "retainder", "retanner", "retarder", "retentionist", "retrocedence", "retrocognitive", "retromorphosis", "retrospect", "retube", "reundulate", "revalorization", "reversingly", "revertible", "revery", "revised", "revivable", "revivification", "revocably", "rhizophyte", "rhodophane", "rhomb", "rhynchocephala", "rhynchophore", "rhynchops", "rhynchotous", "ridgelike", "rigescent", "rillette", "ringbill", "rivel", "rizzom", "roadfellow", "roboreous", "rockman", "rocktree", "roentgenize", "rog", "roister", "romanic", "rondo", "rooflike", "rooinek", "rookie", "roomer", "rorulent", "roseroot", "rotch", "rotorcraft", "roundedly", "rounding", "roupily", "rubberize", "rubelet", "rubrific", "rumal", "rutherfordite", "rutidosis", "saccharamide", "saccharephidrosis", "sacrilegiously", "sagenite", "salicylyl", "salpidae", "sameliness", "sandiferous", "sanjakate", "santalaceae", "santali", "sarinda", "saucemaking", "saulter", "saussurea", "saut", "saxicolidae", "saxonical", "scalenous", "scales", "scandalizer", "scapoid", "scapuloclavicular", "scapuloulnar", "scenarize", "sceptry", "schoolteachery", "scientize", "scotomatical", "scots", "scoundrelship", "screaky", "screenplay", "scriptitiously", "scriptorial", "scuddaler", "sculptile", "scummy", "scythize", "secale", "secos", "sectional", "seecatch", "segmentally", "selective", "semaphorist", "semeostoma", "semialien", "semibourgeois", "semiclosure", "semicrome", "semicubical", "semidefinite", "semideveloped", "semidrying", "semigenuflection", "semiglobose", "semihigh", "semilenticular", "semisentimental", "semisuccessfully", "semitesseral", "semivalvate", "senectude", "seneschalsy", "senilely", "sephardim", "septenate", "septiferous", "sergedesoy", "serodiagnostic", "sesquiquinta", "severalfold", "sextarius", "shackatory", "shadberry", "shaku", "shaly", "shamable", "shamba", "shandyism", "shanty", "sheetflood", "shellac", "shepherdism", "shiftingness", "shilha", "shinglewise", "shivery", "shoeman", "shoeshine", "shopkeeper", "shortage", "shortener", "shortening", "shortfall", "showmanism", "showworthy", "shylock", "sicca", "sickly", "sider", "signee", "significatory", "silicoferruginous", "silicofluoride", "sillery", "silva", "silverrod", "simoom", "simulatively", "sinalbin", "singleheartedly", "sipling", "sipper", "sitta", "skel", "skeletonweed", "skey", "skidpan", "skinbound", "skippable", "skive", "skun", "slakeless", "slampamp", "slanderingly", "slangishly", "slatternness", "sleepwalker", "slimly", "slinging", "slitless", "slob", "slod", "slotting", "slovene", "smew", "smyth", "snakebark", "snapped", "sniper", "snobbish", "snoopy", "soaringly", "sociogeny", "sociologian", "sociometric", "sodalist", "solander", "soldi", "soldierhearted", "solenostomidae", "solicitously", "solymaean", "someday", "somnifuge", "sonation", "soord", "soph", "sorema", "sorority", "sorption", "sots", "soudagur", "spaciotemporal", "spadille", "spaeman", "spaewright", "spalpeen", "spandy", "speal", "specialized", "spectatorial", "spectrobolograph", "speedometer", "speedwell", "spelk", "speltz", "spermatocele", "spermatozoid", "spermine", "sphaerosome", "sphingurinae", "spice", "spindleworm", "spiralization", "spiricle", "spiritfulness", "spiritist", "splanchnoptosis", "splatchy", "splatterwork", "splenatrophy", "splenotoxin", "splitfinger", "splodgy", "spokewise", "spondylocladium", "sporophoric", "sportsmanly", "spouse", "springhalt", "springtrap", "springworm", "spruiker", "spunkily", "spuriosity", "squatinid", "squeezy", "squid", "squiffer", "squinter", "staccato", "stackencloud", "stageable", "stalagmitically", "stallment", "stapes", "staphyloschisis", "stationariness", "steeler", "stentorophonic", "stereochemic", "stereophotomicrograph", "stereotypographer", "sterlet", "sterncastle", "sternman", "sterve", "stickseed", "stipulae", "stitchwort", "stockkeeper", "storiation", "stormable", "stormward", "stouth", "stratagematist", "stratospherical", "streamline", "streptoneurous", "stressful", "stretchproof", "strippler", "stronghand", "strychninization", "styleless", "stylometer", "subaduncate", "subakhmimic", "subaquean", "subattorney", "subcontracted", "subdeacon", "subengineer", "subexcite", "subhead", "subjugate", "subletter", "sublimationist", "sublimish", "subramous", "substantive", "substitutive", "subternatural", "subungulate", "subversed", "sucken", "suckfish", "sufistic", "sulfocyanide", "sullage", "sulphinyl", "sulphofy", "sumbul", "sunderance", "sunyie", "superaerial", "supercapable", "superconductive", "superconformable", "superlunary", "supermanism", "superoptimist", "superponderance", "supersalesman", "supersalient", "supersecretion", "supersentimental", "superworldly", "superyacht", "supracondylar", "supradural", "suprapubian", "suprarenal", "surculus", "surdomute", "surfaceman", "surmounted", "surmullet", "survigrous", "sussexman", "suturation", "svan", "swazi", "sweetness", "sweltering", "switchbacker", "sycomancy", "synocreate", "synodal", "synodalian", "synthesize", "syntone", "syphilosis", "tabetiform", "tachyglossal", "tackle", "tackproof", "tactable", "takedownable", "takin", "taleful", "talionic", "talkie", "taluk", "tamperer", "tandemist", "tandle", "tangentially", "tapacura", "tapism", "tarbooshed", "tarmi", "tarnishable", "tasajo", "tattling", "tautology", "tawdriness", "tawery", "taxon", "tead", "tean", "teat", "tecoma", "telangiectatic", "telechemic", "telestich", "telic", "temporoauricular", "temporofrontal", "tenderfoot", "tenement", "teratosis", "terrarium", "tertianship", "testimonialize", "tetracarboxylic", "tetradecapoda", "tetrapous", "textarian", "textually", "theologically", "theologization", "theosophically", "theow", "thereuntil", "therianthropism", "thermoanalgesia", "thermoelectricity", "thiamide", "thiamine", "thiostannate", "thiourethan", "thiozonide", "thorocopagous", "thrapple", "threnetical", "threnode", "threpsology", "thymonucleic", "thyroidism", "thysanuran", "thysen", "tiar", "tigery", "tigger", "tilly", "timecard", "tinderish", "tintinnabulant", "tintometry", "tipproof", "tiralee", "tirma", "titanomachy", "titrimetric", "tobias", "tobira", "tobogganist", "todea", "toolhead", "toothchiseled", "toparch", "torculus", "tore", "tornadoesque", "torosity", "torsiogram", "torsometer", "torturous", "tory", "toucher", "tovar", "towkay", "toxostoma", "tracheata", "trachelocyllosis", "tractarian", "tranceful", "transcreate", "transept", "transgression", "transindividual", "transmateriation", "transmedian", "transmigratory", "transparence", "transplendently", "transudative", "transumptive", "traps", "travoy", "tremulation", "tremulousness", "trencherman", "tressed", "tressure", "trichauxis", "tricladida", "triedly", "triflingly", "trigesimal", "trimer", "trimestrial", "tringle", "trink", "tripodical", "tritriacontane", "triturus", "troglodytidae", "trolleyer", "troop", "troopfowl", "trouse", "trouserless", "trouveur", "trucebreaker", "trunkfish", "trustful", "trusty", "tubeful", "tuberclelike", "tuberculide", "tulipiferous", "tullibee", "tun", "tunnel", "tupelo", "turfiness", "turkle", "tutorer", "tutorly", "twattle", "tween", "twiner", "twinned", "typhlolithiasis", "typhlosole", "tyranness", "tyranny", "ubication", "ulatrophia", "ulnaria", "ulsterman", "ultranice", "ultrauncommon", "unacceptableness", "unacceptance", "unaccomplishable", "unadmire", "unadvisable", "unalachtigo", "unancestored", "unappositely", "unarch", "unascendable", "unascertainable", "unaudited", "unauthoritatively", "unbashful", "unbeclouded", "unbeliefful", "unbelievingly", "unbesought", "unblush", "unbuttered", "unchemical", "uncially", "unclick", "unclimbable", "uncloak", "uncommenced", "uncongratulating", "uncongregated", "unconsidering", "unconsulting", "uncontractedness", "unconvincing", "uncorrected", "uncourtly", "uncrossed", "unctioneer", "undashed", "undaub", "undefended", "undefiant", "underbridge", "underbright", "undercellarer", "underclerk", "undergrow", "underlanguaged", "undermentioned", "underpaid", "undershield", "underthrob", "undertone", "undertruss", "undervaluinglike", "underwriting", "undimpled", "undismantled", "undispersing", "undripping", "undriven", "uneffaceably", "unelectrifying", "unempty", "unendurable", "unenfranchised", "unepitaphed", "unevangelized", "unevaporate", "unexhaustive", "unexpelled", "unexpertness", "unextended", "unexterminable", "unfascinated", "unfemininely", "unflaming", "unfletched", "unfloggable", "unfollowable", "unforetellable", "unforget", "unformalized", "unformularizable", "unframed", "unfrowardly", "unfroze", "unfuddled", "ungeographic", "unglazed", "unguiltily", "unhalved", "unharmoniously", "unhealable", "unheated", "unhide", "unhuman", "unhumanized", "unicity", "unifier", "unilocular", "unimpugned", "unindemnified", "uninimical", "uninsistent", "unintellectually", "uninterwoven", "uninthroned", "uninvitedly", "uniramose", "unirhyme", "unisexed", "unitage", "unitingly", "unituberculate", "universological", "unjesuited", "unjudiciousness", "unjust", "unkid", "unlacquered", "unlapsing", "unlaureled", "unleaky", "unlevelness", "unlive", "unmaidenly", "unmanducated", "unmanipulatable", "unmanliness", "unmature", "unmelted", "unmilitary", "unmullioned", "unmummied", "unniceness", "unnoticeably", "unobsequious", "unostentation", "unpark", "unpasted", "unperfected", "unphilosophized", "unphysicianlike", "unpickable", "unpitied", "unplaited", "unplantlike", "unplenished", "unpoise", "unpolished", "unpolitely", "unpounced", "unpredicted", "unpremature", "unprepossessingly", "unprincipled", "unproducedness", "unprofanable", "unprosperably", "unprovableness", "unprovedness", "unpummelled", "unquakerly", "unquality", "unraftered", "unrebellious", "unreclaimedness", "unreflected", "unrelative", "unrelentance", "unrepentantness", "unrepenting", "unrevised", "unrevolutionized", "unrigged", "unroll", "unromantic", "unruffle", "unrun", "unrustic", "unsanitated", "unsatiableness", "unsatisfyingly", "unscale", "unsearching", "unseveredness", "unshamable", "unshell", "unshipshape", "unshot", "unsilenceable", "unsolicitousness", "unsordid", "unsovereign", "unspiteful", "unsponged", "unstampeded", "unstuck", "unsufferably", "unsufficience", "unsulliedness", "unsulphureous", "unsumptuous", "untailorly", "untallowed", "untempering", "unthrust", "untouristed", "untownlike", "untrain", "untranscribable", "untransplanted", "untruthfulness", "untunable", "unturpentined", "ununanimous", "ununitably", "unvaluableness", "unveering", "unvesseled", "unvoided", "unwarped", "unweariedly", "unwillfully", "unwillingly", "unwindable", "unwittily", "unwormy", "uparch", "upbear", "upbelch", "upbreeze", "upflare", "upjerk", "upridge", "upstanding", "ural", "uranolite", "urechitoxin", "uredineous", "urethrotomic", "urnism", "urogaster", "urosepsis", "urosomite", "urrhodin", "ursuline", "usucapion", "utahite", "uterosclerosis", "uterotomy", "uvanite", "vaccinator", "vagus", "valentide", "valuation", "valveman", "vammazsa", "vargueno", "varnishy", "vasundhara", "velchanos", "ventriloquy", "ventromesial", "vepse", "verbarium", "vergeboard", "versative", "versiform", "vertebrosternal", "vesiculitis", "vibracular", "vicianose", "vinegarer", "violatory", "violina", "virginitis", "viscosimetry", "vitreum", "vitrify", "vivific", "viviparity", "vocationalism", "vociferize", "vocification", "voidly", "voile", "volcanite", "volcanize", "voltzite", "volubility", "volutidae", "vulcan", "vulgarly", "vulturous", "waiter", "waivery", "walachian", "wanton", "warblelike", "warbling", "wardman", "warse", "warsler", "wartflower", "watchkeeper", "waterworn", "weakening", "wealden", "wee", "wellmaker", "wezn", "wharfage", "wheal", "wheelspin", "wheyey", "whimwham", "whirken", "whisperer", "whitsun", "wickedness", "widbin", "widgeon", "wifeless", "windage", "winder", "windlestraw", "winkle", "wintertime", "wintrily", "wips", "wirelike", "wiring", "wiseacre", "withhold", "withindoors", "wobbler", "wolfhood", "womby", "woolwork", "woolworking", "worktable", "wormil", "wowserdom", "woyaway", "wynd", "xanthophane", "xanthoxylin", "xenophile", "xerarch", "xylorcinol", "yahooism", "yaje", "yammadji", "yapped", "yarl", "yealing", "yelk", "yellowknife", "yestreen", "yeukieness", "yoga", "yoi", "yowley", "yuzlik", "zaklohpakap", "zayat", "zirconate", "zolotink", "zooecia", "zoogony", "zoosporous", "zygomorphic", "zymotically", "zyryan"]
 
-data = []
-for word in word_list:
-    result = get_word_data(word)
-    if result:
-        data.append(result)
 
-# Save to JSON file
-with open("words.json", "w") as f:
-    json.dump(data, f, indent=4)
+def main():
+    # Download WordNet if not already
+    ensure_nltk_data('wordnet', 'omw-1.4')
+
+    # Words already in the checkpoint log for this WordNet version are not looked up again
+    source = source_fingerprint(wordnet.get_version(), EXTRACTOR_VERSION)
+
+    # Each word is checkpointed as soon as it is extracted
+    data = []
+    with CheckpointLog(CHECKPOINT_PATH, source) as checkpoint:
+        for word in word_list:
+            if word in checkpoint:
+                result = checkpoint.get(word)
+            else:
+                result = get_word_data(word)
+                checkpoint.append(word, result)
+            if result:
+                data.append(result)
+
+    # Save to JSON file, for readers that still expect the array
+    atomic_write_json("words.json", data, indent=4)
+
+    # And as NDJSON; written second so resolve_records_path prefers it as the fresher copy
+    count = write_ndjson("words.ndjson", data)
+    print(f"💾 Saved {count} words to words.json and words.ndjson")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+# Newline-delimited JSON: one record per line, so files can be written and
+# read an entry at a time instead of as one monolithic array
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+# Characters read per refill by the streaming array reader
+READ_CHUNK_SIZE = 1 << 16
+
+
+@contextmanager
+def atomic_output(path, mode="w"):
+    """Open a temporary file next to `path` and rename it over `path` on success.
+
+    Readers only ever see the old or the new file; a crash mid-write leaves
+    the previous file intact.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; give the output the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.fchmod(fd, 0o666 & ~umask)
+        encoding = None if "b" in mode else 'utf-8'
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """Write JSON to `path` atomically."""
+    with atomic_output(path) as f:
+        json.dump(data, f, **dump_kwargs)
+
+
+def write_ndjson(path, records):
+    """Write an iterable of JSON records to `path`, one per line, atomically; returns the count.
+
+    Records are encoded and written as they are produced, so a generator
+    never has to be materialized.
+    """
+    count = 0
+    with atomic_output(path) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def iter_ndjson(path):
+    """Yield the records of an NDJSON file, skipping blank lines."""
+    with open(path, "r", encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid NDJSON record: {e}") from None
+
+
+def iter_json_array(path, chunk_size=READ_CHUNK_SIZE):
+    """Yield the elements of a top-level JSON array without loading the whole file.
+
+    The file is read a chunk at a time and each element is decoded as soon
+    as it is complete, so memory stays proportional to the largest element
+    rather than to the file.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding='utf-8') as f:
+        buffer = ""
+        position = 0
+        eof = False
+
+        def fill():
+            # Drop what has been consumed, then append the next chunk
+            nonlocal buffer, position, eof
+            chunk = f.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            eof = not chunk
+
+        def next_char():
+            # Skip whitespace; the next significant character, or '' at end of file
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer) or eof:
+                    return buffer[position:position + 1]
+                fill()
+
+        if next_char() != "[":
+            raise ValueError(f"{path} is not a JSON array")
+        position += 1
+        if next_char() == "]":
+            return
+
+        while True:
+            if not next_char():
+                raise ValueError(f"{path}: unexpected end of file inside the array")
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # A number cut by the chunk boundary decodes as a shorter one ("2." as 2),
+            # so only accept a value once its separator has been read too
+            following = end
+            while following < len(buffer) and buffer[following].isspace():
+                following += 1
+            if not eof and (following == len(buffer) or buffer[following] not in ",]"):
+                fill()
+                continue
+            position = end
+            yield value
+
+            separator = next_char()
+            position += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"{path}: expected ',' or ']' between array elements")
+
+
+def is_ndjson(path):
+    """True for NDJSON files: by suffix, or by a first record that is not an array."""
+    if path.endswith(NDJSON_SUFFIXES):
+        return True
+    with open(path, "r", encoding='utf-8') as f:
+        for line in f:
+            stripped = line.lstrip()
+            if stripped:
+                return not stripped.startswith("[")
+    return True
+
+
+def iter_records(path):
+    """Stream the records of a dataset file, either NDJSON or a JSON array."""
+    if is_ndjson(path):
+        return iter_ndjson(path)
+    return iter_json_array(path)
+
+
+def ndjson_path(path):
+    """The NDJSON counterpart of a dataset path: words.json -> words.ndjson."""
+    root, extension = os.path.splitext(path)
+    return path if extension in NDJSON_SUFFIXES else root + NDJSON_SUFFIXES[0]
+
+
+def resolve_records_path(path):
+    """Prefer the NDJSON counterpart of `path` when it exists and is not older than `path`."""
+    candidate = ndjson_path(path)
+    if candidate != path and os.path.exists(candidate):
+        if not os.path.exists(path) or os.path.getmtime(candidate) >= os.path.getmtime(path):
+            return candidate
+    return path
+
+
+def convert_to_ndjson(input_path, output_path):
+    """Rewrite a JSON array dataset as NDJSON, streaming; returns the record count."""
+    return write_ndjson(output_path, iter_records(input_path))
+
+
+def source_fingerprint(wordnet_version, extractor_version, **settings):
+    """Checkpoint `source` for words extracted from WordNet by a versioned extractor.
+
+    Only what changes a single word's extracted data belongs here; anything
+    that merely picks which words are processed does not.
+    """
+    return json.dumps({'wordnet': wordnet_version, 'extractor': extractor_version, **settings}, sort_keys=True)
+
+
+class CheckpointLog:
+    """Append-only log of processed words for resumable dataset builds.
+
+    Each line records one word, the `source` fingerprint it was extracted
+    under (WordNet version, extractor settings, ...) and the extracted data,
+    which may be None for words that yielded nothing. Records from another
+    source are ignored on load so those words are processed again, and a
+    line cut short by a crash is skipped.
+
+    `settings` holds run-wide values a resumed run must reuse (such as the
+    shuffle seed). They are stored as {"settings": {...}} lines, kept
+    whatever the source, and the last one wins.
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        self.records = {}
+        self.settings = {}
+        self._file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        """Load current records, drop stale ones and open the log for appending."""
+        stale = 0
+        complete = True
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding='utf-8') as f:
+                for line in f:
+                    complete = line.endswith("\n")
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        stale += 1
+                        continue
+                    if "settings" in record:
+                        self.settings.update(record["settings"])
+                    elif record.get("source") == self.source:
+                        self.records[record["word"]] = record["data"]
+                    else:
+                        stale += 1
+        if stale:
+            self._compact()
+        self._file = open(self.path, "a", encoding='utf-8')
+        if not stale and not complete:
+            # A crash between a record and its newline would glue the next record onto it
+            self._file.write("\n")
+        return self.records
+
+    def _compact(self):
+        """Rewrite the log with only the records for the current source."""
+        with atomic_output(self.path) as f:
+            if self.settings:
+                f.write(self._encode_settings(self.settings))
+            for word, data in self.records.items():
+                f.write(self._encode(word, data))
+
+    def _encode(self, word, data):
+        return json.dumps({"word": word, "source": self.source, "data": data}, ensure_ascii=False) + "\n"
+
+    def _encode_settings(self, settings):
+        return json.dumps({"settings": settings}, ensure_ascii=False, sort_keys=True) + "\n"
+
+    def __contains__(self, word):
+        return word in self.records
+
+    def get(self, word):
+        return self.records.get(word)
+
+    def append(self, word, data):
+        """Record one processed word; flushed so a crash loses at most this line."""
+        self.records[word] = data
+        self._file.write(self._encode(word, data))
+        self._file.flush()
+
+    def save_settings(self, **settings):
+        """Record run-wide settings for later resumes; flushed like a word record."""
+        self.settings.update(settings)
+        self._file.write(self._encode_settings(self.settings))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python dataset_io.py <input.json> <output.ndjson>")
+    count = convert_to_ndjson(sys.argv[1], sys.argv[2])
+    print(f"💾 Wrote {count} records to {sys.argv[2]}")
@@ -0,0 +1,211 @@
+"""Dense word vectors for "similar in meaning" ranking.
+
+Vectors come from latent semantic analysis over the WordNet-derived
+database text: each entry is a TF-IDF weighted bag of its definition and
+example words, its synonyms and its own headword; the top eigenvectors of
+the term co-occurrence matrix (the right singular vectors of the TF-IDF
+matrix) span the embedding space, and each entry is projected onto them and
+L2 normalized. Words whose glosses share vocabulary, or that list each
+other as synonyms, end up close together. The result is a float32 matrix
+with one row per database entry, in database order, saved as .npy so it can
+be memory-mapped.
+"""
+import math
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+
+from dataset_io import atomic_output, iter_records
+from reverse_index import document_text, tokenize
+from word_index import normalize_key
+
+EMBEDDING_DIM = 128
+# Most frequent terms kept for the co-occurrence matrix (MAX_VOCABULARY ** 2 floats)
+MAX_VOCABULARY = 4096
+# Synonyms and the headword itself weigh more than any single definition word
+RELATION_WEIGHT = 3.0
+# Entries handled per vectorized step while building
+BUILD_CHUNK_ROWS = 4096
+# Rows scored per matrix product in top-k search, to bound temporary memory
+SEARCH_CHUNK_ROWS = 65536
+
+
+def embedding_terms(entry):
+    """Weighted terms describing one entry."""
+    terms = Counter(tokenize(document_text(entry)))
+    for word in [entry['word']] + list(entry.get('synonyms') or ()):
+        terms["=" + normalize_key(word)] += RELATION_WEIGHT
+    return terms
+
+
+def _weighted_terms(documents, term_ids, idf):
+    """Flat (row, term id, unit-normalized TF-IDF weight) arrays for a list of documents."""
+    rows, ids, weights = [], [], []
+    for row, terms in enumerate(documents):
+        for term, weight in terms.items():
+            term_id = term_ids.get(term)
+            if term_id is not None:
+                rows.append(row)
+                ids.append(term_id)
+                weights.append(weight * idf[term_id])
+    rows = np.array(rows, dtype=np.int64)
+    ids = np.array(ids, dtype=np.int64)
+    weights = np.array(weights, dtype=np.float64)
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(documents)))
+    if len(rows):
+        weights /= norms[rows]
+    return rows, ids, weights
+
+
+def _top_eigenvectors(symmetric, count, oversample=16, iterations=4, seed=0):
+    """Leading `count` eigenvectors of a symmetric PSD matrix by randomized subspace iteration.
+
+    Much cheaper than a full eigendecomposition when count is far below the
+    matrix size (seconds instead of tens of seconds at 4096 terms).
+    """
+    size = symmetric.shape[0]
+    width = min(size, count + oversample)
+    if width == size:
+        eigenvalues, eigenvectors = np.linalg.eigh(symmetric)
+        return eigenvectors[:, np.argsort(eigenvalues)[::-1][:count]]
+
+    subspace = np.random.default_rng(seed).standard_normal((size, width))
+    for _ in range(iterations):
+        subspace, _ = np.linalg.qr(symmetric @ subspace)
+    eigenvalues, eigenvectors = np.linalg.eigh(subspace.T @ symmetric @ subspace)
+    return subspace @ eigenvectors[:, np.argsort(eigenvalues)[::-1][:count]]
+
+
+def compute_embeddings(entries, dim=EMBEDDING_DIM):
+    """Embed every entry; returns a float32 (len(entries), dim) matrix of unit rows."""
+    documents = [embedding_terms(entry) for entry in entries]
+    document_frequency = Counter()
+    for terms in documents:
+        document_frequency.update(terms.keys())
+
+    # Terms seen in a single entry cannot relate two entries
+    vocabulary = [term for term, count in document_frequency.most_common(MAX_VOCABULARY) if count > 1]
+    term_ids = {term: term_id for term_id, term in enumerate(vocabulary)}
+    idf = [math.log((1 + len(documents)) / (1 + document_frequency[term])) + 1 for term in vocabulary]
+    size = len(vocabulary)
+    dim = min(dim, size)
+    matrix = np.zeros((len(documents), dim), dtype=np.float32)
+    if not dim:
+        return matrix
+
+    # Term co-occurrence matrix X^T X, accumulated sparsely a chunk of entries at a time
+    cooccurrence = np.zeros(size * size, dtype=np.float64)
+    for start in range(0, len(documents), BUILD_CHUNK_ROWS):
+        rows, ids, weights = _weighted_terms(documents[start:start + BUILD_CHUNK_ROWS], term_ids, idf)
+        # Pair every term of an entry with every other term of the same entry
+        boundaries = np.flatnonzero(np.diff(rows)) + 1
+        for row_ids, row_weights in zip(np.split(ids, boundaries), np.split(weights, boundaries)):
+            cooccurrence.reshape(size, size)[np.ix_(row_ids, row_ids)] += np.outer(row_weights, row_weights)
+
+    basis = _top_eigenvectors(cooccurrence.reshape(size, size), dim).astype(np.float32)
+
+    for start in range(0, len(documents), BUILD_CHUNK_ROWS):
+        chunk = documents[start:start + BUILD_CHUNK_ROWS]
+        rows, ids, weights = _weighted_terms(chunk, term_ids, idf)
+        projected = np.zeros((len(chunk), dim), dtype=np.float32)
+        np.add.at(projected, rows, basis[ids] * weights[:, None].astype(np.float32))
+        matrix[start:start + len(chunk)] = projected
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def write_embeddings(matrix, path):
+    """Save the matrix as .npy, atomically."""
+    with atomic_output(path, "wb") as f:
+        np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+
+
+class EmbeddingIndex:
+    """Top-k cosine search over a matrix of unit-length row vectors.
+
+    Scores are plain matrix products computed a chunk of rows at a time, with
+    argpartition picking each chunk's best candidates, so a query over a
+    memory-mapped matrix never materializes more than SEARCH_CHUNK_ROWS scores
+    per query at once.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def search(self, vectors, limit=10, exclude=None):
+        """Best rows for each query vector: a list of [(row, score), ...] per query.
+
+        `exclude` optionally gives one row per query to leave out (the query
+        word itself).
+        """
+        queries = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        query_count = queries.shape[0]
+        best_rows = np.empty((query_count, 0), dtype=np.int64)
+        best_scores = np.empty((query_count, 0), dtype=np.float32)
+        keep = limit + 1 if exclude is not None else limit
+
+        for start in range(0, len(self), SEARCH_CHUNK_ROWS):
+            chunk = self.matrix[start:start + SEARCH_CHUNK_ROWS]
+            scores = queries @ chunk.T
+            if scores.shape[1] > keep:
+                candidates = np.argpartition(-scores, keep - 1, axis=1)[:, :keep]
+            else:
+                candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+            best_rows = np.concatenate([best_rows, candidates + start], axis=1)
+            best_scores = np.concatenate([best_scores, np.take_along_axis(scores, candidates, axis=1)], axis=1)
+
+        results = []
+        for query in range(query_count):
+            order = np.argsort(-best_scores[query], kind='stable')
+            ranked = []
+            for candidate in order:
+                row = int(best_rows[query, candidate])
+                if exclude is not None and row == exclude[query]:
+                    continue
+                ranked.append((row, float(best_scores[query, candidate])))
+                if len(ranked) >= limit:
+                    break
+            results.append(ranked)
+        return results
+
+    def similar(self, row, limit=10):
+        """Rows most similar to `row`, excluding itself."""
+        return self.search(self.matrix[row], limit, exclude=[row])[0]
+
+    def similar_batch(self, rows, limit=10):
+        """similar() for many rows with one matrix product per chunk."""
+        rows = list(rows)
+        return self.search(self.matrix[rows], limit, exclude=rows)
+
+
+def open_prebuilt_embedding_index(matrix_path, database_path, entries):
+    """Memory-map the prebuilt matrix if it matches the database, else return None."""
+    if os.path.exists(matrix_path):
+        if not os.path.exists(database_path) or os.path.getmtime(matrix_path) >= os.path.getmtime(database_path):
+            matrix = np.load(matrix_path, mmap_mode='r')
+            if matrix.shape[0] == len(entries):
+                return EmbeddingIndex(matrix)
+    return None
+
+
+def open_embedding_index(matrix_path, database_path, entries):
+    """Memory-map the prebuilt matrix if it matches the database, else compute one in memory."""
+    index = open_prebuilt_embedding_index(matrix_path, database_path, entries)
+    if index is None:
+        index = EmbeddingIndex(compute_embeddings(entries))
+    return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python embeddings.py <words.json> <output.npy>")
+    database = list(iter_records(sys.argv[1]))
+    write_embeddings(compute_embeddings(database), sys.argv[2])
+    print(f"💾 Embedded {len(database)} words into {sys.argv[2]}")
@@ -0,0 +1,156 @@
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from word_index import headwords, normalize_key
+
+# rapidfuzz is optional: it only swaps in C implementations of the same metrics
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.distance import OSA
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# A ranked "did you mean" candidate and its position in the source word list
+Suggestion = namedtuple('Suggestion', ['word', 'score', 'position'])
+
+
+def similarity_ratio(query, candidate):
+    """Score two words from 0 to 100, like fuzzywuzzy's plain ratio."""
+    if RAPIDFUZZ_AVAILABLE:
+        return round(fuzz.ratio(query, candidate))
+    return round(100 * SequenceMatcher(None, query, candidate).ratio())
+
+
+def edit_distance(source, target, max_distance):
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded.
+
+    Shared prefixes and suffixes are trimmed first and only the diagonal band
+    of width 2 * max_distance + 1 is filled, so short candidates stay cheap.
+    """
+    if source == target:
+        return 0
+    if RAPIDFUZZ_AVAILABLE:
+        return OSA.distance(source, target, score_cutoff=max_distance)
+    if len(source) > len(target):
+        source, target = target, source
+    too_far = max_distance + 1
+    if len(target) - len(source) > max_distance:
+        return too_far
+
+    start = 0
+    while start < len(source) and source[start] == target[start]:
+        start += 1
+    source_end, target_end = len(source), len(target)
+    while source_end > start and source[source_end - 1] == target[target_end - 1]:
+        source_end -= 1
+        target_end -= 1
+    source = source[start:source_end]
+    target = target[start:target_end]
+    if not source:
+        return len(target) if len(target) <= max_distance else too_far
+
+    width = len(target)
+    previous_previous = None
+    previous = [j if j <= max_distance else too_far for j in range(width + 1)]
+    for i in range(1, len(source) + 1):
+        current = [too_far] * (width + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = too_far
+        source_char = source[i - 1]
+        for j in range(max(1, i - max_distance), min(width, i + max_distance) + 1):
+            target_char = target[j - 1]
+            if source_char == target_char:
+                value = previous[j - 1]
+            else:
+                value = previous[j - 1] + 1
+                if previous[j] + 1 < value:
+                    value = previous[j] + 1
+                if current[j - 1] + 1 < value:
+                    value = current[j - 1] + 1
+                if (previous_previous is not None and j > 1 and source_char == target[j - 2]
+                        and source[i - 2] == target_char and previous_previous[j - 2] + 1 < value):
+                    value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return too_far
+        previous_previous, previous = previous, current
+    return previous[width] if previous[width] <= max_distance else too_far
+
+
+def deletes(word, max_distance):
+    """Every string reachable from `word` by deleting up to max_distance characters."""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class FuzzyIndex:
+    """SymSpell-style deletion index for fast "did you mean" suggestions.
+
+    Deletes of each word's first `prefix_length` characters are precomputed, so
+    a query only looks up its own deletes instead of scoring every word. The
+    candidates within `max_edit_distance` are then ranked with `scorer`, any
+    callable taking (query, candidate) and returning 0-100, e.g. fuzz.WRatio.
+    """
+
+    def __init__(self, word_list, max_edit_distance=2, prefix_length=7, scorer=similarity_ratio):
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.scorer = scorer
+        self.keys = []
+        self.positions = []
+        self._deletes = {}
+
+        seen = set()
+        for position, word in enumerate(headwords(word_list)):
+            key = normalize_key(word)
+            if key in seen:
+                continue
+            seen.add(key)
+            key_id = len(self.keys)
+            self.keys.append(key)
+            self.positions.append(position)
+            for deleted in deletes(key[:prefix_length], max_edit_distance):
+                self._deletes.setdefault(deleted, []).append(key_id)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def suggest(self, query, limit=5, threshold=0):
+        """Return up to `limit` suggestions scoring at least `threshold`, best first."""
+        key = normalize_key(query)
+        if not key:
+            return []
+
+        candidate_ids = set()
+        for deleted in deletes(key[:self.prefix_length], self.max_edit_distance):
+            candidate_ids.update(self._deletes.get(deleted, ()))
+
+        ranked = []
+        for key_id in candidate_ids:
+            candidate = self.keys[key_id]
+            distance = edit_distance(key, candidate, self.max_edit_distance)
+            if distance > self.max_edit_distance:
+                continue
+            score = self.scorer(key, candidate)
+            if score >= threshold:
+                ranked.append((-score, distance, candidate, key_id))
+
+        ranked.sort()
+        return [
+            Suggestion(candidate, -negative_score, self.positions[key_id])
+            for negative_score, _, candidate, key_id in ranked[:limit]
+        ]
@@ -1,14 +1,37 @@
-import nltk
 from nltk.corpus import words, brown, wordnet
 from collections import Counter
+from multiprocessing import Pool
+import argparse
+import os
 import random
-import json
+import sys
+import time
 
-# Download required NLTK data
-nltk.download("words", quiet=True)
-nltk.download("brown", quiet=True)
-nltk.download("wordnet", quiet=True)
-nltk.download("averaged_perceptron_tagger", quiet=True)
+from dataset_io import CheckpointLog, atomic_write_json, source_fingerprint, write_ndjson
+from embeddings import compute_embeddings, write_embeddings
+from nltk_setup import ensure_nltk_data
+from phonetics import add_phonetic_fields, load_pronunciation_lexicon
+from reverse_index import build_reverse_index
+from word_index import normalize_key
+from word_store import write_word_store
+
+# Bump whenever get_word_info changes so checkpointed words are re-extracted
+EXTRACTOR_VERSION = 2
+
+# Which Brown corpus words become candidates
+CANDIDATE_FILTER = {
+    'min_length': 4,
+    'max_length': 12,
+    'min_count': 2,
+    'skip_most_common': 1000,
+}
+
+CHECKPOINT_PATH = "meaningful_words.checkpoint.jsonl"
+
+
+def download_corpora():
+    """Download required NLTK data that is not installed yet"""
+    ensure_nltk_data("words", "brown", "wordnet", "cmudict", "averaged_perceptron_tagger")
 
 
 def get_word_info(word):
@@ -34,20 +57,17 @@ def get_word_info(word):
     }
     pos = pos_map.get(main_synset.pos(), 'unknown')
 
-    # Get synonyms (lemmas from all synsets)
+    # Get synonyms and antonyms (lemmas from all synsets) in one traversal
     synonyms = set()
-    for syn in synsets:
-        for lemma in syn.lemmas():
-            if lemma.name() != word and '_' not in lemma.name():
-                synonyms.add(lemma.name().replace('_', ' '))
-
-    # Get antonyms
     antonyms = set()
     for syn in synsets:
         for lemma in syn.lemmas():
+            name = lemma.name()
+            if name != word and '_' not in name:
+                synonyms.add(name)
             for antonym in lemma.antonyms():
                 if '_' not in antonym.name():
-                    antonyms.add(antonym.name().replace('_', ' '))
+                    antonyms.add(antonym.name())
 
     # Get example sentence if available
     examples = []
@@ -59,15 +79,20 @@ def get_word_info(word):
         'word': word,
         'definition': definition,
         'part_of_speech': pos,
-        'synonyms': list(synonyms)[:8],  # Limit to 8 synonyms
-        'antonyms': list(antonyms)[:5],  # Limit to 5 antonyms
+        # Sorted so every worker process picks the same subset
+        'synonyms': sorted(synonyms)[:8],  # Limit to 8 synonyms
+        'antonyms': sorted(antonyms)[:5],  # Limit to 5 antonyms
         'examples': examples[:1]  # One example
     }
 
 
-def main():
-    print("🔄 Loading word datasets...")
+def is_meaningful(word_info):
+    """Keep only words with a good definition"""
+    return word_info is not None and len(word_info['definition']) > 10
 
+
+def load_candidates(seed=None):
+    """Collect candidate words from the Brown corpus in a reproducible shuffled order"""
     # Get all English words
     all_words = set(word.lower() for word in words.words())
 
@@ -77,8 +102,8 @@ def main():
 
     # Get words that appear in Brown corpus (so they're real/used words)
     # but not the most common 1000 (so they're educational)
-    most_common = set([word for word, _ in brown_freq.most_common(1000)])
-    used_words = set([word for word, count in brown_freq.items() if count >= 2])
+    most_common = set([word for word, _ in brown_freq.most_common(CANDIDATE_FILTER['skip_most_common'])])
+    used_words = set([word for word, count in brown_freq.items() if count >= CANDIDATE_FILTER['min_count']])
 
     # Target words: used in real text but not super common
     target_words = used_words - most_common
@@ -87,39 +112,190 @@ def main():
     candidates = []
     for word in target_words:
         if (word.isalpha() and
-                len(word) >= 4 and
-                len(word) <= 12 and
+                len(word) >= CANDIDATE_FILTER['min_length'] and
+                len(word) <= CANDIDATE_FILTER['max_length'] and
                 word in all_words):
             candidates.append(word)
 
-    print(f"🔍 Found {len(candidates)} candidate words")
-    print("📝 Processing words and gathering definitions...")
+    # Sort first so the shuffle only depends on the seed, not on set ordering
+    candidates.sort()
+    random.Random(seed).shuffle(candidates)
+    return candidates
 
-    # Shuffle to get variety
-    random.shuffle(candidates)
 
-    meaningful_words = []
-    processed = 0
+def extraction_source():
+    """Fingerprint of everything a checkpointed word depends on.
+
+    The candidate filter is left out: it only decides which words are looked
+    up, not what get_word_info returns for one, so changing it reuses every
+    recorded word that is still a candidate.
+    """
+    return source_fingerprint(wordnet.get_version(), EXTRACTOR_VERSION)
+
+
+def init_worker():
+    """Load WordNet once per worker process instead of on the first lookup"""
+    wordnet.ensure_loaded()
+
 
-    for word in candidates:
-        if len(meaningful_words) >= 3000:
-            break
+class ProgressReporter:
+    """Single-line progress with rate and ETA, redrawn at most every `interval` seconds"""
 
-        processed += 1
-        if processed % 100 == 0:
-            print(f"   Processed {processed} words, found {len(meaningful_words)} meaningful ones...")
+    def __init__(self, total, target, interval=0.5):
+        self.total = total
+        self.target = target
+        self.target_label = "all" if target == float("inf") else target
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = 0.0
 
-        word_info = get_word_info(word)
+    def update(self, processed, found, force=False):
+        now = time.perf_counter()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        elapsed = now - self.started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        remaining = min(self.total - processed, (self.target - found) * processed / max(found, 1))
+        eta = remaining / rate if rate > 0 else 0.0
+        sys.stdout.write(f"\r   {processed}/{self.total} processed, {found}/{self.target_label} meaningful, "
+                         f"{rate:.0f} words/s, ETA {eta:.0f}s ")
+        sys.stdout.flush()
 
-        if word_info and len(word_info['definition']) > 10:  # Must have good definition
-            meaningful_words.append(word_info)
+    def finish(self, processed, found):
+        self.update(processed, found, force=True)
+        sys.stdout.write("\n")
 
-    # Sort alphabetically
-    meaningful_words.sort(key=lambda x: x['word'])
 
-    # Save to JSON file
-    with open("meaningful_words_3k.json", "w", encoding='utf-8') as f:
-        json.dump(meaningful_words, f, indent=2, ensure_ascii=False)
+def extract_words(candidates, target, workers=1, chunk_size=64, checkpoint=None):
+    """Run get_word_info over candidates until `target` meaningful words are found.
+
+    Results come back in candidate order whatever the worker count, so the
+    same candidate order always yields the same words. With a checkpoint log,
+    words already in it are reused and every newly extracted word is appended.
+    """
+    meaningful_words = []
+    progress = ProgressReporter(len(candidates), target)
+    processed = 0
+
+    pending = candidates
+    if checkpoint is not None:
+        pending = [word for word in candidates if word not in checkpoint]
+
+    if workers <= 1:
+        results = map(get_word_info, pending)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=init_worker)
+        results = pool.imap(get_word_info, pending, chunksize=chunk_size)
+
+    try:
+        for word in candidates:
+            if checkpoint is not None and word in checkpoint:
+                word_info = checkpoint.get(word)
+            else:
+                word_info = next(results)
+                if checkpoint is not None:
+                    checkpoint.append(word, word_info)
+
+            processed += 1
+            if is_meaningful(word_info):
+                meaningful_words.append(word_info)
+            progress.update(processed, len(meaningful_words))
+            if len(meaningful_words) >= target:
+                break
+    finally:
+        if pool is not None:
+            # Drop any chunks still in flight once the target is reached
+            pool.terminate()
+            pool.join()
+
+    progress.finish(processed, len(meaningful_words))
+    return meaningful_words
+
+
+def parse_target(value):
+    """Parse --target: a positive word count or 'all'"""
+    if value == "all":
+        return float("inf")
+    count = int(value)
+    if count <= 0:
+        raise argparse.ArgumentTypeError("target must be a positive number or 'all'")
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the meaningful words database from WordNet")
+    parser.add_argument("--target", type=parse_target, default=3000,
+                        help="number of meaningful words to collect, or 'all' (default: 3000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="extraction processes; 1 runs in-process (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="candidates handed to a worker at a time (default: 64)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="shuffle seed for a reproducible word selection")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse and extend the checkpoint log so interrupted runs resume "
+                             "(with the shuffle seed the log was started with)")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH,
+                        help=f"checkpoint log for --incremental (default: {CHECKPOINT_PATH})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    download_corpora()
+
+    seed = args.seed
+    checkpoint = None
+    if args.incremental:
+        checkpoint = CheckpointLog(args.checkpoint, extraction_source())
+        checkpoint.open()
+        print(f"♻️ Reusing {len(checkpoint.records)} checkpointed words from {args.checkpoint}")
+
+        # A resumed run must shuffle the candidates exactly like the interrupted one
+        if seed is None:
+            seed = checkpoint.settings.get('seed')
+            if seed is not None:
+                print(f"🎲 Resuming with shuffle seed {seed} from the checkpoint")
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        if checkpoint.settings.get('seed') != seed:
+            checkpoint.save_settings(seed=seed)
+
+    try:
+        print("🔄 Loading word datasets...")
+        candidates = load_candidates(seed)
+
+        print(f"🔍 Found {len(candidates)} candidate words")
+        print(f"📝 Processing words and gathering definitions with {args.workers} worker(s)...")
+
+        meaningful_words = extract_words(candidates, args.target, args.workers, args.chunk_size, checkpoint)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    # Sort alphabetically, in the same order as the binary store so row-aligned files match both
+    meaningful_words.sort(key=lambda x: normalize_key(x['word']))
+
+    # Pronunciations from the local CMU dictionary; sound-alike keys are computed at load time
+    pronounced = add_phonetic_fields(meaningful_words, load_pronunciation_lexicon())
+    print(f"🔊 Found pronunciations for {pronounced} of {len(meaningful_words)} words")
+
+    # Save to JSON file, for readers that still expect the array
+    atomic_write_json("meaningful_words_3k.json", meaningful_words, indent=2, ensure_ascii=False)
+
+    # And as NDJSON, one entry per line; written second so the app prefers it as the fresher copy
+    write_ndjson("meaningful_words_3k.ndjson", meaningful_words)
+
+    # Compact binary copy that app.py memory-maps instead of parsing the JSON
+    write_word_store(meaningful_words, "meaningful_words_3k.wdb")
+
+    # Inverted index over definitions and examples for search by meaning
+    build_reverse_index(meaningful_words, "meaningful_words_3k.rdx")
+
+    # One embedding row per word, in database order, for "similar words"
+    write_embeddings(compute_embeddings(meaningful_words), "meaningful_words_3k.npy")
 
     # Create a summary file
     summary = {
@@ -135,8 +311,7 @@ def main():
         pos = word_info['part_of_speech']
         summary['parts_of_speech'][pos] = summary['parts_of_speech'].get(pos, 0) + 1
 
-    with open("word_summary.json", "w", encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    atomic_write_json("word_summary.json", summary, indent=2, ensure_ascii=False)
 
     print(f"✅ Generated {len(meaningful_words)} meaningful words!")
     print(f"📊 Parts of speech breakdown:")
@@ -144,7 +319,7 @@ def main():
         print(f"   {pos}: {count} words")
     print(f"📈 Average synonyms per word: {summary['avg_synonyms']:.1f}")
     print(f"📉 Average antonyms per word: {summary['avg_antonyms']:.1f}")
-    print(f"💾 Saved to: meaningful_words_3k.json")
+    print(f"💾 Saved to: meaningful_words_3k.json, .ndjson, .wdb, .rdx and .npy")
     print(f"📋 Summary saved to: word_summary.json")
 
     # Show some examples
@@ -0,0 +1,255 @@
+"""Opt-in timing spans and counters for finding the slow stages of a page rerun.
+
+Tracing is off unless THESAURUS_TRACE=1 is set (app.py also turns it on
+for a session opened with ?debug=1). A trace covers one rerun of the
+script; code anywhere in the rerun's thread records into it through the
+module-level helpers:
+
+    start_trace()
+    with span("prefix_search"):
+        ...
+    count("word_card.elements")
+    trace = finish_trace()
+
+With no active trace, span() returns a shared no-op context manager and
+count() returns at once, so instrumented code costs a thread-local lookup
+per call. Finished traces are added to the process-wide `metrics` totals;
+both export as JSON or Prometheus text.
+"""
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+TRACE_ENV_VAR = "THESAURUS_TRACE"
+METRIC_PREFIX = "thesaurus"
+
+# One timed stage: offsets from the start of the trace, nesting depth
+Span = namedtuple('Span', ['name', 'start', 'duration', 'depth'])
+
+
+class _ThreadState(threading.local):
+    # A class-level default keeps the lookup cheap when no trace was ever started
+    trace = None
+
+
+_local = _ThreadState()
+
+
+def tracing_enabled():
+    """Whether tracing is switched on for the whole process."""
+    return os.environ.get(TRACE_ENV_VAR, "") not in ("", "0")
+
+
+class _NullSpan:
+    """Context manager that does nothing, shared by every span while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _SpanTimer:
+    __slots__ = ('trace', 'name', 'depth', 'started')
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.depth = self.trace._depth
+        self.trace._depth += 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        finished = time.perf_counter()
+        trace = self.trace
+        trace._depth -= 1
+        trace.spans.append(Span(self.name, self.started - trace._origin, finished - self.started, self.depth))
+        return False
+
+
+class Trace:
+    """Spans and counters recorded during one rerun."""
+
+    def __init__(self, name="rerun"):
+        self.name = name
+        self.started_at = time.time()
+        self.spans = []
+        self.counters = {}
+        self.duration = None
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def span(self, name):
+        return _SpanTimer(self, name)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def finish(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._origin
+        return self
+
+    def ordered_spans(self):
+        """Spans in start order, so children follow their parent."""
+        return sorted(self.spans, key=lambda recorded: (recorded.start, recorded.depth))
+
+    def untraced(self):
+        """Seconds of the rerun not covered by any top-level span."""
+        covered = sum(recorded.duration for recorded in self.spans if recorded.depth == 0)
+        return max(0.0, (self.duration or 0.0) - covered)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'started_at': self.started_at,
+            'duration_ms': round((self.duration or 0.0) * 1000, 3),
+            'untraced_ms': round(self.untraced() * 1000, 3),
+            'spans': [
+                {
+                    'name': recorded.name,
+                    'start_ms': round(recorded.start * 1000, 3),
+                    'duration_ms': round(recorded.duration * 1000, 3),
+                    'depth': recorded.depth,
+                }
+                for recorded in self.ordered_spans()
+            ],
+            'counters': dict(self.counters),
+        }
+
+    def to_json(self, **dump_kwargs):
+        return json.dumps(self.to_dict(), **dump_kwargs)
+
+
+class Metrics:
+    """Totals over every finished trace in the process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.traces = 0
+            self.trace_seconds = 0.0
+            self.span_calls = {}
+            self.span_seconds = {}
+            self.counters = {}
+
+    def record(self, trace):
+        with self._lock:
+            self.traces += 1
+            self.trace_seconds += trace.duration or 0.0
+            for recorded in trace.spans:
+                self.span_calls[recorded.name] = self.span_calls.get(recorded.name, 0) + 1
+                self.span_seconds[recorded.name] = self.span_seconds.get(recorded.name, 0.0) + recorded.duration
+            for name, value in trace.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'traces': self.traces,
+                'trace_seconds': self.trace_seconds,
+                'span_calls': dict(self.span_calls),
+                'span_seconds': dict(self.span_seconds),
+                'counters': dict(self.counters),
+            }
+
+
+# Shared by every session in the process
+metrics = Metrics()
+
+
+def start_trace(enabled=None, name="rerun"):
+    """Begin a trace for the current thread; returns it, or None when tracing is off."""
+    if enabled is None:
+        enabled = tracing_enabled()
+    trace = Trace(name) if enabled else None
+    _local.trace = trace
+    return trace
+
+
+def current_trace():
+    return _local.trace
+
+
+def finish_trace():
+    """End the current thread's trace, add it to `metrics` and return it (None when off)."""
+    trace = _local.trace
+    _local.trace = None
+    if trace is not None:
+        metrics.record(trace.finish())
+    return trace
+
+
+def span(name):
+    """Time a block as a stage of the current trace."""
+    trace = _local.trace
+    if trace is None:
+        return _NULL_SPAN
+    return trace.span(name)
+
+
+def count(name, value=1):
+    """Add to a counter of the current trace."""
+    trace = _local.trace
+    if trace is not None:
+        trace.count(name, value)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _metric_name(name):
+    return "".join(character if character.isalnum() else "_" for character in name)
+
+
+def prometheus_text(trace=None, prefix=METRIC_PREFIX):
+    """Prometheus text exposition of the process totals and, if given, one trace's spans."""
+    totals = metrics.to_dict()
+    lines = [
+        f"# HELP {prefix}_traces_total Reruns traced.",
+        f"# TYPE {prefix}_traces_total counter",
+        f"{prefix}_traces_total {totals['traces']}",
+        f"# HELP {prefix}_trace_seconds_total Time spent in traced reruns.",
+        f"# TYPE {prefix}_trace_seconds_total counter",
+        f"{prefix}_trace_seconds_total {totals['trace_seconds']:.6f}",
+        f"# HELP {prefix}_span_calls_total Times each stage ran.",
+        f"# TYPE {prefix}_span_calls_total counter",
+    ]
+    for name, calls in sorted(totals['span_calls'].items()):
+        lines.append(f'{prefix}_span_calls_total{{span="{_label(name)}"}} {calls}')
+    lines += [
+        f"# HELP {prefix}_span_seconds_total Time spent in each stage.",
+        f"# TYPE {prefix}_span_seconds_total counter",
+    ]
+    for name, seconds in sorted(totals['span_seconds'].items()):
+        lines.append(f'{prefix}_span_seconds_total{{span="{_label(name)}"}} {seconds:.6f}')
+    for name, value in sorted(totals['counters'].items()):
+        metric = f"{prefix}_{_metric_name(name)}_total"
+        lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+    if trace is not None:
+        lines += [
+            f"# HELP {prefix}_last_span_seconds Stage durations of the latest rerun.",
+            f"# TYPE {prefix}_last_span_seconds gauge",
+        ]
+        last = {}
+        for recorded in trace.spans:
+            last[recorded.name] = last.get(recorded.name, 0.0) + recorded.duration
+        for name, seconds in sorted(last.items()):
+            lines.append(f'{prefix}_last_span_seconds{{span="{_label(name)}"}} {seconds:.6f}')
+    return "\n".join(lines) + "\n"
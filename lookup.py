@@ -1,45 +1,83 @@
-from SpeechToText import listen_and_convert
-from nltk.corpus import wordnet as wn
-from fuzzywuzzy import process
-import nltk
-import json
-
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-
-# Load your uncommon words (make sure it's a .json or .txt with a list)
-with open("uncommon_words_list.txt", "r") as f:
-    uncommon_words = json.load(f)
-
-def get_closest_word(input_word, word_list, threshold=80):
-    match, score = process.extractOne(input_word, word_list)
-    if score >= threshold:
-        return match
-    return None
+from SpeechToText import listen_for_alternatives
+from recognizers import create_recognizer
 
-def get_synonyms_antonyms(word):
-    synonyms = set()
-    antonyms = set()
+from functools import lru_cache
+
+from dataset_io import iter_records
+from fuzzy_index import FuzzyIndex
+from result_cache import ResultCache
+from vocabulary_snapper import VocabularySnapper
+from word_index import build_word_index, database_version, lookup_word, normalize_key
+from wordnet_snapshot import load_snapshot
+
+UNCOMMON_WORDS_PATH = "uncommon_words_list.txt"
+
+# Load your uncommon words (a JSON array, or NDJSON with one word per line)
+uncommon_words = list(iter_records(UNCOMMON_WORDS_PATH))
+uncommon_version = database_version(UNCOMMON_WORDS_PATH)
+uncommon_index = build_word_index(uncommon_words)
+
+# Minimum combined spelling/sound score for a voice query to count as a hit
+VOICE_SNAP_THRESHOLD = 70
+
+# Closest-word results for repeated (mis)spellings
+closest_word_cache = ResultCache(maxsize=4096, ttl=3600)
 
-    for syn in wn.synsets(word):
-        for lemma in syn.lemmas():
-            synonyms.add(lemma.name().replace("_", " "))
-            if lemma.antonyms():
-                antonyms.update([a.name().replace("_", " ") for a in lemma.antonyms()])
+@lru_cache(maxsize=1)
+def get_uncommon_fuzzy_index():
+    """Deletion index over the uncommon words, built on first use."""
+    return FuzzyIndex(uncommon_words)
 
-    return sorted(synonyms), sorted(antonyms)
+@lru_cache(maxsize=1)
+def get_uncommon_snapper():
+    """Voice transcript snapper over the uncommon words, built on first use."""
+    return VocabularySnapper(uncommon_words, get_uncommon_fuzzy_index())
+
+def get_closest_word(input_word, word_list, threshold=80, word_index=None, version=None, *, fuzzy_index=None):
+    # Without an index, the uncommon word list uses its shared one and other lists get their own
+    if fuzzy_index is None:
+        fuzzy_index = get_uncommon_fuzzy_index() if word_list is uncommon_words else FuzzyIndex(word_list)
+
+    # Results are cached per word list version when one is given
+    if version is not None:
+        return closest_word_cache.get_or_compute(
+            (normalize_key(input_word), threshold), version,
+            lambda: get_closest_word(input_word, word_list, threshold, word_index, fuzzy_index=fuzzy_index),
+        )
+
+    # Exact hits skip the fuzzy scan entirely
+    if word_index is not None:
+        exact = lookup_word(input_word, word_list, word_index)
+        if exact is not None:
+            return exact
+
+    suggestions = fuzzy_index.suggest(input_word, limit=1, threshold=threshold)
+    if suggestions:
+        return word_list[suggestions[0].position]
+    return None
+
+def get_synonyms_antonyms(word):
+    entry = load_snapshot().lookup(word)
+    if entry is None:
+        return [], []
+    return entry['synonyms'], entry['antonyms']
 
 def get_definitions(word):
-    definitions = []
-    for syn in wn.synsets(word):
-        definitions.append(syn.definition())
-    return definitions
+    entry = load_snapshot().lookup(word)
+    if entry is None:
+        return []
+    return entry['definitions']
 
 if __name__ == "__main__":
-    word = listen_and_convert()
-    if word:
-        closest = get_closest_word(word, uncommon_words)
+    # Offline recognition, when available, only listens for the uncommon words
+    alternatives = listen_for_alternatives(create_recognizer(uncommon_words))
+    if alternatives:
+        # Snap every n-best transcript onto the vocabulary, not just the top one
+        snaps = get_uncommon_snapper().snap(alternatives, limit=3, threshold=VOICE_SNAP_THRESHOLD)
+        closest = uncommon_words[snaps[0].position] if snaps else None
         if closest:
+            if len(snaps) > 1:
+                print("🔁 Other candidates:", ", ".join(snap.word for snap in snaps[1:]))
             print(f"\n🔍 Interpreted word: {closest}")
             syns, ants = get_synonyms_antonyms(closest)
             defs = get_definitions(closest)
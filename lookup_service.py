@@ -0,0 +1,240 @@
+"""Headless HTTP lookup service for the thesaurus core.
+
+Serves exact lookup, prefix search, "did you mean" suggestions and bulk
+lookup as JSON, using the same search functions as app.py. Each worker
+process holds one set of indexes; with the binary word store (.wdb) the
+database itself is memory-mapped and shared by all workers.
+
+Usage:
+
+    python lookup_service.py [--host 0.0.0.0] [--port 8080] [--workers 4]
+
+Endpoints:
+
+    GET  /lookup?word=aberrant
+    GET  /prefix?q=ab&limit=15
+    GET  /suggest?q=aberant&limit=5&threshold=70
+    GET  /sounds-like?word=knight&limit=8
+    GET  /reverse?q=deviating+from+the+norm&limit=10
+    GET  /similar?word=aberrant&limit=8   (503 until the embedding .npy is written)
+    POST /bulk        {"words": ["aberrant", "abbots"], "suggestion_limit": 3}
+    GET  /health
+"""
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+
+from aiohttp import web
+
+from embeddings import open_prebuilt_embedding_index
+from fuzzy_index import FuzzyIndex
+from phonetics import PhoneticIndex
+from reverse_index import open_reverse_index
+from word_index import build_prefix_index, build_word_index, database_version, normalize_key
+from word_search import (bulk_lookup, companion_path, find_exact_word, find_similar_words, find_sound_alikes,
+                         load_lemmatizer, read_word_database, resolve_database_path, reverse_lookup,
+                         search_words_starting_with, suggestion_cache)
+
+# Upper bound on words per bulk request, so one request cannot stall a worker
+MAX_BULK_WORDS = 10000
+
+
+def entry_json(entry):
+    """Plain-dict form of a database entry for JSON responses."""
+    if entry is None:
+        return None
+    if hasattr(entry, 'to_dict'):
+        return entry.to_dict()
+    return dict(entry)
+
+
+def int_param(request, name, default, minimum=0, maximum=None):
+    """Read an integer query parameter, answering 400 when it is malformed."""
+    raw = request.query.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise web.HTTPBadRequest(text=f"'{name}' must be an integer")
+    if value < minimum or (maximum is not None and value > maximum):
+        raise web.HTTPBadRequest(text=f"'{name}' is out of range")
+    return value
+
+
+class LookupService:
+    """Request handlers over one in-memory set of indexes."""
+
+    def __init__(self, database_path):
+        self.database_path = database_path
+        self.db_version = database_version(database_path)
+        self.word_database = read_word_database(database_path)
+        self.word_index = build_word_index(self.word_database)
+        self.prefix_index = build_prefix_index(self.word_database)
+        self.fuzzy_index = FuzzyIndex(self.word_database)
+        self.phonetic_index = PhoneticIndex(self.word_database)
+        self.reverse_index = open_reverse_index(companion_path(database_path, ".rdx"), database_path,
+                                                self.word_database)
+        # Loaded before any executor thread can race the lazy WordNet load
+        self.lemmatizing = load_lemmatizer()
+        # Never computed here: each worker would build its own LSA model. None until the .npy is written
+        self.embedding_index = open_prebuilt_embedding_index(companion_path(database_path, ".npy"), database_path,
+                                                             self.word_database)
+
+    async def health(self, request):
+        return web.json_response({
+            "status": "ok",
+            "database": self.database_path,
+            "words": len(self.word_database),
+            "pid": os.getpid(),
+        })
+
+    async def lookup(self, request):
+        word = request.query.get("word", "")
+        entry = find_exact_word(word, self.word_database, self.word_index)
+        if entry is None:
+            raise web.HTTPNotFound(text=f"'{word}' is not in the thesaurus")
+        return web.json_response(entry_json(entry))
+
+    async def prefix(self, request):
+        prefix = request.query.get("q", "")
+        limit = int_param(request, "limit", 15, maximum=1000)
+        matches, total = search_words_starting_with(prefix, self.word_database, self.prefix_index, limit)
+        return web.json_response({
+            "prefix": prefix,
+            "total": total,
+            "words": [word_data['word'] for word_data in matches],
+        })
+
+    async def suggest(self, request):
+        query = request.query.get("q", "")
+        limit = int_param(request, "limit", 5, maximum=100)
+        threshold = int_param(request, "threshold", 70, maximum=100)
+        # Shared with the other "did you mean" lookups, keyed on the query's case-folded form
+        suggestions = suggestion_cache.get_or_compute(
+            (normalize_key(query), threshold, limit), self.db_version,
+            lambda: self.fuzzy_index.suggest(query, limit=limit, threshold=threshold),
+        )
+        return web.json_response({
+            "query": query,
+            "suggestions": [{"word": suggestion.word, "score": suggestion.score} for suggestion in suggestions],
+        })
+
+    async def sounds_like(self, request):
+        word = request.query.get("word", "")
+        limit = int_param(request, "limit", 8, maximum=100)
+        matches = find_sound_alikes(word, self.word_database, self.phonetic_index, limit)
+        return web.json_response({
+            "word": word,
+            "words": [word_data['word'] for word_data in matches],
+        })
+
+    async def reverse(self, request):
+        query = request.query.get("q", "")
+        limit = int_param(request, "limit", 10, maximum=100)
+        matches = reverse_lookup(query, self.reverse_index, self.word_database, self.word_index, limit)
+        return web.json_response({
+            "query": query,
+            "matches": [{"word": word_data['word'], "score": score} for word_data, score in matches],
+        })
+
+    async def similar(self, request):
+        word = request.query.get("word", "")
+        limit = int_param(request, "limit", 8, maximum=100)
+        if self.embedding_index is None:
+            return web.json_response({"error": "no embeddings for this database; run generate_word.py or "
+                                               "embeddings.py to write the .npy"}, status=503)
+        matches = find_similar_words(word, self.word_database, self.word_index, self.embedding_index, limit)
+        return web.json_response({
+            "word": word,
+            "matches": [{"word": word_data['word'], "score": round(score, 4)} for word_data, score in matches],
+        })
+
+    async def bulk(self, request):
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(text="body must be JSON")
+        words = payload.get("words") if isinstance(payload, dict) else None
+        if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+            raise web.HTTPBadRequest(text="'words' must be a list of strings")
+        if len(words) > MAX_BULK_WORDS:
+            return web.json_response({"error": f"at most {MAX_BULK_WORDS} words per request, got {len(words)}"},
+                                     status=413)
+
+        suggestion_limit = payload.get("suggestion_limit", 3)
+        # bool is an int subclass, so true/false must be turned away explicitly
+        if isinstance(suggestion_limit, bool) or not isinstance(suggestion_limit, int) \
+                or not 0 <= suggestion_limit <= 100:
+            raise web.HTTPBadRequest(text="'suggestion_limit' must be an integer from 0 to 100")
+
+        # Large batches and the first lemmatizer load block, so keep them off the event loop
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(bulk_lookup, words, self.word_database, self.word_index, self.fuzzy_index,
+                                    suggestion_limit=suggestion_limit, lemmatize=self.lemmatizing))
+        return web.json_response({
+            word: dict(result, entry=entry_json(result["entry"]))
+            for word, result in results.items()
+        })
+
+
+def create_app(database_path=None):
+    """Build the aiohttp application around a freshly loaded database."""
+    service = LookupService(database_path or resolve_database_path())
+    app = web.Application()
+    app.add_routes([
+        web.get("/health", service.health),
+        web.get("/lookup", service.lookup),
+        web.get("/prefix", service.prefix),
+        web.get("/suggest", service.suggest),
+        web.get("/sounds-like", service.sounds_like),
+        web.get("/reverse", service.reverse),
+        web.get("/similar", service.similar),
+        web.post("/bulk", service.bulk),
+    ])
+    return app
+
+
+def serve(host, port, database_path, reuse_port=False):
+    web.run_app(create_app(database_path), host=host, port=port, reuse_port=reuse_port,
+                print=None, access_log=None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve thesaurus lookups over HTTP")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes sharing the port via SO_REUSEPORT (default: 1)")
+    parser.add_argument("--database", default=None,
+                        help="JSON, NDJSON or .wdb database (default: the unified or generated database, "
+                             "as a binary store if it is up to date)")
+    args = parser.parse_args(argv)
+
+    database_path = args.database or resolve_database_path()
+    print(f"📘 Serving {database_path} on http://{args.host}:{args.port} with {args.workers} worker(s)")
+
+    if args.workers <= 1:
+        serve(args.host, args.port, database_path)
+        return
+
+    workers = [
+        multiprocessing.Process(target=serve, args=(args.host, args.port, database_path, True))
+        for _ in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Merge every word source into one unified database.
+
+The sources use different schemas: meaningful_words_3k.json has
+`definition`, `part_of_speech` and `examples`, words.json has `meaning`,
+and uncommon_words_list.txt is a bare list of words. Each record is
+normalized into the canonical schema, records for the same case-folded
+headword are joined, and the result is streamed out as NDJSON sorted by
+headword.
+
+The join is hash partitioned so memory stays bounded by one partition, not
+by the input:
+
+    1. stream every source, writing each canonical record to one of N
+       partition files chosen by a stable hash of its headword
+    2. load one partition at a time, merge the records of each headword and
+       write the partition's entries as a sorted run
+    3. heapq.merge the sorted runs into the output
+
+Sources are given in priority order: the first non-empty definition or part
+of speech wins, while synonyms, antonyms and examples are unioned.
+
+Usage:
+
+    python merge_corpora.py [sources ...] [--output unified_words.ndjson] [--partitions 64]
+"""
+import argparse
+import heapq
+import json
+import os
+import sys
+import tempfile
+import zlib
+from contextlib import ExitStack
+from itertools import groupby
+
+from dataset_io import iter_ndjson, iter_records, resolve_records_path, write_ndjson
+from word_index import normalize_key
+
+# Highest priority first
+DEFAULT_SOURCES = ("meaningful_words_3k.json", "words.json", "uncommon_words_list.txt")
+DEFAULT_OUTPUT = "unified_words.ndjson"
+DEFAULT_PARTITIONS = 64
+
+# Canonical record: scalar fields first, then list fields; optional scalars
+# (the phonetic layer) are only written when some source has them
+SCALAR_FIELDS = ('word', 'definition', 'part_of_speech')
+OPTIONAL_SCALAR_FIELDS = ('pronunciation', 'ipa')
+LIST_FIELDS = ('synonyms', 'antonyms', 'examples')
+# Other schemas' names for canonical fields
+FIELD_ALIASES = {'meaning': 'definition', 'pos': 'part_of_speech'}
+
+
+def canonical_record(raw):
+    """Normalize one source record (a dict in any known schema, or a bare word) into the canonical schema.
+
+    Returns None for records without a headword.
+    """
+    if isinstance(raw, str):
+        raw = {'word': raw}
+    elif not isinstance(raw, dict):
+        return None
+    raw = {FIELD_ALIASES.get(field, field): value for field, value in raw.items()}
+
+    word = raw.get('word')
+    if not isinstance(word, str) or not word.strip():
+        return None
+
+    record = {'word': word.strip()}
+    for field in SCALAR_FIELDS[1:] + OPTIONAL_SCALAR_FIELDS:
+        value = raw.get(field)
+        if isinstance(value, str) and value.strip():
+            record[field] = value.strip()
+    for field in LIST_FIELDS:
+        value = raw.get(field) or []
+        if isinstance(value, str):
+            value = [value]
+        record[field] = [item.strip() for item in value if isinstance(item, str) and item.strip()]
+    return record
+
+
+def _union(lists, exclude=None):
+    """Concatenate string lists, keeping the first spelling of each case-folded item."""
+    seen = {} if exclude is None else {exclude: None}
+    merged = []
+    for items in lists:
+        for item in items:
+            key = normalize_key(item)
+            if key not in seen:
+                seen[key] = None
+                merged.append(item)
+    return merged
+
+
+def merge_records(records):
+    """Join records for one headword, given in source priority order, into one entry."""
+    entry = {field: '' for field in SCALAR_FIELDS}
+    for record in records:
+        for field in SCALAR_FIELDS + OPTIONAL_SCALAR_FIELDS:
+            if not entry.get(field) and record.get(field):
+                entry[field] = record[field]
+
+    key = normalize_key(entry['word'])
+    # A word is not its own synonym, though WordNet-derived lists often say so
+    entry['synonyms'] = _union((record['synonyms'] for record in records), exclude=key)
+    entry['antonyms'] = _union((record['antonyms'] for record in records), exclude=key)
+    entry['examples'] = _union(record['examples'] for record in records)
+    return entry
+
+
+def _partition(key, partitions):
+    # crc32 rather than hash(), which is salted per process
+    return zlib.crc32(key.encode('utf-8')) % partitions
+
+
+def _entry_key(entry):
+    return normalize_key(entry['word'])
+
+
+def merge_corpora(sources, output_path, partitions=DEFAULT_PARTITIONS, keep_bare=False, work_dir=None):
+    """Merge the source files into `output_path` as sorted NDJSON; returns a dict of counts.
+
+    Headword-only records (the uncommon word list) are dropped unless some
+    other source defines the word, or `keep_bare` is set.
+    """
+    stats = {'input': 0, 'skipped': 0, 'merged': 0, 'duplicates': 0, 'bare': 0}
+    directory = work_dir or os.path.dirname(os.path.abspath(output_path))
+
+    with tempfile.TemporaryDirectory(dir=directory, prefix=".merge-") as temp_dir:
+        # 1. Hash-partition canonical records; the line carries the key and source rank
+        partition_paths = [os.path.join(temp_dir, f"partition-{number:04d}.ndjson") for number in range(partitions)]
+        with ExitStack() as stack:
+            partition_files = [stack.enter_context(open(path, "w", encoding='utf-8')) for path in partition_paths]
+            for rank, source in enumerate(sources):
+                for raw in iter_records(source):
+                    stats['input'] += 1
+                    record = canonical_record(raw)
+                    if record is None:
+                        stats['skipped'] += 1
+                        continue
+                    key = normalize_key(record['word'])
+                    partition_files[_partition(key, partitions)].write(
+                        json.dumps([key, rank, record], ensure_ascii=False) + "\n")
+
+        # 2. Merge each partition in memory and write it back as a sorted run
+        run_paths = []
+        for partition_path in partition_paths:
+            rows = list(iter_ndjson(partition_path))
+            os.unlink(partition_path)
+            if not rows:
+                continue
+            # Stable sort: equal ranks keep their input order
+            rows.sort(key=lambda row: (row[0], row[1]))
+            entries = []
+            for key, group in groupby(rows, key=lambda row: row[0]):
+                records = [record for _, _, record in group]
+                stats['duplicates'] += len(records) - 1
+                entry = merge_records(records)
+                if not keep_bare and not entry['definition']:
+                    stats['bare'] += 1
+                    continue
+                entries.append(entry)
+            run_path = partition_path.replace("partition-", "run-")
+            write_ndjson(run_path, entries)
+            run_paths.append(run_path)
+
+        # 3. Runs hold disjoint headwords, so a k-way merge yields the sorted output
+        with ExitStack() as stack:
+            runs = [stack.enter_context(open(path, "r", encoding='utf-8')) for path in run_paths]
+            merged = heapq.merge(*(map(json.loads, run) for run in runs), key=_entry_key)
+            stats['merged'] = write_ndjson(output_path, merged)
+    return stats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Merge word sources into one unified database")
+    parser.add_argument("sources", nargs="*", default=list(DEFAULT_SOURCES),
+                        help="JSON array or NDJSON sources, highest priority first "
+                             f"(default: {' '.join(DEFAULT_SOURCES)})")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help=f"NDJSON output; app.py serves it when present (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS,
+                        help=f"hash partitions; memory is bounded by one (default: {DEFAULT_PARTITIONS})")
+    parser.add_argument("--keep-bare", action="store_true",
+                        help="keep words no source defines, such as most of the uncommon word list")
+    parser.add_argument("--store", action="store_true",
+                        help="also build the binary word store next to the output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.partitions < 1:
+        sys.exit("--partitions must be at least 1")
+
+    sources = []
+    for source in args.sources:
+        path = resolve_records_path(source)
+        if os.path.exists(path):
+            sources.append(path)
+        else:
+            print(f"⚠️ Skipping missing source {source}")
+    if not sources:
+        sys.exit("no sources to merge")
+
+    print(f"🔀 Merging {', '.join(sources)} into {args.output}")
+    stats = merge_corpora(sources, args.output, args.partitions, args.keep_bare)
+    print(f"📥 Read {stats['input']} records ({stats['skipped']} without a headword)")
+    print(f"🧬 Joined {stats['duplicates']} duplicate records; dropped {stats['bare']} undefined words")
+    print(f"💾 Wrote {stats['merged']} entries to {args.output}")
+
+    if args.store:
+        # The word store is built in memory; skip it for very large merges
+        from word_store import write_word_store
+
+        store_path = os.path.splitext(args.output)[0] + ".wdb"
+        write_word_store(list(iter_records(args.output)), store_path)
+        print(f"💾 Wrote the binary word store to {store_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import threading
+
+# Where nltk.data.find looks for each downloadable package
+RESOURCE_PATHS = {
+    'wordnet': 'corpora/wordnet',
+    'omw-1.4': 'corpora/omw-1.4',
+    'words': 'corpora/words',
+    'brown': 'corpora/brown',
+    'cmudict': 'corpora/cmudict',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+}
+
+_ready = set()
+_lock = threading.Lock()
+
+
+def ensure_nltk_data(*packages):
+    """Make sure NLTK data packages are installed, checking each once per process.
+
+    nltk itself is only imported here, on first use. Missing packages are
+    downloaded; returns False if any of them could not be.
+    """
+    with _lock:
+        missing = [package for package in packages if package not in _ready]
+        if not missing:
+            return True
+
+        import nltk
+
+        available = True
+        for package in missing:
+            try:
+                nltk.data.find(RESOURCE_PATHS.get(package, f'corpora/{package}'))
+            except LookupError:
+                print(f"Downloading NLTK data '{package}'...")
+                if not nltk.download(package, quiet=True):
+                    print(f"Failed to download NLTK data '{package}'")
+                    available = False
+                    continue
+            _ready.add(package)
+        return available
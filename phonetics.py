@@ -0,0 +1,252 @@
+"""Pronunciations and phonetic keys for matching words by sound rather than spelling."""
+import sys
+
+from dataset_io import atomic_write_json, is_ndjson, iter_records, write_ndjson
+from fuzzy_index import similarity_ratio
+from nltk_setup import ensure_nltk_data
+from word_index import headwords, normalize_key
+
+# Database fields filled in by add_phonetic_fields. Metaphone and Soundex
+# keys are not stored: PhoneticIndex computes them from the headwords
+PHONETIC_FIELDS = ('pronunciation', 'ipa')
+# Soundex keys collide far more often than Metaphone ones ("aberrant" and
+# "apron" are both A165), so a Soundex-only match must also be spelled alike
+SOUNDEX_MIN_SIMILARITY = 60
+
+# CMU ARPAbet phones; unstressed AH and ER get their reduced vowels
+ARPABET_TO_IPA = {
+    'AA': 'ɑ', 'AE': 'æ', 'AH': 'ʌ', 'AH0': 'ə', 'AO': 'ɔ', 'AW': 'aʊ', 'AY': 'aɪ',
+    'B': 'b', 'CH': 'tʃ', 'D': 'd', 'DH': 'ð', 'EH': 'ɛ', 'ER': 'ɝ', 'ER0': 'ɚ',
+    'EY': 'eɪ', 'F': 'f', 'G': 'ɡ', 'HH': 'h', 'IH': 'ɪ', 'IY': 'i', 'JH': 'dʒ',
+    'K': 'k', 'L': 'l', 'M': 'm', 'N': 'n', 'NG': 'ŋ', 'OW': 'oʊ', 'OY': 'ɔɪ',
+    'P': 'p', 'R': 'ɹ', 'S': 's', 'SH': 'ʃ', 'T': 't', 'TH': 'θ', 'UH': 'ʊ',
+    'UW': 'u', 'V': 'v', 'W': 'w', 'Y': 'j', 'Z': 'z', 'ZH': 'ʒ',
+}
+_STRESS_MARKS = {'1': 'ˈ', '2': 'ˌ'}
+
+_SOUNDEX_CODES = {}
+for _letters, _code in (("BFPV", "1"), ("CGJKQSXZ", "2"), ("DT", "3"), ("L", "4"), ("MN", "5"), ("R", "6")):
+    for _letter in _letters:
+        _SOUNDEX_CODES[_letter] = _code
+
+_VOWELS = frozenset("AEIOU")
+_FRONT_VOWELS = frozenset("EIY")
+_INITIAL_SKIPS = {"AE": "E", "GN": "N", "KN": "N", "PN": "N", "WR": "R"}
+
+
+def _letters(word):
+    return "".join(char for char in word.upper() if "A" <= char <= "Z")
+
+
+def soundex(word):
+    """American Soundex: the first letter plus three digits, e.g. 'R163' for 'Robert'."""
+    letters = _letters(word)
+    if not letters:
+        return ""
+    code = [letters[0]]
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code.append(digit)
+            if len(code) == 4:
+                break
+        # H and W do not separate letters with the same code; vowels do
+        if char not in "HW":
+            previous = digit
+    return "".join(code).ljust(4, "0")
+
+
+def metaphone(word):
+    """Original Metaphone key (Philips, 1990), e.g. 'NT' for 'knight'.
+
+    '0' stands for 'th' and 'X' for 'sh'; vowels are only kept at the start.
+    """
+    letters = _letters(word)
+    if not letters:
+        return ""
+    if letters[:2] in _INITIAL_SKIPS:
+        letters = _INITIAL_SKIPS[letters[:2]] + letters[2:]
+    elif letters[0] == "X":
+        letters = "S" + letters[1:]
+    elif letters[:2] == "WH":
+        letters = "W" + letters[2:]
+
+    key = []
+    length = len(letters)
+    for i, char in enumerate(letters):
+        before = letters[i - 1] if i > 0 else ""
+        after = letters[i + 1] if i + 1 < length else ""
+        after_next = letters[i + 2] if i + 2 < length else ""
+
+        if char == before and char != "C":
+            continue
+        if char in _VOWELS:
+            if i == 0:
+                key.append(char)
+        elif char == "B":
+            if not (before == "M" and i == length - 1):
+                key.append("B")
+        elif char == "C":
+            if after == "I" and after_next == "A":
+                key.append("X")
+            elif after == "H":
+                key.append("K" if before == "S" else "X")
+            elif after in _FRONT_VOWELS:
+                if before != "S":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif char == "D":
+            key.append("J" if after == "G" and after_next in _FRONT_VOWELS else "T")
+        elif char == "G":
+            if after == "H" and after_next and after_next not in _VOWELS:
+                continue
+            if after == "N" and (i + 2 == length or letters[i + 2:] == "ED"):
+                continue
+            if before == "D" and after in _FRONT_VOWELS:
+                continue
+            key.append("J" if after in _FRONT_VOWELS and before != "G" else "K")
+        elif char == "H":
+            if before and before in "CSPTG":
+                continue
+            if before in _VOWELS and after not in _VOWELS:
+                continue
+            key.append("H")
+        elif char == "K":
+            if before != "C":
+                key.append("K")
+        elif char == "P":
+            key.append("F" if after == "H" else "P")
+        elif char == "Q":
+            key.append("K")
+        elif char == "S":
+            if after == "H" or (after == "I" and after_next in "OA" and after_next):
+                key.append("X")
+            else:
+                key.append("S")
+        elif char == "T":
+            if after == "I" and after_next in "OA" and after_next:
+                key.append("X")
+            elif after == "H":
+                key.append("0")
+            elif not (after == "C" and after_next == "H"):
+                key.append("T")
+        elif char == "V":
+            key.append("F")
+        elif char in "WY":
+            if after in _VOWELS:
+                key.append(char)
+        elif char == "X":
+            key.append("KS")
+        elif char == "Z":
+            key.append("S")
+        else:
+            key.append(char)
+    return "".join(key)
+
+
+def arpabet_to_ipa(phones):
+    """Convert a list of ARPAbet phones to IPA, marking stress before the stressed vowel."""
+    ipa = []
+    for phone in phones:
+        stress = phone[-1] if phone[-1].isdigit() else ''
+        base = phone.rstrip('012')
+        ipa.append(_STRESS_MARKS.get(stress, ''))
+        ipa.append(ARPABET_TO_IPA.get(base + stress, ARPABET_TO_IPA.get(base, base.lower())))
+    return ''.join(ipa)
+
+
+def load_pronunciation_lexicon():
+    """The local CMU Pronouncing Dictionary as {word: [phones, ...]}, or {} if unavailable."""
+    if not ensure_nltk_data('cmudict'):
+        return {}
+    from nltk.corpus import cmudict
+    return cmudict.dict()
+
+
+def phonetic_fields(word, lexicon):
+    """Pronunciation of `word` from `lexicon`, in ARPAbet and IPA; empty strings if it is not listed."""
+    pronunciations = lexicon.get(normalize_key(word))
+    phones = pronunciations[0] if pronunciations else None
+    return {
+        'pronunciation': ' '.join(phones) if phones else '',
+        'ipa': arpabet_to_ipa(phones) if phones else '',
+    }
+
+
+def add_phonetic_fields(entries, lexicon):
+    """Fill in PHONETIC_FIELDS on each entry dict; returns how many have a pronunciation."""
+    pronounced = 0
+    for entry in entries:
+        entry.update(phonetic_fields(entry['word'], lexicon))
+        if entry['pronunciation']:
+            pronounced += 1
+    return pronounced
+
+
+class PhoneticIndex:
+    """Buckets of word positions by Metaphone and by Soundex key.
+
+    "Sounds like" lookups are two dict lookups instead of a scan. Keys are
+    computed from the headwords alone, so a memory-mapped word store never
+    has to decode whole records while the index is built.
+    """
+
+    def __init__(self, word_list):
+        self.keys = []
+        self.metaphones = []
+        self._metaphone_buckets = {}
+        self._soundex_buckets = {}
+
+        for position, word in enumerate(headwords(word_list)):
+            metaphone_key = metaphone(word)
+            self.keys.append(normalize_key(word))
+            self.metaphones.append(metaphone_key)
+            self._metaphone_buckets.setdefault(metaphone_key, []).append(position)
+            self._soundex_buckets.setdefault(soundex(word), []).append(position)
+
+    def __len__(self):
+        return len(self.metaphones)
+
+    def metaphone_matches(self, word):
+        """Positions of words with the same Metaphone key as `word`."""
+        return self._metaphone_buckets.get(metaphone(word), ())
+
+    def soundex_matches(self, word):
+        """Positions of words with the same Soundex key as `word`."""
+        return self._soundex_buckets.get(soundex(word), ())
+
+    def sounds_like(self, word, limit=None):
+        """Positions of sound-alike words, closest spelling first within each group.
+
+        Metaphone matches come first. Words that only share the Soundex key
+        follow, and only if they score at least SOUNDEX_MIN_SIMILARITY.
+        """
+        key = normalize_key(word)
+        metaphone_positions = self.metaphone_matches(word)
+        matches = sorted(metaphone_positions, key=lambda position: -similarity_ratio(key, self.keys[position]))
+
+        seen = set(metaphone_positions)
+        soundex_only = []
+        for position in self.soundex_matches(word):
+            if position not in seen:
+                score = similarity_ratio(key, self.keys[position])
+                if score >= SOUNDEX_MIN_SIMILARITY:
+                    soundex_only.append((-score, position))
+        matches.extend(position for _, position in sorted(soundex_only))
+        return matches if limit is None else matches[:limit]
+
+
+if __name__ == "__main__":
+    # Backfill phonetic fields into an existing JSON word database
+    if len(sys.argv) != 2:
+        sys.exit("usage: python phonetics.py <words.json>")
+    database = list(iter_records(sys.argv[1]))
+    lexicon = load_pronunciation_lexicon()
+    pronounced = add_phonetic_fields(database, lexicon)
+    if is_ndjson(sys.argv[1]):
+        write_ndjson(sys.argv[1], database)
+    else:
+        atomic_write_json(sys.argv[1], database, indent=2, ensure_ascii=False)
+    print(f"🔊 Added phonetic fields to {len(database)} words ({pronounced} with a pronunciation)")
@@ -0,0 +1,156 @@
+"""Speech recognizer backends behind one interface.
+
+Every backend turns a speech_recognition.AudioData into a ranked list of
+Alternative transcripts and signals failure with the speech_recognition
+exceptions the callers already handle (UnknownValueError when nothing was
+understood, RequestError when the backend itself failed).
+
+    recognizer = create_recognizer(vocabulary=["aberrant", "abeyance"])
+    alternatives = transcribe_file("fixtures/aberrant.wav", recognizer)
+
+The offline Vosk backend is used when `vosk` is installed and a model is
+present at VOSK_MODEL_PATH; otherwise recognition falls back to the Google
+web API.
+"""
+import importlib.util
+import io
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+VOSK_MODEL_PATH = os.environ.get("VOSK_MODEL_PATH", os.path.join("models", "vosk"))
+VOSK_SAMPLE_RATE = 16000
+
+# One recognition hypothesis; confidence is None when the backend does not report it
+Alternative = namedtuple('Alternative', ['text', 'confidence'])
+
+
+def vosk_available():
+    """Whether the vosk package is installed, without paying for importing it."""
+    return importlib.util.find_spec("vosk") is not None
+
+
+def _clean(text):
+    return text.lower().strip()
+
+
+class Recognizer(ABC):
+    """Interface for speech backends."""
+
+    name = "base"
+
+    @abstractmethod
+    def recognize(self, audio, max_alternatives=5):
+        """Return up to `max_alternatives` Alternatives for `audio`, best first."""
+
+    def recognize_text(self, audio):
+        """Return only the best transcript."""
+        return self.recognize(audio, max_alternatives=1)[0].text
+
+
+class GoogleRecognizer(Recognizer):
+    """Google Web Speech API; needs network access."""
+
+    name = "google"
+
+    def __init__(self, language="en-US"):
+        import speech_recognition as sr
+
+        self.language = language
+        self._recognizer = sr.Recognizer()
+
+    def recognize(self, audio, max_alternatives=5):
+        import speech_recognition as sr
+
+        response = self._recognizer.recognize_google(audio, language=self.language, show_all=True)
+        # An empty list (not a dict) means nothing was recognized
+        if not isinstance(response, dict) or not response.get('alternative'):
+            raise sr.UnknownValueError()
+        return [
+            Alternative(_clean(candidate['transcript']), candidate.get('confidence'))
+            for candidate in response['alternative'][:max_alternatives]
+        ]
+
+
+class VoskRecognizer(Recognizer):
+    """Offline Kaldi recognition through Vosk.
+
+    With a `vocabulary`, decoding is constrained to a grammar of exactly
+    those words (plus an unknown-word token), which is both faster and far
+    more accurate for single-word queries than open dictation. Words the
+    model's lexicon does not know are dropped from the grammar by Vosk.
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path=VOSK_MODEL_PATH, vocabulary=None):
+        try:
+            import vosk
+        except ImportError:
+            raise ImportError("The offline recognizer needs the 'vosk' package: pip install vosk")
+        vosk.SetLogLevel(-1)
+
+        if not os.path.isdir(model_path):
+            raise FileNotFoundError(f"No Vosk model at '{model_path}'. Download one from "
+                                    f"https://alphacephei.com/vosk/models and unpack it there.")
+        self.model_path = model_path
+        self._vosk = vosk
+        self._model = vosk.Model(model_path)
+        self._grammar = None
+        if vocabulary is not None:
+            words = sorted({_clean(word) for word in vocabulary if word and word.strip()})
+            self._grammar = json.dumps(words + ["[unk]"], ensure_ascii=False)
+
+    def recognize(self, audio, max_alternatives=5):
+        import speech_recognition as sr
+
+        if self._grammar is None:
+            recognizer = self._vosk.KaldiRecognizer(self._model, VOSK_SAMPLE_RATE)
+        else:
+            recognizer = self._vosk.KaldiRecognizer(self._model, VOSK_SAMPLE_RATE, self._grammar)
+        recognizer.SetMaxAlternatives(max_alternatives)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2))
+        result = json.loads(recognizer.FinalResult())
+
+        alternatives = []
+        for candidate in result.get('alternatives', ()):
+            text = _clean(candidate.get('text', '').replace('[unk]', ''))
+            if text:
+                alternatives.append(Alternative(text, candidate.get('confidence')))
+        if not alternatives:
+            raise sr.UnknownValueError()
+        return alternatives
+
+
+def create_recognizer(vocabulary=None, model_path=VOSK_MODEL_PATH):
+    """Pick the offline backend when it is installed and has a model, else Google."""
+    if os.path.isdir(model_path) and vosk_available():
+        return VoskRecognizer(model_path, vocabulary)
+    return GoogleRecognizer()
+
+
+def load_audio(source):
+    """Read a WAV/AIFF/FLAC file path, bytes or binary file object into AudioData."""
+    import speech_recognition as sr
+
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with sr.AudioFile(source) as audio_file:
+        return sr.Recognizer().record(audio_file)
+
+
+def transcribe_file(source, recognizer=None, max_alternatives=5):
+    """Recognize a recorded file or WAV buffer without touching the microphone."""
+    recognizer = recognizer or create_recognizer()
+    return recognizer.recognize(load_audio(source), max_alternatives=max_alternatives)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python recognizers.py <recording.wav>")
+    backend = create_recognizer()
+    print(f"🗣 Recognizing with the {backend.name} backend...")
+    for alternative in transcribe_file(sys.argv[1], backend):
+        print(f"- {alternative.text} ({alternative.confidence})")
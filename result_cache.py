@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Bounded, thread-safe LRU cache with a TTL, tied to one data version.
+
+    Entries are dropped least-recently-used first once `maxsize` is reached
+    and expire `ttl` seconds after they were stored. Every call passes the
+    version of the data the result was computed from; when it differs from
+    the version the cache holds, the whole cache is cleared first so stale
+    results are never served. Module-level instances are shared by every
+    thread (and every Streamlit session) in the process.
+    """
+
+    def __init__(self, maxsize=4096, ttl=3600, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _check_version(self, version):
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get_or_compute(self, key, version, compute):
+        """Return the cached result for `key`, calling `compute()` on a miss.
+
+        `compute` runs outside the lock, so two threads missing the same key
+        at once may both compute it; the later result simply replaces the
+        earlier one.
+        """
+        with self._lock:
+            self._check_version(version)
+            cached = self._entries.get(key)
+            if cached is not None:
+                expires_at, value = cached
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            # The data may have changed while we were computing
+            if version == self._version:
+                self._entries[key] = (self._clock() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Counters and current size, for logging or display."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
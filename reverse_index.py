@@ -0,0 +1,303 @@
+import heapq
+import io
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter, namedtuple
+
+from dataset_io import atomic_output, iter_records
+
+# Reverse dictionary: an inverted index from definition and example words to
+# headwords, ranked with Okapi BM25. On-disk layout, integers little-endian:
+#
+#   header          HEADER struct below
+#   string offsets  (term_count + doc_count + 1) u32 byte offsets into string data
+#   string data     UTF-8 terms in sorted order, then every document's headword
+#   postings index  (term_count + 1) u32 offsets into the postings arrays
+#   postings docs   u32 document ids, grouped by term
+#   postings freqs  u32 term frequencies, parallel to the document ids
+#   doc lengths     doc_count u32 token counts
+#
+# Sections start on 8-byte boundaries. Terms are sorted so lookups can
+# bisect the file without building a dict first.
+MAGIC = b"RDX1"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sIIIdQQQQQQ")
+INDEXED_FIELDS = ('definition', 'examples')
+
+# Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = frozenset("""
+a an and are as at be been by for from has have in into is it its of on or
+that the their them they this to was were which who whom with
+""".split())
+
+_TOKEN_PATTERN = re.compile(r"[a-z]+")
+# Words that end like a plural but are the same in the singular
+_UNINFLECTED = frozenset(('series', 'species'))
+
+# A reverse dictionary hit: headword and its BM25 score
+ReverseMatch = namedtuple('ReverseMatch', ['word', 'score'])
+
+
+def _has_vowel(text):
+    return any(character in 'aeiouy' for character in text)
+
+
+def stem(token):
+    """Strip common inflections so 'horse', 'horses' and 'making', 'make' share a term.
+
+    A light Porter-style stemmer: plurals and -ing/-ed/-ly endings come off,
+    doubled consonants left behind are undoubled, a final silent 'e' is
+    dropped and a final 'y' after a consonant becomes 'i', so the base form
+    and its inflections reduce to the same stem ('use', 'used', 'using' ->
+    'us'; 'die', 'died', 'dying' -> 'di'; 'study', 'studies' -> 'studi').
+    """
+    if token in _UNINFLECTED:
+        return token
+    if len(token) > 4 and token.endswith('ies'):
+        token = token[:-3] + 'i'
+    elif len(token) > 4 and token.endswith('es') and token[:-2].endswith(('s', 'x', 'z', 'ch', 'sh')):
+        token = token[:-2]
+    elif token.endswith('s') and not token.endswith(('ss', 'us', 'is')) and len(token) > 3:
+        token = token[:-1]
+
+    if token.endswith('eed'):
+        # agreed -> agree, but need and breed stay whole
+        if _has_vowel(token[:-3]):
+            token = token[:-1]
+    else:
+        for suffix in ('ing', 'ed'):
+            base = token[:-len(suffix)]
+            # A vowel must be left over, so bed, shed and string stay whole
+            if token.endswith(suffix) and _has_vowel(base):
+                if len(base) > 2 and base[-1] == base[-2] and base[-1] not in 'aeioulsz':
+                    base = base[:-1]
+                token = base
+                break
+        else:
+            if token.endswith('ly') and len(token) > 5:
+                token = token[:-2]
+
+    if token.endswith('e') and len(token) > 2 and not token.endswith('ee'):
+        token = token[:-1]
+    if token.endswith('y') and len(token) > 1 and token[-2] not in 'aeiou':
+        token = token[:-1] + 'i'
+    return token
+
+
+def tokenize(text):
+    """Lower-cased, stemmed content words of `text`."""
+    return [stem(token) for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def document_text(entry):
+    """The indexed text of one entry: its definition and examples."""
+    parts = []
+    for field in INDEXED_FIELDS:
+        value = entry.get(field)
+        if isinstance(value, str):
+            parts.append(value)
+        elif value:
+            parts.extend(value)
+    return " ".join(parts)
+
+
+def _pad(f):
+    offset = f.tell()
+    padding = -offset % 8
+    if padding:
+        f.write(b"\0" * padding)
+    return offset + padding
+
+
+def write_reverse_index(entries, f):
+    """Tokenize every entry and write the inverted index to the binary file object `f`."""
+    headwords = []
+    doc_lengths = array('I')
+    postings = {}
+    for doc_id, entry in enumerate(entries):
+        headwords.append(entry['word'])
+        tokens = tokenize(document_text(entry))
+        doc_lengths.append(len(tokens))
+        for term, frequency in Counter(tokens).items():
+            postings.setdefault(term, []).append((doc_id, frequency))
+
+    terms = sorted(postings)
+    postings_index = array('I', [0])
+    doc_ids = array('I')
+    frequencies = array('I')
+    for term in terms:
+        for doc_id, frequency in postings[term]:
+            doc_ids.append(doc_id)
+            frequencies.append(frequency)
+        postings_index.append(len(doc_ids))
+
+    encoded = [string.encode('utf-8') for string in terms + headwords]
+    string_offsets = array('I', [0])
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    if sys.byteorder != 'little':
+        for table in (string_offsets, postings_index, doc_ids, frequencies, doc_lengths):
+            table.byteswap()
+
+    average_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+    f.write(b"\0" * HEADER.size)
+    offsets_start = _pad(f)
+    string_offsets.tofile(f)
+    data_start = f.tell()
+    for data in encoded:
+        f.write(data)
+    postings_start = _pad(f)
+    postings_index.tofile(f)
+    docs_start = _pad(f)
+    doc_ids.tofile(f)
+    freqs_start = _pad(f)
+    frequencies.tofile(f)
+    lengths_start = _pad(f)
+    doc_lengths.tofile(f)
+
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(headwords), len(terms), average_length,
+                        offsets_start, data_start, postings_start, docs_start, freqs_start, lengths_start))
+    return len(terms)
+
+
+def build_reverse_index(entries, path):
+    """Build the reverse dictionary index for `entries` at `path`, atomically."""
+    with atomic_output(path, "wb") as f:
+        return write_reverse_index(entries, f)
+
+
+class _TermView:
+    """Read-only sorted sequence of index terms."""
+
+    def __init__(self, index):
+        self._index = index
+
+    def __len__(self):
+        return self._index.term_count
+
+    def __getitem__(self, term_id):
+        return self._index._string(term_id)
+
+
+class ReverseIndex:
+    """BM25 full-text search over definitions and examples.
+
+    Opens a file written by build_reverse_index through mmap, or wraps an
+    in-memory buffer (see from_entries). Only the postings of the query
+    terms are read, so a query costs time proportional to how many
+    documents contain those terms, not to the corpus size.
+    """
+
+    def __init__(self, path=None, buffer=None):
+        self.path = path
+        self._mmap = None
+        if buffer is None:
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = self._mmap
+        self._buffer = buffer
+
+        (magic, version, self.doc_count, self.term_count, self.average_length, offsets_start,
+         data_start, postings_start, docs_start, freqs_start, lengths_start) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path or 'buffer'} is not a version {FORMAT_VERSION} reverse index")
+
+        self._data_start = data_start
+        self._string_offsets = self._u32_table(offsets_start, self.term_count + self.doc_count + 1)
+        self._postings_index = self._u32_table(postings_start, self.term_count + 1)
+        posting_count = self._postings_index[self.term_count]
+        self._doc_ids = self._u32_table(docs_start, posting_count)
+        self._frequencies = self._u32_table(freqs_start, posting_count)
+        self._doc_lengths = self._u32_table(lengths_start, self.doc_count)
+        self._terms = _TermView(self)
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Build an index in memory, for databases without a prebuilt index file."""
+        f = io.BytesIO()
+        write_reverse_index(entries, f)
+        return cls(buffer=f.getbuffer())
+
+    def _u32_table(self, offset, count):
+        table = memoryview(self._buffer)[offset:offset + 4 * count]
+        if sys.byteorder == 'little':
+            return table.cast('I')
+        swapped = array('I', table.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    def _string(self, string_id):
+        start = self._data_start + self._string_offsets[string_id]
+        end = self._data_start + self._string_offsets[string_id + 1]
+        return bytes(self._buffer[start:end]).decode('utf-8')
+
+    def __len__(self):
+        return self.doc_count
+
+    def headword(self, doc_id):
+        return self._string(self.term_count + doc_id)
+
+    def _term_id(self, term):
+        term_id = bisect_left(self._terms, term)
+        if term_id < self.term_count and self._terms[term_id] == term:
+            return term_id
+        return None
+
+    def search(self, query, limit=10):
+        """Return up to `limit` ReverseMatches for `query`, best first."""
+        scores = {}
+        for term in set(tokenize(query)):
+            term_id = self._term_id(term)
+            if term_id is None:
+                continue
+            start = self._postings_index[term_id]
+            end = self._postings_index[term_id + 1]
+            document_frequency = end - start
+            idf = math.log(1 + (self.doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for posting in range(start, end):
+                doc_id = self._doc_ids[posting]
+                frequency = self._frequencies[posting]
+                length_norm = 1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / self.average_length
+                score = idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [ReverseMatch(self.headword(doc_id), round(score, 3)) for doc_id, score in best]
+
+    def close(self):
+        for table in (self._string_offsets, self._postings_index, self._doc_ids,
+                      self._frequencies, self._doc_lengths):
+            if isinstance(table, memoryview):
+                table.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+
+def open_reverse_index(index_path, database_path, entries):
+    """Open the prebuilt index if it is at least as new as the database, else build one in memory."""
+    if os.path.exists(index_path):
+        if not os.path.exists(database_path) or os.path.getmtime(index_path) >= os.path.getmtime(database_path):
+            try:
+                return ReverseIndex(index_path)
+            except ValueError:
+                pass  # written by an older format version; rebuild with reverse_index.py
+    return ReverseIndex.from_entries(entries)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python reverse_index.py <words.json> <output.rdx>")
+    database = list(iter_records(sys.argv[1]))
+    term_count = build_reverse_index(database, sys.argv[2])
+    print(f"💾 Indexed {len(database)} words ({term_count} terms) into {sys.argv[2]}")
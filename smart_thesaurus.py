@@ -1,61 +1,53 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-from nltk.corpus import wordnet as wn
-import nltk
-import speech_recognition as sr
-import threading
 
-# Download NLTK data
-nltk.download('wordnet')
-nltk.download('omw-1.4')
+from result_cache import ResultCache
+from voice_input import get_voice_input
+from wordnet_snapshot import load_snapshot, snapshot_key
+
+# Served from the exported WordNet snapshot; the corpus reader is never loaded
+snapshot = load_snapshot()
 
 # Sample uncommon word list for demo (extend with your 3000-word dataset)
-word_list = sorted(list(set(w.name().split('.')[0] for w in wn.all_synsets())))
+word_list = snapshot.words()
+
+# Word details by snapshot key, reset whenever the snapshot is re-exported
+word_data_cache = ResultCache(maxsize=1024, ttl=3600)
 
 def get_word_data(word):
-    word = word.lower()
-    meanings = []
-    synonyms = set()
-    antonyms = set()
-    parts_of_speech = set()
-
-    for syn in wn.synsets(word):
-        parts_of_speech.add(syn.pos())
-        meanings.append(syn.definition())
-        for lemma in syn.lemmas():
-            synonyms.add(lemma.name().replace('_', ' '))
-            for ant in lemma.antonyms():
-                antonyms.add(ant.name().replace('_', ' '))
+    return word_data_cache.get_or_compute(snapshot_key(word), snapshot.version,
+                                          lambda: _read_word_data(word))
+
+def _read_word_data(word):
+    entry = snapshot.lookup(word.lower()) or {}
 
     return {
-        'meanings': meanings if meanings else ["No definition found."],
-        'synonyms': sorted(synonyms),
-        'antonyms': sorted(antonyms),
-        'parts_of_speech': sorted(parts_of_speech) if parts_of_speech else ["N/A"]
+        'meanings': entry.get('definitions') or ["No definition found."],
+        'synonyms': entry.get('synonyms', []),
+        'antonyms': entry.get('antonyms', []),
+        'parts_of_speech': entry.get('parts_of_speech') or ["N/A"]
     }
 
 def listen_and_convert():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        messagebox.showinfo("Speech Input", "🎤 Speak a word...")
-        try:
-            audio = recognizer.listen(source, timeout=5)
-            word = recognizer.recognize_google(audio)
-            search_var.set(word)
-            search_word()
-        except sr.UnknownValueError:
-            messagebox.showerror("Error", "Could not understand audio.")
-        except sr.RequestError:
-            messagebox.showerror("Error", "Could not connect to the recognition service.")
-        except sr.WaitTimeoutError:
-            messagebox.showerror("Timeout", "No speech detected.")
-
-def threaded_listen():
-    threading.Thread(target=listen_and_convert).start()
+    speak_button.config(state='disabled', text="🎤 Listening...")
+    poll_voice_result(get_voice_input().submit())
+
+def poll_voice_result(future):
+    # Tk widgets may only be touched from the main loop, so poll the worker from here
+    if not future.done():
+        root.after(100, poll_voice_result, future)
+        return
+    speak_button.config(state='normal', text="🎤 Speak")
+    result = future.result()
+    if result.text:
+        search_var.set(result.text)
+        search_word()
+    else:
+        messagebox.showerror("Speech Input", result.error)
 
 def search_word():
     word = search_var.get().strip().lower()
-    if word not in word_list:
+    if word not in snapshot:
         messagebox.showinfo("Not Found", f"'{word}' is not in the thesaurus.")
         return
     data = get_word_data(word)
@@ -96,8 +88,7 @@ sidebar.pack(fill=tk.Y, side=tk.LEFT)
 tk.Label(sidebar, text="📚 Word List", bg='#e0e0e0', font=('Helvetica', 14, 'bold')).pack(pady=10)
 
 word_listbox = tk.Listbox(sidebar)
-for word in word_list:
-    word_listbox.insert(tk.END, word)
+word_listbox.insert(tk.END, *word_list)
 word_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 word_listbox.bind('<<ListboxSelect>>', on_word_select)
 
@@ -114,7 +105,8 @@ entry = tk.Entry(search_frame, textvariable=search_var, font=('Helvetica', 16),
 entry.grid(row=0, column=0, padx=5)
 
 tk.Button(search_frame, text="Search", command=search_word, font=('Helvetica', 12)).grid(row=0, column=1, padx=5)
-tk.Button(search_frame, text="🎤 Speak", command=threaded_listen, font=('Helvetica', 12)).grid(row=0, column=2, padx=5)
+speak_button = tk.Button(search_frame, text="🎤 Speak", command=listen_and_convert, font=('Helvetica', 12))
+speak_button.grid(row=0, column=2, padx=5)
 
 result_text = scrolledtext.ScrolledText(main, font=('Helvetica', 14), wrap=tk.WORD, height=20)
 result_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
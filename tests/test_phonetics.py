@@ -0,0 +1,23 @@
+from phonetics import PHONETIC_FIELDS, PhoneticIndex, add_phonetic_fields, metaphone, soundex
+
+WORDS = [{'word': word} for word in ('abraham', 'affirm', 'aberrant', 'apron', 'abberant', 'aberrance')]
+
+
+def test_keys():
+    assert metaphone("knight") == "NT"
+    assert soundex("Robert") == "R163"
+    assert soundex("aberrant") == soundex("apron") == "A165"
+
+
+def test_soundex_only_matches_must_be_spelled_alike():
+    index = PhoneticIndex(WORDS)
+    matches = [WORDS[position]['word'] for position in index.sounds_like("aberant")]
+    # Same Metaphone key first, closest spelling first; abraham, affirm and apron only share the Soundex key
+    assert matches == ['aberrant', 'abberant', 'aberrance']
+
+
+def test_only_pronunciations_are_stored():
+    entries = [{'word': 'Aberrant'}]
+    add_phonetic_fields(entries, {'aberrant': [['AE1', 'B', 'ER0', 'AH0', 'N', 'T']]})
+    assert set(entries[0]) == {'word', *PHONETIC_FIELDS} == {'word', 'pronunciation', 'ipa'}
+    assert entries[0]['ipa'] == 'ˈæbɚənt'
@@ -0,0 +1,75 @@
+"""Recognizer interface checks that need no microphone, network or Vosk model.
+
+A stub backend stands in for the speech engines; the audio comes from real
+WAV files: fixtures/silence.wav and tests/fixtures/tone.wav (0.25 s of a
+440 Hz tone, 16 kHz mono).
+"""
+import os
+from array import array
+
+import pytest
+import speech_recognition as sr
+
+from recognizers import (VOSK_SAMPLE_RATE, Alternative, GoogleRecognizer, Recognizer, VoskRecognizer,
+                         create_recognizer, load_audio, transcribe_file)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SILENCE_WAV = os.path.join(ROOT, "fixtures", "silence.wav")
+TONE_WAV = os.path.join(ROOT, "tests", "fixtures", "tone.wav")
+
+
+class StubRecognizer(Recognizer):
+    """Hears "tone" in any audio loud enough, and nothing in silence."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.calls = []
+
+    def recognize(self, audio, max_alternatives=5):
+        raw = audio.get_raw_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2)
+        self.calls.append((len(raw), max_alternatives))
+        if max(map(abs, array("h", raw)), default=0) < 100:
+            raise sr.UnknownValueError()
+        return [Alternative("tone", 0.9), Alternative("stone", 0.4), Alternative("tony", 0.1)][:max_alternatives]
+
+
+def test_recognizer_is_abstract():
+    with pytest.raises(TypeError):
+        Recognizer()
+
+
+def test_transcribe_file_passes_the_recording_to_the_backend():
+    backend = StubRecognizer()
+    alternatives = transcribe_file(TONE_WAV, backend, max_alternatives=2)
+    assert alternatives == [Alternative("tone", 0.9), Alternative("stone", 0.4)]
+    # 0.25 s of 16-bit samples at 16 kHz
+    assert backend.calls == [(VOSK_SAMPLE_RATE // 4 * 2, 2)]
+
+
+def test_silence_is_not_understood():
+    with pytest.raises(sr.UnknownValueError):
+        transcribe_file(SILENCE_WAV, StubRecognizer())
+
+
+def test_recognize_text_returns_the_best_transcript():
+    assert StubRecognizer().recognize_text(load_audio(TONE_WAV)) == "tone"
+
+
+def test_load_audio_accepts_paths_bytes_and_file_objects():
+    with open(TONE_WAV, "rb") as f:
+        data = f.read()
+    with open(TONE_WAV, "rb") as f:
+        sources = [TONE_WAV, data, f]
+        raw = [load_audio(source).get_raw_data() for source in sources]
+    assert raw[0] == raw[1] == raw[2]
+    assert load_audio(SILENCE_WAV).sample_rate == VOSK_SAMPLE_RATE
+
+
+def test_create_recognizer_falls_back_to_google_without_a_model(tmp_path):
+    assert isinstance(create_recognizer(model_path=str(tmp_path / "missing")), GoogleRecognizer)
+
+
+def test_vosk_recognizer_explains_what_is_missing(tmp_path):
+    with pytest.raises((ImportError, FileNotFoundError)):
+        VoskRecognizer(model_path=str(tmp_path / "missing"))
@@ -0,0 +1,41 @@
+import pytest
+
+from reverse_index import STOPWORDS, ReverseIndex, stem, tokenize
+
+
+@pytest.mark.parametrize("forms", [
+    ('horse', 'horses'),
+    ('make', 'making', 'makes'),
+    ('use', 'used', 'uses', 'using'),
+    ('die', 'died', 'dies', 'dying'),
+    ('go', 'goes', 'going'),
+    ('study', 'studies', 'studied', 'studying'),
+    ('cry', 'cries', 'cried'),
+    ('stop', 'stopped', 'stopping'),
+    ('play', 'played', 'plays'),
+    ('box', 'boxes'),
+    ('agree', 'agreed', 'agreeing'),
+])
+def test_inflections_share_a_stem(forms):
+    assert len({stem(form) for form in forms}) == 1, [stem(form) for form in forms]
+
+
+@pytest.mark.parametrize("word", ['series', 'species', 'need', 'bed', 'shed', 'string', 'glass'])
+def test_words_that_only_look_inflected_stay_whole(word):
+    assert stem(word) == word
+
+
+def test_used_is_a_content_word():
+    assert 'used' not in STOPWORDS
+    assert tokenize("Something used for cutting") == ['someth', 'us', 'cut']
+
+
+def test_inflected_queries_find_base_forms():
+    index = ReverseIndex.from_entries([
+        {'word': 'knife', 'definition': 'a tool used for cutting'},
+        {'word': 'mortal', 'definition': 'certain to die'},
+        {'word': 'seasonal', 'definition': 'a series of events each year'},
+    ])
+    assert [match.word for match in index.search("uses to cut")] == ['knife']
+    assert [match.word for match in index.search("dying")] == ['mortal']
+    assert [match.word for match in index.search("series")] == ['seasonal']
@@ -0,0 +1,68 @@
+"""Snapshot lookups against a small hand-written snapshot; no WordNet data needed."""
+import json
+import sqlite3
+
+import pytest
+
+from wordnet_snapshot import SCHEMA, WordNetSnapshot
+
+SENSES = [
+    ('good', 'n', ['benefit']),
+    ('good', 'a', ['having desirable qualities']),
+    ('well', 'n', ['a deep hole to reach water']),
+    ('well', 'a', ['in good health']),
+    ('well', 'r', ['in a satisfactory manner']),
+    ('better', 'n', ['something superior']),
+    ('better', 'v', ['to improve']),
+    ('leaf', 'n', ['the flat green part of a plant']),
+    ('leaf', 'v', ['to turn pages']),
+    ('leave', 'n', ['permission to be absent']),
+    ('leave', 'v', ['to go away']),
+    ('series', 'n', ['similar things in a row']),
+    ('cook', 'v', ['to prepare food']),
+]
+EXCEPTIONS = [('better', 'a', 'good'), ('better', 'a', 'well'), ('better', 'r', 'well'), ('leaves', 'n', 'leaf')]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    connection.executemany("INSERT INTO senses VALUES (?, ?, ?, ?, '[]', '[]')", [
+        (word, pos, json.dumps([pos]), json.dumps(definitions)) for word, pos, definitions in SENSES])
+    connection.executemany("INSERT INTO exceptions VALUES (?, ?, ?)", EXCEPTIONS)
+    connection.commit()
+    connection.close()
+    snapshot = WordNetSnapshot(path)
+    yield snapshot
+    snapshot.close()
+
+
+def test_irregular_forms_only_bring_the_matching_part_of_speech(snapshot):
+    assert snapshot.lookup("better")['definitions'] == [
+        'something superior', 'to improve',
+        'having desirable qualities', 'in good health',
+        'in a satisfactory manner',
+    ]
+
+
+def test_each_part_of_speech_uses_its_own_base_forms(snapshot):
+    # The noun exception gives leaf; the verb rules give leave, not leaf's verb senses
+    assert snapshot.lookup("leaves")['definitions'] == ['the flat green part of a plant', 'to go away']
+
+
+def test_rules_are_reapplied_until_a_lemma_matches(snapshot):
+    # cookings -> cooking -> cook
+    assert snapshot.lookup("cookings")['definitions'] == ['to prepare food']
+    assert snapshot.lookup("series")['definitions'] == ['similar things in a row']
+    assert "xyzzy" not in snapshot
+
+
+def test_words_lists_each_lemma_once(snapshot):
+    assert snapshot.words() == ['better', 'cook', 'good', 'leaf', 'leave', 'series', 'well']
+
+
+def test_close_twice(snapshot):
+    snapshot.close()
+    snapshot.close()
@@ -1,32 +1,23 @@
 import json
-from nltk.stem import WordNetLemmatizer
-import nltk
 
-# Download WordNet if not already done
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-
-# Initialize lemmatizer
-lemmatizer = WordNetLemmatizer()
-
-# Function to normalize user input
-def normalize_word(word):
-    return lemmatizer.lemmatize(word.lower())
+from dataset_io import iter_records, resolve_records_path
+from word_index import build_word_index, lookup_word
+from word_search import normalize_word
 
 # Function to search in your dataset
-def search_word(word, dataset):
+def search_word(word, dataset, dataset_index):
     normalized = normalize_word(word)
-    for entry in dataset:
-        if entry["word"].lower() == normalized:
-            return entry
+    entry = lookup_word(normalized, dataset, dataset_index)
+    if entry is not None:
+        return entry
     return {"message": "Word not found"}
 
-# Load dataset
-with open("words.json", "r") as f:
-    dataset = json.load(f)
+# Load dataset (words.ndjson from dataGeeneration.py, or the older words.json array)
+dataset = list(iter_records(resolve_records_path("words.json")))
+dataset_index = build_word_index(dataset)
 
 # --- Example usage ---
 if __name__ == "__main__":
     user_input = input("Enter a word: ")
-    result = search_word(user_input, dataset)
+    result = search_word(user_input, dataset, dataset_index)
     print(json.dumps(result, indent=4))
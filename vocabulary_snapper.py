@@ -0,0 +1,83 @@
+from collections import namedtuple
+
+from fuzzy_index import FuzzyIndex, similarity_ratio
+from phonetics import PhoneticIndex, metaphone
+from word_index import normalize_key
+
+# A vocabulary word a transcript was snapped to, with the transcript that matched it best
+Snap = namedtuple('Snap', ['word', 'score', 'position', 'heard'])
+
+# Weight of spelling vs. sound in the combined score
+SPELLING_WEIGHT = 0.5
+PHONETIC_WEIGHT = 0.5
+# Each lower-ranked recognizer alternative counts a little less than the one before
+RANK_PENALTY = 0.05
+# Cap on words taken from one phonetic bucket, so common keys stay cheap
+MAX_BUCKET_CANDIDATES = 64
+
+
+class VocabularySnapper:
+    """Maps recognizer n-best transcripts onto the closest vocabulary words.
+
+    Candidates come from two indexes over the vocabulary: the edit-distance
+    FuzzyIndex and the PhoneticIndex buckets of words sharing a Metaphone or
+    Soundex key. Each candidate is scored by spelling similarity plus
+    similarity of Metaphone keys, so "aberant" and "a barrent" both land on
+    "aberrant". Work per alternative is bounded by the index lookups and the
+    bucket cap.
+    """
+
+    def __init__(self, word_list, fuzzy_index=None, phonetic_index=None):
+        self.word_list = word_list
+        self.fuzzy_index = fuzzy_index or FuzzyIndex(word_list)
+        self.phonetic_index = phonetic_index or PhoneticIndex(word_list)
+        self.keys = self.phonetic_index.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _candidates(self, heard):
+        positions = set()
+        for suggestion in self.fuzzy_index.suggest(heard, limit=MAX_BUCKET_CANDIDATES):
+            positions.add(suggestion.position)
+        positions.update(self.phonetic_index.metaphone_matches(heard)[:MAX_BUCKET_CANDIDATES])
+        positions.update(self.phonetic_index.soundex_matches(heard)[:MAX_BUCKET_CANDIDATES])
+        return positions
+
+    def score(self, heard, position):
+        """Combined 0-100 score of one vocabulary word against a transcript."""
+        heard_code = metaphone(heard)
+        spelling = similarity_ratio(heard, self.keys[position])
+        sound = similarity_ratio(heard_code, self.phonetic_index.metaphones[position]) if heard_code else 0
+        return SPELLING_WEIGHT * spelling + PHONETIC_WEIGHT * sound
+
+    def snap(self, alternatives, limit=5, threshold=0):
+        """Rank vocabulary words for a list of transcripts, best transcript first.
+
+        `alternatives` may hold plain strings or recognizers.Alternative
+        tuples. Returns up to `limit` Snaps scoring at least `threshold`.
+        """
+        best = {}
+        for rank, alternative in enumerate(alternatives):
+            text = normalize_key(alternative if isinstance(alternative, str) else alternative.text)
+            if not text:
+                continue
+            weight = max(0.0, 1.0 - RANK_PENALTY * rank)
+            # "a barrent" is often one word the recognizer split in two
+            for heard in dict.fromkeys((text, text.replace(" ", ""))):
+                for position in self._candidates(heard):
+                    score = round(weight * self.score(heard, position))
+                    key = self.keys[position]
+                    # Duplicate headwords collapse onto their first position
+                    if key not in best or (score, -position) > (best[key][0], -best[key][1]):
+                        best[key] = (score, position, heard)
+
+        ranked = sorted(
+            (-score, key, position, heard)
+            for key, (score, position, heard) in best.items()
+            if score >= threshold
+        )
+        return [
+            Snap(word, -negative_score, position, heard)
+            for negative_score, word, position, heard in ranked[:limit]
+        ]
@@ -0,0 +1,109 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from recognizers import create_recognizer
+
+# Outcome of one capture: the best transcript and all ranked Alternatives,
+# or a message explaining why there are none
+VoiceResult = namedtuple('VoiceResult', ['text', 'alternatives', 'error'])
+
+
+class VoiceInput:
+    """Captures and transcribes speech on a single background worker.
+
+    There is only one microphone, so captures run one at a time, queued on
+    the worker. Every submit gets a future of its own, so one instance can
+    serve several sessions; keeping a caller from starting a second capture
+    before its first one finishes is up to the caller. The listening Recognizer is created and calibrated
+    against ambient noise once, then reused; its dynamic energy threshold
+    keeps adapting between captures. Transcription is delegated to a
+    `recognizers.Recognizer` backend (offline Vosk or Google); without an
+    explicit one, the backend is created on the first capture, constrained
+    to `vocabulary` when that is given, and recreated after set_vocabulary.
+    """
+
+    def __init__(self, backend=None, vocabulary=None, timeout=5, phrase_time_limit=5,
+                 calibration_seconds=0.5):
+        self.backend = backend
+        self.vocabulary = vocabulary
+        self._owns_backend = backend is None
+        self._vocabulary_version = None
+        self.timeout = timeout
+        self.phrase_time_limit = phrase_time_limit
+        self.calibration_seconds = calibration_seconds
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-input")
+        # Guards backend, vocabulary and their generation, which the worker reads
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Only ever touched from the worker thread
+        self._recognizer = None
+
+    def submit(self):
+        """Queue a capture on the worker and return its own Future[VoiceResult]."""
+        return self._executor.submit(self._capture)
+
+    def set_vocabulary(self, words, version=None):
+        """Constrain the offline backend to `words` from the next capture on.
+
+        `words` is only read when `version` differs from the one already in
+        use, so passing a lazy iterable on every call is cheap.
+        """
+        with self._lock:
+            if version is not None and version == self._vocabulary_version:
+                return
+            self.vocabulary = list(words)
+            self._vocabulary_version = version
+            self._generation += 1
+            if self._owns_backend:
+                self.backend = None
+
+    def _current_backend(self):
+        """The backend for the vocabulary in use now, created outside the lock on first use."""
+        with self._lock:
+            backend, vocabulary, generation = self.backend, self.vocabulary, self._generation
+        if backend is None:
+            backend = create_recognizer(vocabulary)
+            with self._lock:
+                # A set_vocabulary since the snapshot means this backend only serves this capture
+                if self.backend is None and generation == self._generation:
+                    self.backend = backend
+        return backend
+
+    def _capture(self):
+        # Imported on first use so the callers never pay for it up front
+        try:
+            import speech_recognition as sr
+        except ImportError:
+            return VoiceResult(None, [], "❌ Voice input needs the 'SpeechRecognition' package: "
+                                         "pip install SpeechRecognition")
+
+        try:
+            with sr.Microphone() as source:
+                if self._recognizer is None:
+                    recognizer = sr.Recognizer()
+                    recognizer.adjust_for_ambient_noise(source, duration=self.calibration_seconds)
+                    self._recognizer = recognizer
+                audio = self._recognizer.listen(source, timeout=self.timeout,
+                                                phrase_time_limit=self.phrase_time_limit)
+
+            alternatives = self._current_backend().recognize(audio)
+            return VoiceResult(alternatives[0].text, alternatives, None)
+        except sr.WaitTimeoutError:
+            return VoiceResult(None, [], "⏰ Listening timeout. Please try again.")
+        except sr.UnknownValueError:
+            return VoiceResult(None, [], "❌ Could not understand the audio. Please try again.")
+        except sr.RequestError as e:
+            return VoiceResult(None, [], f"❌ Speech recognition error: {str(e)}")
+        except Exception as e:
+            return VoiceResult(None, [], f"❌ Microphone error: {str(e)}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=None)
+def get_voice_input():
+    """The process-wide voice input worker, shared by every session and window."""
+    return VoiceInput()
@@ -0,0 +1,90 @@
+"""HTML and word lists for the word card that app.py shows for a looked-up word.
+
+The text of the card (header, definition, examples) is built as one
+fragment, so the page sends a single element instead of one per section
+wrapper and example. The fragment has no blank lines or indented lines,
+which keeps Markdown from turning any part of it into paragraphs or code.
+Synonyms, antonyms and other related words are returned as plain word
+lists; app.py shows each list as one row of pills, so opening a word
+reruns the same session instead of reloading the page. Both parts are
+cached per word and data version in `word_card_cache`.
+"""
+from collections import namedtuple
+from html import escape
+
+from result_cache import ResultCache
+
+# Rendered cards as (html, word lists), shared by every session in the process
+word_card_cache = ResultCache(maxsize=2048, ttl=3600)
+
+# A titled row of clickable words; `antonyms` are the words to mark as opposites
+WordList = namedtuple('WordList', ['title', 'words', 'antonyms'])
+
+HEADER_TEMPLATE = (
+    '<div class="word-display"><h2 class="matched-word">{word} '
+    '<span class="phonetic">{phonetic}</span> '
+    '<span class="pos-tag">{part_of_speech}</span></h2></div>'
+)
+SECTION_TEMPLATE = '<div class="definition-section"><h3 class="section-title">{title}</h3>\n{body}\n</div>'
+ITEM_TEMPLATE = '<div class="definition-item"><span class="definition-number">{number}</span>{text}</div>'
+INFO_TEMPLATE = '<div class="info-message">{text}</div>'
+
+
+def _text(value):
+    """Escape text for HTML and fold line breaks, which would end the HTML block."""
+    return escape(" ".join(str(value).split()), quote=False)
+
+
+def get_phonetic(word_data):
+    """Get the IPA pronunciation, falling back to ARPAbet and then the spelling."""
+    pronunciation = word_data.get('ipa') or word_data.get('pronunciation') or word_data['word']
+    return f"/{pronunciation}/"
+
+
+def _section(title, body):
+    return SECTION_TEMPLATE.format(title=title, body=body)
+
+
+def word_list(title, words, antonyms=()):
+    """A WordList with duplicates dropped, keeping the first occurrence."""
+    return WordList(title, tuple(dict.fromkeys(words)), frozenset(antonyms))
+
+
+def render_word_card(word_data):
+    """The text of the card for one entry as a single HTML string."""
+    parts = [HEADER_TEMPLATE.format(
+        word=_text(word_data['word']),
+        phonetic=_text(get_phonetic(word_data)),
+        part_of_speech=_text(word_data['part_of_speech']),
+    )]
+
+    if word_data.get('definition'):
+        parts.append(_section("📚 Definition", ITEM_TEMPLATE.format(number=1, text=_text(word_data['definition']))))
+
+    if word_data.get('examples'):
+        parts.append(_section("💡 Examples", "\n".join(
+            ITEM_TEMPLATE.format(number=i, text=f'<em>"{_text(example)}"</em>')
+            for i, example in enumerate(word_data['examples'], 1)
+        )))
+
+    if not word_data.get('synonyms') and not word_data.get('antonyms'):
+        parts.append(INFO_TEMPLATE.format(text="🔍 No synonyms or antonyms found for this word."))
+
+    return "\n".join(parts)
+
+
+def card_word_lists(word_data, related_words=(), similar_words=(), sound_alikes=()):
+    """The card's non-empty WordLists, in display order.
+
+    `related_words` holds (word, is_antonym) pairs from the synonym/antonym
+    graph; `similar_words` and `sound_alikes` hold plain words.
+    """
+    lists = [
+        word_list("🔄 Synonyms", word_data.get('synonyms', ())),
+        word_list("⚔️ Antonyms", word_data.get('antonyms', ()), word_data.get('antonyms', ())),
+        word_list("🕸️ Related Words", (word for word, _ in related_words),
+                  (word for word, is_antonym in related_words if is_antonym)),
+        word_list("🧭 Similar Words", similar_words),
+        word_list("🔊 Sounds Like", sound_alikes),
+    ]
+    return [listed for listed in lists if listed.words]
@@ -0,0 +1,66 @@
+import sys
+
+
+class WordEntry:
+    """Compact, read-only-by-convention record for one database word.
+
+    Uses __slots__ instead of a per-entry dict, stores relation lists as
+    tuples (every empty list becomes the shared empty tuple) and interns the
+    part of speech so the handful of distinct values are stored once. Supports
+    the dict-style access the rest of the app uses: entry['word'],
+    entry.get('examples'), 'synonyms' in entry.
+    """
+
+    __slots__ = ('word', 'definition', 'part_of_speech', 'synonyms', 'antonyms', 'examples',
+                 'pronunciation', 'ipa')
+
+    def __init__(self, word, definition='', part_of_speech='', synonyms=(), antonyms=(), examples=(),
+                 pronunciation='', ipa=''):
+        self.word = word
+        self.definition = definition
+        self.part_of_speech = sys.intern(part_of_speech) if part_of_speech else part_of_speech
+        self.synonyms = tuple(synonyms)
+        self.antonyms = tuple(antonyms)
+        self.examples = tuple(examples)
+        # Phonetic layer added by generate_word.py; empty in older databases
+        self.pronunciation = pronunciation
+        self.ipa = ipa
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an entry from a database dict, ignoring unknown keys."""
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
+
+    def to_dict(self):
+        """Return a plain dict with lists, as stored in the JSON database."""
+        return {
+            field: list(value) if isinstance(value, tuple) else value
+            for field, value in self.items()
+        }
+
+    def keys(self):
+        return iter(self.__slots__)
+
+    def items(self):
+        return ((field, getattr(self, field)) for field in self.__slots__)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __eq__(self, other):
+        if isinstance(other, WordEntry):
+            return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"WordEntry(word={self.word!r}, part_of_speech={self.part_of_speech!r})"
@@ -0,0 +1,153 @@
+import os
+from array import array
+from collections import deque, namedtuple
+
+from word_index import normalize_key
+from wordnet_snapshot import SNAPSHOT_PATH, WordNetSnapshot
+
+# Edge types
+SYNONYM = 0
+ANTONYM = 1
+EDGE_NAMES = ('synonym', 'antonym')
+
+# A word reached by a graph walk: its node, display name, hop count and how it
+# relates to the start word (an odd number of antonym hops makes an antonym)
+Related = namedtuple('Related', ['node', 'word', 'depth', 'kind'])
+
+
+class WordGraph:
+    """Synonym/antonym graph with integer node ids and CSR adjacency.
+
+    Node i's neighbours are targets[offsets[i]:offsets[i + 1]], with the edge
+    type of each in the parallel `kinds` array. Every database headword and
+    every word any of them lists as a synonym or antonym is a node;
+    `positions[i]` is the node's database position, or -1 when the word is
+    not a headword.
+    """
+
+    def __init__(self, words, offsets, targets, kinds, positions):
+        self.words = words
+        self.offsets = offsets
+        self.targets = targets
+        self.kinds = kinds
+        self.positions = positions
+        self._ids = {normalize_key(word): node for node, word in enumerate(words)}
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def node(self, word):
+        """Node id for `word`, or None."""
+        return self._ids.get(normalize_key(word))
+
+    def neighbors(self, node, kind=None):
+        """(neighbour, edge type) pairs of one node, optionally of one type only."""
+        for edge in range(self.offsets[node], self.offsets[node + 1]):
+            if kind is None or self.kinds[edge] == kind:
+                yield self.targets[edge], self.kinds[edge]
+
+    def related(self, word, max_depth=2, limit=50, follow=(SYNONYM, ANTONYM), headwords_only=False):
+        """Breadth-first walk from `word`, up to `max_depth` hops and `limit` results.
+
+        Only edges whose type is in `follow` are walked. Results come in BFS
+        order, nearest first; the start word itself is not included.
+        """
+        start = self.node(word)
+        if start is None:
+            return []
+
+        results = []
+        seen = {start}
+        queue = deque([(start, 0, SYNONYM)])
+        while queue:
+            node, depth, path_kind = queue.popleft()
+            if depth >= max_depth:
+                continue
+            for edge in range(self.offsets[node], self.offsets[node + 1]):
+                kind = self.kinds[edge]
+                neighbor = self.targets[edge]
+                if kind not in follow or neighbor in seen:
+                    continue
+                seen.add(neighbor)
+                reached_kind = ANTONYM if (kind == ANTONYM) != (path_kind == ANTONYM) else SYNONYM
+                queue.append((neighbor, depth + 1, reached_kind))
+                if headwords_only and self.positions[neighbor] < 0:
+                    continue
+                results.append(Related(neighbor, self.words[neighbor], depth + 1, reached_kind))
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def nearest_headwords(self, word, max_depth=3, limit=10):
+        """Database headwords reachable from `word` by synonym hops, nearest first."""
+        return self.related(word, max_depth, limit, follow=(SYNONYM,), headwords_only=True)
+
+
+def build_word_graph(word_database, snapshot=None):
+    """Derive the graph from the database's synonym/antonym lists and, if given, a WordNet snapshot.
+
+    The snapshot adds the full WordNet synonym and antonym sets of every
+    headword, which the database trims to a few per entry. Edges are
+    undirected and deduplicated.
+    """
+    ids = {}
+    words = []
+    positions = array('i')
+
+    def node_id(word):
+        key = normalize_key(word)
+        node = ids.get(key)
+        if node is None:
+            node = ids[key] = len(words)
+            words.append(word)
+            positions.append(-1)
+        return node
+
+    edges = set()
+
+    def connect(source, target, kind):
+        if source != target:
+            edges.add((source, target, kind))
+            edges.add((target, source, kind))
+
+    for position, word_data in enumerate(word_database):
+        node = node_id(word_data['word'])
+        if positions[node] < 0:
+            positions[node] = position
+        related = {SYNONYM: list(word_data.get('synonyms') or ()), ANTONYM: list(word_data.get('antonyms') or ())}
+        if snapshot is not None:
+            wordnet_data = snapshot.lookup(word_data['word'])
+            if wordnet_data is not None:
+                related[SYNONYM].extend(wordnet_data['synonyms'])
+                related[ANTONYM].extend(wordnet_data['antonyms'])
+        for kind, related_words in related.items():
+            for related_word in related_words:
+                connect(node, node_id(related_word), kind)
+
+    # Bucket the edges by source node into CSR arrays
+    offsets = array('I', [0]) * (len(words) + 1)
+    for source, _, _ in edges:
+        offsets[source + 1] += 1
+    for node in range(len(words)):
+        offsets[node + 1] += offsets[node]
+
+    targets = array('I', [0]) * len(edges)
+    kinds = array('B', [0]) * len(edges)
+    fill = array('I', offsets[:-1])
+    for source, target, kind in sorted(edges):
+        targets[fill[source]] = target
+        kinds[fill[source]] = kind
+        fill[source] += 1
+
+    return WordGraph(words, offsets, targets, kinds, positions)
+
+
+def open_graph_snapshot(path=SNAPSHOT_PATH):
+    """The exported WordNet snapshot if there is one; the graph never queries WordNet live."""
+    if os.path.exists(path):
+        return WordNetSnapshot(path)
+    return None
@@ -0,0 +1,145 @@
+import os
+from bisect import bisect_left
+from collections import namedtuple
+from types import MappingProxyType
+
+# Highest code point, used as the exclusive upper bound of a prefix range
+_PREFIX_SENTINEL = '\U0010ffff'
+
+# Case-folded headwords in sorted order with their database positions
+PrefixIndex = namedtuple('PrefixIndex', ['keys', 'positions'])
+
+
+def normalize_key(word):
+    """Case-fold a word the way every index lookup expects it."""
+    return word.lower().strip()
+
+
+def headword(word_data):
+    """Return the headword of a database entry or a plain word-list item."""
+    if isinstance(word_data, str):
+        return word_data
+    return word_data['word']
+
+
+def headwords(word_database):
+    """Iterate over headwords, without decoding whole records when the database can."""
+    if hasattr(word_database, 'headwords'):
+        return word_database.headwords()
+    return (headword(word_data) for word_data in word_database)
+
+
+class SortedKeyIndex:
+    """Exact-match index over keys the database already keeps sorted.
+
+    Used for a binary WordStore: lookups bisect the stored keys, so nothing
+    has to be built at startup.
+    """
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get(self, key, default=None):
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            return position
+        return default
+
+
+def build_word_index(word_database):
+    """Map each case-folded headword to its position in the database.
+
+    The first entry wins on duplicates, matching the old linear scan.
+    """
+    if hasattr(word_database, 'sorted_keys'):
+        return SortedKeyIndex(word_database.sorted_keys())
+
+    word_index = {}
+    for position, word in enumerate(headwords(word_database)):
+        word_index.setdefault(normalize_key(word), position)
+    return word_index
+
+
+def lookup_word(word, word_database, word_index):
+    """Return the database entry for `word` in O(1), or None."""
+    if not word:
+        return None
+    position = word_index.get(normalize_key(word))
+    if position is None:
+        return None
+    return word_database[position]
+
+
+def build_prefix_index(word_database):
+    """Sort the case-folded headwords once so prefixes can be bisected."""
+    if hasattr(word_database, 'sorted_keys'):
+        return PrefixIndex(keys=word_database.sorted_keys(), positions=range(len(word_database)))
+
+    pairs = sorted(
+        (normalize_key(word), position)
+        for position, word in enumerate(headwords(word_database))
+    )
+    return PrefixIndex(
+        keys=tuple(key for key, _ in pairs),
+        positions=tuple(position for _, position in pairs),
+    )
+
+
+def prefix_range(prefix_index, prefix):
+    """Return the [start, end) slice of sorted keys that start with `prefix`."""
+    key = normalize_key(prefix)
+    start = bisect_left(prefix_index.keys, key)
+    end = bisect_left(prefix_index.keys, key + _PREFIX_SENTINEL, start)
+    return start, end
+
+
+def search_prefix_index(prefix, word_database, prefix_index, limit=None):
+    """Return the first `limit` entries starting with `prefix` and the total count.
+
+    Runs in O(log n + limit); the full match list is never built.
+    """
+    start, end = prefix_range(prefix_index, prefix)
+    stop = end if limit is None else min(end, start + limit)
+    matches = [word_database[position] for position in prefix_index.positions[start:stop]]
+    return matches, end - start
+
+
+def build_letter_buckets(prefix_index):
+    """Map each starting letter to its [start, end) range in the sorted key array.
+
+    Keys sharing a first letter are contiguous once sorted, so each range is
+    found with one bisect and only the first key of each letter is read.
+    The result is read-only.
+    """
+    keys = prefix_index.keys
+    buckets = {}
+    position = 0
+    while position < len(keys):
+        key = keys[position]
+        if not key:
+            position += 1
+            continue
+        end = bisect_left(keys, key[0] + _PREFIX_SENTINEL, position)
+        buckets.setdefault(key[0].upper(), (position, end))
+        position = end
+    return MappingProxyType(buckets)
+
+
+def letter_page(letter, word_database, prefix_index, letter_buckets, page=1, page_size=20):
+    """Return one alphabetical page of entries starting with `letter`."""
+    start, end = letter_buckets.get(letter, (0, 0))
+    page_start = min(end, start + (page - 1) * page_size)
+    page_end = min(end, page_start + page_size)
+    return [word_database[position] for position in prefix_index.positions[page_start:page_end]]
+
+
+def database_version(path):
+    """Identify the current contents of a database file for cache keys."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
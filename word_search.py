@@ -0,0 +1,217 @@
+import os
+import time
+from functools import lru_cache
+
+from dataset_io import iter_records, resolve_records_path
+from nltk_setup import ensure_nltk_data
+from result_cache import ResultCache
+from word_entry import WordEntry
+from word_index import letter_page, lookup_word, normalize_key, search_prefix_index
+from word_store import WordStore
+
+DATABASE_PATH = "meaningful_words_3k.json"
+# Written by merge_corpora.py; served instead of DATABASE_PATH when present
+UNIFIED_DATABASE_PATH = "unified_words.ndjson"
+
+# "Did you mean" results, shared by every session in the process
+suggestion_cache = ResultCache(maxsize=4096, ttl=3600)
+
+
+def companion_path(database_path, extension):
+    """A file built from a database, named after it: words.ndjson -> words.rdx."""
+    return os.path.splitext(database_path)[0] + extension
+
+
+def resolve_database_path(json_path=None, binary_path=None):
+    """Prefer the binary word store when it exists and is not older than the JSON.
+
+    Between the two text formats, a fresh NDJSON export wins over the JSON
+    array. Without an explicit path the unified database from
+    merge_corpora.py is served if there is one, else the generated words.
+    """
+    if json_path is None:
+        json_path = UNIFIED_DATABASE_PATH if os.path.exists(UNIFIED_DATABASE_PATH) else DATABASE_PATH
+    json_path = resolve_records_path(json_path)
+    if binary_path is None:
+        binary_path = companion_path(json_path, ".wdb")
+    if os.path.exists(binary_path):
+        if not os.path.exists(json_path) or os.path.getmtime(binary_path) >= os.path.getmtime(json_path):
+            return binary_path
+    return json_path
+
+
+def read_word_database(path=DATABASE_PATH):
+    """Read the generated word database from NDJSON, a JSON array or a memory-mapped word store.
+
+    Text formats are parsed one record at a time, so only the compact entries
+    are ever held in memory, never the raw file or a list of dicts.
+    """
+    if path.endswith(".wdb"):
+        return WordStore(path)
+    return [WordEntry.from_dict(word_data) for word_data in iter_records(path)]
+
+
+@lru_cache(maxsize=1)
+def _get_lemmatizer():
+    """Create the WordNet lemmatizer on first use only."""
+    ensure_nltk_data('wordnet', 'omw-1.4')
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+
+def normalize_word(word):
+    """Lower-case and lemmatize a word, as thesaurus.py does for user input."""
+    return _get_lemmatizer().lemmatize(word.lower())
+
+
+def load_lemmatizer():
+    """Create the lemmatizer and load WordNet now; returns False when the data is missing.
+
+    The corpus loads lazily on the first lemmatize call, which is not safe to
+    race from several threads, so servers call this once before handling
+    requests.
+    """
+    try:
+        normalize_word("words")
+    except LookupError:
+        return False
+    return True
+
+
+def find_exact_word(input_word, word_database, word_index):
+    """Find exact matching word from the word database."""
+    if not input_word or not word_database:
+        return None
+
+    return lookup_word(input_word, word_database, word_index)
+
+
+def get_closest_word_suggestion(input_word, word_database, fuzzy_index, threshold=70, db_version=None):
+    """Find the closest matching word for suggestion purposes only.
+
+    When `db_version` is given, results are served from `suggestion_cache`.
+    """
+    if not input_word or not word_database:
+        return None, 0
+
+    if db_version is not None:
+        return suggestion_cache.get_or_compute(
+            (normalize_key(input_word), threshold), db_version,
+            lambda: get_closest_word_suggestion(input_word, word_database, fuzzy_index, threshold),
+        )
+
+    suggestions = fuzzy_index.suggest(input_word, limit=1, threshold=threshold)
+    if suggestions:
+        # Return the full word data
+        best = suggestions[0]
+        return word_database[best.position], best.score
+    return None, 0
+
+
+def search_words_starting_with(prefix, word_database, prefix_index, limit=None):
+    """Search for words that START with the given prefix.
+
+    Returns the first `limit` matches in alphabetical order and the total count.
+    """
+    if not prefix or not word_database:
+        return [], 0
+
+    return search_prefix_index(prefix, word_database, prefix_index, limit)
+
+
+def get_letter_page(letter, word_database, prefix_index, letter_buckets, page=1, page_size=20):
+    """Get one alphabetical page of words starting with the given letter"""
+    return letter_page(letter, word_database, prefix_index, letter_buckets, page, page_size)
+
+
+def bulk_lookup(words, word_database, word_index, fuzzy_index=None, suggestion_limit=3, threshold=70,
+                lemmatize=True):
+    """Resolve many words in one pass.
+
+    Input words are de-duplicated; each one is matched on its case-folded form
+    first and then on its lemma, and misses get fuzzy suggestions when a
+    fuzzy index is given. Returns a dict keyed by input word, in input order:
+
+        {"word", "normalized", "entry", "suggestions", "elapsed_ms"}
+
+    Words that normalize to the same lemma are looked up once; each still
+    gets its own result. Without WordNet data, or with `lemmatize` off,
+    words are matched on their case-folded form only.
+    """
+    results = {}
+    resolved = {}
+
+    for word in words:
+        if not word or word in results:
+            continue
+
+        started = time.perf_counter()
+        key = normalize_key(word)
+        lookup = resolved.get(key)
+        if lookup is None:
+            normalized = key
+            entry = find_exact_word(key, word_database, word_index)
+            if entry is None and lemmatize:
+                try:
+                    normalized = normalize_word(key)
+                except LookupError:
+                    # WordNet is not installed; fall back to the unlemmatized key
+                    lemmatize = False
+                else:
+                    lookup = resolved.get(normalized)
+                    if lookup is None:
+                        entry = find_exact_word(normalized, word_database, word_index)
+
+            if lookup is None:
+                suggestions = []
+                if entry is None and fuzzy_index is not None:
+                    suggestions = [
+                        {"word": suggestion.word, "score": suggestion.score}
+                        for suggestion in fuzzy_index.suggest(key, limit=suggestion_limit, threshold=threshold)
+                    ]
+                lookup = {"normalized": normalized, "entry": entry, "suggestions": suggestions}
+            resolved[key] = resolved[lookup["normalized"]] = lookup
+
+        results[word] = {
+            "word": word,
+            "normalized": lookup["normalized"],
+            "entry": lookup["entry"],
+            "suggestions": list(lookup["suggestions"]),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    return results
+
+
+def find_sound_alikes(word, word_database, phonetic_index, limit=8):
+    """Entries that sound like `word`, ranked by PhoneticIndex.sounds_like, excluding itself."""
+    key = normalize_key(word)
+    matches = []
+    for position in phonetic_index.sounds_like(word):
+        word_data = word_database[position]
+        if normalize_key(word_data['word']) != key:
+            matches.append(word_data)
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def reverse_lookup(query, reverse_index, word_database, word_index, limit=10):
+    """Find words by meaning: (entry, score) pairs for the best BM25 matches of `query`."""
+    if not query or not word_database:
+        return []
+
+    results = []
+    for match in reverse_index.search(query, limit):
+        entry = lookup_word(match.word, word_database, word_index)
+        if entry is not None:
+            results.append((entry, match.score))
+    return results
+
+
+def find_similar_words(word, word_database, word_index, embedding_index, limit=8):
+    """Words closest in meaning to `word` by embedding cosine: (entry, score) pairs."""
+    position = word_index.get(normalize_key(word)) if word else None
+    if position is None:
+        return []
+    return [(word_database[row], score) for row, score in embedding_index.similar(position, limit)]
@@ -0,0 +1,238 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from dataset_io import atomic_output, iter_records
+from word_entry import WordEntry
+from word_index import normalize_key
+
+# On-disk layout, all integers little-endian:
+#
+#   header          HEADER struct below
+#   field names     (scalar_count + list_count) u32 string ids
+#   string offsets  (string_count + 1) u32 byte offsets into string data
+#   string data     UTF-8 bytes of every distinct string, concatenated
+#   records         record_count fixed-width records: one u32 string id per
+#                   scalar field, then a u32 [start, end) pair per list field
+#   list pool       u32 string ids that the list ranges point into
+#
+# Records are sorted by case-folded headword so lookups can bisect the file
+# without building an index. Sections start on 8-byte boundaries.
+MAGIC = b"WDB1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIIIQQQQ")
+NO_STRING = 0xFFFFFFFF
+
+SCALAR_FIELDS = ('word', 'definition', 'part_of_speech')
+LIST_FIELDS = ('synonyms', 'antonyms', 'examples')
+
+
+def _pad(f):
+    """Pad the file to the next 8-byte boundary and return the new offset."""
+    offset = f.tell()
+    padding = -offset % 8
+    if padding:
+        f.write(b"\0" * padding)
+    return offset + padding
+
+
+def _infer_fields(entries):
+    """Split entry keys into scalar and list fields, keeping the default order first."""
+    scalar_fields = list(SCALAR_FIELDS)
+    list_fields = list(LIST_FIELDS)
+    for entry in entries:
+        for key, value in entry.items():
+            if key in scalar_fields or key in list_fields:
+                continue
+            if isinstance(value, (list, tuple)):
+                list_fields.append(key)
+            else:
+                scalar_fields.append(key)
+    return tuple(scalar_fields), tuple(list_fields)
+
+
+def write_word_store(entries, path):
+    """Convert word entries (dicts or WordEntry) into the binary word store at `path`.
+
+    Entries are sorted by case-folded headword; equal strings are stored once.
+    The file is written to a temporary name and renamed into place.
+    """
+    entries = sorted(entries, key=lambda entry: normalize_key(entry['word']))
+    scalar_fields, list_fields = _infer_fields(entries)
+
+    strings = {}
+    string_data = []
+
+    def string_id(value):
+        if value is None:
+            return NO_STRING
+        value = str(value)
+        if value not in strings:
+            strings[value] = len(string_data)
+            string_data.append(value.encode('utf-8'))
+        return strings[value]
+
+    field_ids = array('I', [string_id(name) for name in scalar_fields + list_fields])
+    records = array('I')
+    pool = array('I')
+    for entry in entries:
+        for field in scalar_fields:
+            records.append(string_id(entry.get(field)))
+        for field in list_fields:
+            start = len(pool)
+            pool.extend(string_id(item) for item in entry.get(field) or ())
+            records.extend((start, len(pool)))
+
+    string_offsets = array('I', [0])
+    for encoded in string_data:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    if sys.byteorder != 'little':
+        for table in (field_ids, records, pool, string_offsets):
+            table.byteswap()
+
+    with atomic_output(path, "wb") as f:
+        f.write(b"\0" * HEADER.size)
+        field_ids.tofile(f)
+        offsets_start = _pad(f)
+        string_offsets.tofile(f)
+        data_start = f.tell()
+        for encoded in string_data:
+            f.write(encoded)
+        records_start = _pad(f)
+        records.tofile(f)
+        pool_start = _pad(f)
+        pool.tofile(f)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), len(string_data),
+                            len(scalar_fields), len(list_fields),
+                            offsets_start, data_start, records_start, pool_start))
+
+
+class _KeyView:
+    """Read-only sequence of case-folded headwords, in store order."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __len__(self):
+        return len(self._store)
+
+    def __getitem__(self, position):
+        return normalize_key(self._store.headword(position))
+
+
+class WordStore:
+    """Memory-mapped binary word database with lazy record decoding.
+
+    Behaves like a read-only list of WordEntry objects: only the records that are
+    actually accessed get decoded, and the mapped pages are shared by every
+    process reading the same file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._count, string_count, scalar_count, list_count,
+         offsets_start, data_start, records_start, pool_start) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} word store")
+
+        self._data_start = data_start
+        self._string_offsets = self._u32_table(offsets_start, string_count + 1)
+        self._record_width = scalar_count + 2 * list_count
+        self._records = self._u32_table(records_start, self._count * self._record_width)
+        self._pool = self._u32_table(pool_start, (len(self._mmap) - pool_start) // 4)
+
+        field_ids = list(self._u32_table(HEADER.size, scalar_count + list_count))
+        names = [self._string(string_id) for string_id in field_ids]
+        self.scalar_fields = tuple(names[:scalar_count])
+        self.list_fields = tuple(names[scalar_count:])
+
+    def _u32_table(self, offset, count):
+        table = memoryview(self._mmap)[offset:offset + 4 * count]
+        if sys.byteorder == 'little':
+            return table.cast('I')
+        # Big-endian hosts pay for a copy instead of sharing the mapped pages
+        swapped = array('I', table.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    def _string(self, string_id):
+        if string_id == NO_STRING:
+            return None
+        start = self._data_start + self._string_offsets[string_id]
+        end = self._data_start + self._string_offsets[string_id + 1]
+        return self._mmap[start:end].decode('utf-8')
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self[position]
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("word store index out of range")
+
+        base = position * self._record_width
+        entry = {}
+        for offset, field in enumerate(self.scalar_fields):
+            entry[field] = self._string(self._records[base + offset])
+        base += len(self.scalar_fields)
+        for offset, field in enumerate(self.list_fields):
+            start = self._records[base + 2 * offset]
+            end = self._records[base + 2 * offset + 1]
+            entry[field] = [self._string(string_id) for string_id in self._pool[start:end]]
+        return WordEntry.from_dict(entry)
+
+    def headword(self, position):
+        """Decode only the headword of one record."""
+        return self._string(self._records[position * self._record_width])
+
+    def headwords(self):
+        """Iterate over headwords without decoding whole records."""
+        for position in range(self._count):
+            yield self.headword(position)
+
+    def sorted_keys(self):
+        """Case-folded headwords as a bisectable sequence (records are stored sorted)."""
+        return _KeyView(self)
+
+    def find(self, word):
+        """Return the entry for `word` by binary search, or None."""
+        keys = self.sorted_keys()
+        key = normalize_key(word)
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            return self[position]
+        return None
+
+    def close(self):
+        # Views must be released before the map can close
+        for table in (self._string_offsets, self._records, self._pool):
+            if isinstance(table, memoryview):
+                table.release()
+        self._mmap.close()
+
+
+def convert_json_to_store(json_path, store_path):
+    """Convert a JSON array or NDJSON word database into a binary word store."""
+    entries = list(iter_records(json_path))
+    write_word_store(entries, store_path)
+    return len(entries)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python word_store.py <input.json> <output.wdb>")
+    count = convert_json_to_store(sys.argv[1], sys.argv[2])
+    print(f"💾 Wrote {count} words to {sys.argv[2]}")
@@ -0,0 +1,339 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+
+from nltk_setup import ensure_nltk_data
+from word_index import database_version
+
+SNAPSHOT_PATH = "wordnet_snapshot.sqlite3"
+
+SCHEMA = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE senses (
+    word TEXT NOT NULL,
+    pos TEXT NOT NULL,
+    parts_of_speech TEXT NOT NULL,
+    definitions TEXT NOT NULL,
+    synonyms TEXT NOT NULL,
+    antonyms TEXT NOT NULL,
+    PRIMARY KEY (word, pos)
+) WITHOUT ROWID;
+CREATE TABLE exceptions (
+    word TEXT NOT NULL,
+    pos TEXT NOT NULL,
+    base TEXT NOT NULL
+);
+CREATE INDEX exceptions_word ON exceptions (word);
+"""
+
+# WordNet's morphy detachment rules: (suffix, replacement) per part of speech
+MORPHOLOGICAL_SUBSTITUTIONS = {
+    'n': [('s', ''), ('ses', 's'), ('ves', 'f'), ('xes', 'x'), ('zes', 'z'),
+          ('ches', 'ch'), ('shes', 'sh'), ('men', 'man'), ('ies', 'y')],
+    'v': [('s', ''), ('ies', 'y'), ('es', 'e'), ('es', ''), ('ed', 'e'), ('ed', ''), ('ing', 'e'), ('ing', '')],
+    'a': [('er', ''), ('est', ''), ('er', 'e'), ('est', 'e')],
+    'r': [],
+}
+
+# Parts of speech in the order wn.synsets returns them; satellites are stored as adjectives
+PARTS_OF_SPEECH = ['n', 'v', 'a', 'r']
+
+# Irregular inflections shipped with WordNet, one file per part of speech
+EXCEPTION_FILES = {'n': 'noun.exc', 'v': 'verb.exc', 'a': 'adj.exc', 'r': 'adv.exc'}
+
+
+def snapshot_key(word):
+    """Normalize a word the way WordNet names its lemmas."""
+    return word.lower().strip().replace(' ', '_')
+
+
+def morphy(form, pos, exceptions, stored_forms):
+    """Base forms of `form` as one part of speech, found the way WordNet's morphy does.
+
+    `exceptions` are the irregular base forms listed for `form`; where there
+    are some, they replace the detachment rules. Otherwise the rules are
+    applied to `form` and, while nothing they produce is a lemma, again to
+    their own output. `stored_forms(forms)` returns those of `forms` that
+    WordNet has as this part of speech.
+    """
+    substitutions = MORPHOLOGICAL_SUBSTITUTIONS[pos]
+
+    def apply_rules(forms):
+        return [candidate[:-len(suffix)] + replacement for candidate in forms
+                for suffix, replacement in substitutions if candidate.endswith(suffix)]
+
+    def filter_forms(forms):
+        stored = stored_forms(forms)
+        return list(dict.fromkeys(candidate for candidate in forms if candidate in stored))
+
+    if exceptions:
+        return filter_forms([form] + exceptions)
+    forms = apply_rules([form])
+    results = filter_forms([form] + forms)
+    while forms and not results:
+        forms = list(dict.fromkeys(apply_rules(forms)))
+        results = filter_forms(forms)
+    return results
+
+
+def merge_entries(entries):
+    """Combine the entries of several base forms into one, as wn.synsets does for an inflection."""
+    if len(entries) == 1:
+        return entries[0]
+    definitions = []
+    for entry in entries:
+        definitions.extend(definition for definition in entry['definitions'] if definition not in definitions)
+    return {
+        'definitions': definitions,
+        'parts_of_speech': sorted({pos for entry in entries for pos in entry['parts_of_speech']}),
+        'synonyms': sorted({word for entry in entries for word in entry['synonyms']}),
+        'antonyms': sorted({word for entry in entries for word in entry['antonyms']}),
+    }
+
+
+def read_exception_lists(wn):
+    """(inflected word, part of speech, base form) rows from WordNet's exception files."""
+    rows = []
+    for pos, filename in EXCEPTION_FILES.items():
+        with wn.open(filename) as f:
+            for line in f:
+                inflected, *bases = line.split()
+                rows.extend((inflected, pos, base) for base in bases)
+    return rows
+
+
+def synsets_entry(synsets):
+    """Collect definitions, parts of speech, synonyms and antonyms from a list of synsets."""
+    definitions = []
+    parts_of_speech = set()
+    synonyms = set()
+    antonyms = set()
+
+    for syn in synsets:
+        parts_of_speech.add(syn.pos())
+        definitions.append(syn.definition())
+        for lemma in syn.lemmas():
+            synonyms.add(lemma.name().replace('_', ' '))
+            for antonym in lemma.antonyms():
+                antonyms.add(antonym.name().replace('_', ' '))
+
+    if not definitions:
+        return None
+    return {
+        'definitions': definitions,
+        'parts_of_speech': sorted(parts_of_speech),
+        'synonyms': sorted(synonyms),
+        'antonyms': sorted(antonyms),
+    }
+
+
+def wordnet_entry(wn, word):
+    """Entry for `word` and its base forms across every part of speech, as the live corpus gives it."""
+    return synsets_entry(wn.synsets(word))
+
+
+def lemma_entry(wn, word, pos):
+    """Entry for the senses the lemma `word` itself has as `pos`; base forms are left to lookup."""
+    return synsets_entry([lemma.synset() for lemma in wn.lemmas(word, pos)])
+
+
+def export_snapshot(path=SNAPSHOT_PATH):
+    """Export every WordNet lemma, one row per part of speech, into an indexed SQLite snapshot at `path`.
+
+    The database is built under a temporary name and renamed into place, so
+    running apps keep reading the previous snapshot until it is complete.
+    """
+    ensure_nltk_data('wordnet', 'omw-1.4')
+    from nltk.corpus import wordnet as wn
+
+    scratch_path = f"{path}.tmp"
+    if os.path.exists(scratch_path):
+        os.unlink(scratch_path)
+
+    connection = sqlite3.connect(scratch_path)
+    try:
+        connection.executescript(SCHEMA)
+        connection.execute("INSERT INTO metadata VALUES ('wordnet_version', ?)", (wn.get_version(),))
+        rows = []
+        for pos in PARTS_OF_SPEECH:
+            for word in sorted(wn.all_lemma_names(pos)):
+                entry = lemma_entry(wn, word, pos)
+                if entry is None:
+                    continue
+                rows.append((
+                    snapshot_key(word),
+                    pos,
+                    json.dumps(entry['parts_of_speech']),
+                    json.dumps(entry['definitions'], ensure_ascii=False),
+                    json.dumps(entry['synonyms'], ensure_ascii=False),
+                    json.dumps(entry['antonyms'], ensure_ascii=False),
+                ))
+        connection.executemany("INSERT OR IGNORE INTO senses VALUES (?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany("INSERT INTO exceptions VALUES (?, ?, ?)", read_exception_lists(wn))
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(scratch_path, path)
+    return len({row[0] for row in rows})
+
+
+class WordNetSnapshot:
+    """Read-only access to an exported WordNet snapshot.
+
+    Lookups are primary-key queries against SQLite, so serving a word never
+    loads the NLTK corpus reader. Inflected forms are reduced to their base
+    forms first, with the exported exception lists and morphy's detachment
+    rules, the way wn.synsets does: each part of speech contributes only the
+    senses of the base forms morphy found for it. One instance can be shared
+    between threads.
+
+    A re-export replaces the file under a new inode, which an open
+    connection would never see, so the connection is reopened whenever the
+    file's mtime or size changes.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = path
+        self._connection = None
+        self._version = None
+        self._has_exceptions = False
+        self._has_senses = False
+        self._lock = threading.Lock()
+        with self._lock:
+            self._reopen_if_replaced()
+
+    def _reopen_if_replaced(self):
+        version = database_version(self.path)
+        if version == self._version or version == "missing":
+            return
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._version = version
+        tables = {name for name, in self._connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        # Snapshots exported before the exception lists were added still work, with rules only
+        self._has_exceptions = 'exceptions' in tables
+        # Older snapshots store one row per word with every part of speech merged; re-export to split them
+        self._has_senses = 'senses' in tables
+
+    def _query(self, sql, parameters=()):
+        with self._lock:
+            self._reopen_if_replaced()
+            return self._connection.execute(sql, parameters).fetchall()
+
+    @property
+    def wordnet_version(self):
+        rows = self._query("SELECT value FROM metadata WHERE key = 'wordnet_version'")
+        return rows[0][0] if rows else None
+
+    @property
+    def version(self):
+        """Changes whenever the snapshot file is re-exported; lookups then read the new file."""
+        with self._lock:
+            self._reopen_if_replaced()
+            return self._version
+
+    def _senses(self, forms, pos):
+        """Stored (word, parts of speech, definitions, synonyms, antonyms) rows of `forms` as `pos`."""
+        placeholders = ', '.join('?' * len(forms))
+        if self._has_senses:
+            return self._query(
+                f"SELECT word, parts_of_speech, definitions, synonyms, antonyms FROM senses "
+                f"WHERE pos = ? AND word IN ({placeholders})", [pos, *forms])
+        rows = self._query(
+            f"SELECT word, parts_of_speech, definitions, synonyms, antonyms FROM lemmas "
+            f"WHERE word IN ({placeholders})", forms)
+        # Satellites are adjectives
+        return [row for row in rows if pos in {'a' if part == 's' else part for part in json.loads(row[1])}]
+
+    def _rows(self, word):
+        """Stored rows of the base forms of `word`, per part of speech in morphy order."""
+        key = snapshot_key(word)
+        exceptions = {}
+        if self._has_exceptions:
+            for pos, base in self._query("SELECT pos, base FROM exceptions WHERE word = ?", (key,)):
+                exceptions.setdefault(pos, []).append(base)
+
+        rows = []
+        for pos in PARTS_OF_SPEECH:
+            found = {}
+
+            def stored_forms(forms):
+                found.update((row[0], row) for row in self._senses(list(dict.fromkeys(forms)), pos))
+                return found.keys()
+
+            rows.extend(found[form] for form in morphy(key, pos, exceptions.get(pos), stored_forms))
+        return rows
+
+    def lookup(self, word):
+        """Return the stored entry for `word` or its base forms, or None if WordNet has neither."""
+        rows = self._rows(word)
+        if not rows:
+            return None
+        return merge_entries([{
+            'definitions': json.loads(definitions),
+            'parts_of_speech': json.loads(parts_of_speech),
+            'synonyms': json.loads(synonyms),
+            'antonyms': json.loads(antonyms),
+        } for form, parts_of_speech, definitions, synonyms, antonyms in rows])
+
+    def __contains__(self, word):
+        return bool(self._rows(word))
+
+    def words(self):
+        """All lemma names in the snapshot, sorted."""
+        table = 'senses' if self._has_senses else 'lemmas'
+        return [word for word, in self._query(f"SELECT DISTINCT word FROM {table} ORDER BY word")]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._version = None
+
+
+class LiveWordNet:
+    """Fallback with the snapshot interface that queries the NLTK corpus directly.
+
+    Only used when no snapshot has been exported yet.
+    """
+
+    def __init__(self):
+        ensure_nltk_data('wordnet', 'omw-1.4')
+        from nltk.corpus import wordnet as wn
+
+        self._wn = wn
+
+    @property
+    def version(self):
+        return f"live-{self._wn.get_version()}"
+
+    def lookup(self, word):
+        return wordnet_entry(self._wn, word.lower())
+
+    def __contains__(self, word):
+        return bool(self._wn.synsets(word.lower()))
+
+    def words(self):
+        return sorted(set(synset.name().split('.')[0] for synset in self._wn.all_synsets()))
+
+
+@lru_cache(maxsize=None)
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Open the snapshot once per process, falling back to live WordNet if it is missing."""
+    if os.path.exists(path):
+        return WordNetSnapshot(path)
+    print(f"⚠️ WordNet snapshot '{path}' not found; querying WordNet live. "
+          f"Run 'python wordnet_snapshot.py' to export it.")
+    return LiveWordNet()
+
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_PATH
+    print("🔄 Exporting WordNet lemmas...")
+    count = export_snapshot(output_path)
+    print(f"💾 Saved {count} lemmas to {output_path}")